@@ -0,0 +1,57 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+import pandas as pd
+
+from benchmark.batch_kernels.join import join_sweep
+from benchmark.batch_kernels.runner import sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the vectorized comparison, CONTAINS, LIKE and hash "
+        "join kernels of Batch with their previous row-at-a-time implementations."
+    )
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--join-rows",
+        nargs="+",
+        type=int,
+        default=[100_000, 1_000_000],
+        help="number of probe rows of the hash join, the build side has a tenth",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this csv file")
+    parser.add_argument(
+        "--join-output", help="write the hash join results to this csv file"
+    )
+    args = parser.parse_args()
+
+    results = sweep(args.rows, repeat=args.repeat, seed=args.seed)
+    join_results = join_sweep(args.join_rows, repeat=args.repeat, seed=args.seed)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(results.to_string(index=False, float_format="{:.5f}".format))
+        print()
+        print(join_results.to_string(index=False, float_format="{:.5f}".format))
+    if args.output:
+        results.to_csv(args.output, index=False)
+    if args.join_output:
+        join_results.to_csv(args.join_output, index=False)
+
+
+if __name__ == "__main__":
+    main()
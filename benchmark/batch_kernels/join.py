@@ -0,0 +1,115 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from evadb.models.storage.batch import Batch
+
+
+@dataclass
+class JoinBenchmarkResult:
+    num_build_rows: int
+    num_probe_rows: int
+    num_output_rows: int
+    legacy_hash_time: float
+    vectorized_hash_time: float
+    hash_speedup: float
+    join_time: float
+
+
+def legacy_reassign_indices_to_hash(batch: Batch, indices: List[str]) -> None:
+    # implementation before the vectorized `hash_columns`, kept as the baseline
+    batch.frames.index = batch.frames[indices].apply(lambda x: hash(tuple(x)), axis=1)
+
+
+def create_tables(
+    num_build_rows: int, num_probe_rows: int, seed: int = 0
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """A build table of objects and a probe table of frames referencing them
+    through a two-column key (video id, object label)."""
+    rng = np.random.default_rng(seed)
+    num_videos = max(num_build_rows // 8, 1)
+    labels = np.array(["person", "car", "bus", "truck", "dog", "cat", "bird", "boat"])
+    build = pd.DataFrame(
+        {
+            "video_id": np.arange(num_build_rows) // len(labels),
+            "label": labels[np.arange(num_build_rows) % len(labels)],
+            "score": rng.random(num_build_rows),
+        }
+    )
+    probe = pd.DataFrame(
+        {
+            "vid": rng.integers(0, num_videos, num_probe_rows),
+            "object": rng.choice(labels, num_probe_rows).astype(object),
+            "frame_id": np.arange(num_probe_rows),
+        }
+    )
+    return build, probe
+
+
+def _hash_both(hash_fn, build: pd.DataFrame, probe: pd.DataFrame):
+    build_batch, probe_batch = Batch(build.copy()), Batch(probe.copy())
+    start = time.perf_counter()
+    hash_fn(build_batch, ["video_id", "label"])
+    hash_fn(probe_batch, ["vid", "object"])
+    return time.perf_counter() - start, build_batch, probe_batch
+
+
+def run_join_benchmark(
+    num_build_rows: int, num_probe_rows: int, repeat: int = 3, seed: int = 0
+) -> JoinBenchmarkResult:
+    """Time the key hashing of both sides of a hash join, with the legacy
+    row-wise apply and with `Batch.reassign_indices_to_hash`, then the join
+    itself. Both hashings must produce the same join."""
+    build, probe = create_tables(num_build_rows, num_probe_rows, seed)
+
+    legacy_time = vectorized_time = join_time = float("inf")
+    for _ in range(repeat):
+        elapsed, build_batch, probe_batch = _hash_both(
+            legacy_reassign_indices_to_hash, build, probe
+        )
+        legacy_time = min(legacy_time, elapsed)
+        expected = len(Batch.join(probe_batch, build_batch))
+
+        elapsed, build_batch, probe_batch = _hash_both(
+            Batch.reassign_indices_to_hash, build, probe
+        )
+        vectorized_time = min(vectorized_time, elapsed)
+        start = time.perf_counter()
+        output = Batch.join(probe_batch, build_batch)
+        join_time = min(join_time, time.perf_counter() - start)
+        assert len(output) == expected, "the hashings produced different joins"
+
+    return JoinBenchmarkResult(
+        num_build_rows=num_build_rows,
+        num_probe_rows=num_probe_rows,
+        num_output_rows=len(output),
+        legacy_hash_time=legacy_time,
+        vectorized_hash_time=vectorized_time,
+        hash_speedup=legacy_time / vectorized_time,
+        join_time=join_time,
+    )
+
+
+def join_sweep(row_counts: List[int], repeat: int = 3, seed: int = 0) -> pd.DataFrame:
+    results = [
+        run_join_benchmark(num_rows // 10, num_rows, repeat=repeat, seed=seed)
+        for num_rows in row_counts
+    ]
+    return pd.DataFrame([asdict(result) for result in results])
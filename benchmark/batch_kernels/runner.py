@@ -0,0 +1,144 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import operator
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from evadb.models.storage.batch import Batch
+
+LABELS = ["person", "car", "bus", "truck", "dog", "cat", "bicycle", "bird"]
+
+
+@dataclass
+class BenchmarkResult:
+    operator: str
+    num_rows: int
+    legacy_time: float
+    vectorized_time: float
+    speedup: float
+
+
+# Implementations of the operators before the vectorized kernels, kept as the
+# baseline of the benchmark.
+def legacy_compare(batch1: Batch, batch2: Batch, op: Callable) -> Batch:
+    return Batch(pd.DataFrame(op(batch1.to_numpy(), batch2.to_numpy())))
+
+
+def legacy_contains(batch1: Batch, batch2: Batch) -> Batch:
+    return Batch(
+        pd.DataFrame(
+            [all(x in p for x in q) for p, q in zip(left, right)]
+            for left, right in zip(batch1.to_numpy(), batch2.to_numpy())
+        )
+    )
+
+
+def legacy_like(batch1: Batch, batch2: Batch) -> Batch:
+    col = batch1.frames.iloc[:, 0]
+    regex = batch2.frames.iloc[:, 0][0]
+    return Batch(pd.DataFrame(col.astype("str").str.match(pat=regex)))
+
+
+def create_operands(num_rows: int, seed: int = 0) -> Dict[str, Tuple[Batch, Batch]]:
+    """Operands of each benchmarked operator, the right side is a constant
+    repeated on every row as `ConstantValueExpression` produces."""
+    rng = random.Random(seed)
+    ids = np.arange(num_rows)
+    labels = [rng.sample(LABELS, rng.randint(0, 5)) for _ in range(num_rows)]
+    names = [f"video_{rng.randint(0, 10**6)}.mp4" for _ in range(num_rows)]
+
+    def constant(value):
+        return Batch(pd.DataFrame({0: [value] * num_rows}))
+
+    return {
+        "id > constant": (Batch(pd.DataFrame({"id": ids})), constant(num_rows // 2)),
+        "name = constant": (Batch(pd.DataFrame({"name": names})), constant(names[0])),
+        "labels @> constant": (
+            Batch(pd.DataFrame({"labels": labels})),
+            constant(["person", "car"]),
+        ),
+        "labels <@ constant": (
+            Batch(pd.DataFrame({"labels": labels})),
+            constant(["person", "car", "dog"]),
+        ),
+        "name LIKE regex": (
+            Batch(pd.DataFrame({"name": names})),
+            constant(r"video_1\d*\.mp4"),
+        ),
+    }
+
+
+KERNELS = {
+    "id > constant": (
+        lambda b1, b2: legacy_compare(b1, b2, operator.gt),
+        Batch.from_greater,
+    ),
+    "name = constant": (
+        lambda b1, b2: legacy_compare(b1, b2, operator.eq),
+        Batch.from_eq,
+    ),
+    "labels @> constant": (legacy_contains, Batch.compare_contains),
+    "labels <@ constant": (
+        lambda b1, b2: legacy_contains(b2, b1),
+        Batch.compare_is_contained,
+    ),
+    "name LIKE regex": (legacy_like, Batch.compare_like),
+}
+
+
+def _time(func: Callable, *args, repeat: int) -> Tuple[float, Batch]:
+    best, output = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+
+def run_benchmark(
+    num_rows: int, repeat: int = 5, seed: int = 0
+) -> List[BenchmarkResult]:
+    """Time the legacy and the vectorized implementation of every operator on
+    `num_rows` rows, and check that they return the same outcomes."""
+    results = []
+    for name, (left, right) in create_operands(num_rows, seed).items():
+        legacy, vectorized = KERNELS[name]
+        legacy_time, expected = _time(legacy, left, right, repeat=repeat)
+        vectorized_time, actual = _time(vectorized, left, right, repeat=repeat)
+        assert (
+            expected.frames.iloc[:, 0].tolist() == actual.frames.iloc[:, 0].tolist()
+        ), f"{name} returned different outcomes"
+        results.append(
+            BenchmarkResult(
+                operator=name,
+                num_rows=num_rows,
+                legacy_time=legacy_time,
+                vectorized_time=vectorized_time,
+                speedup=legacy_time / vectorized_time,
+            )
+        )
+    return results
+
+
+def sweep(row_counts: List[int], repeat: int = 5, seed: int = 0) -> pd.DataFrame:
+    results = []
+    for num_rows in row_counts:
+        results.extend(run_benchmark(num_rows, repeat=repeat, seed=seed))
+    return pd.DataFrame([asdict(result) for result in results])
@@ -0,0 +1,77 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+import pandas as pd
+
+from benchmark.semantic_cache.runner import sweep
+from benchmark.semantic_cache.workload import DEFAULT_WORKLOAD, load_workload
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a question workload through the semantic cache in front "
+        "of a deterministic stub LLM."
+    )
+    parser.add_argument("--workload", default=str(DEFAULT_WORKLOAD))
+    parser.add_argument("--question-column", default="question")
+    parser.add_argument("--answer-column", default="answer")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--embeddings",
+        nargs="+",
+        default=["HASHING"],
+        help="PROVIDER or PROVIDER:model, e.g. HASHING, OPENAI, "
+        "HUGGINGFACE:sentence-transformers/all-mpnet-base-v2",
+    )
+    parser.add_argument(
+        "--score-thresholds",
+        nargs="+",
+        type=float,
+        default=[0.0, 0.01, 0.05, 0.1, 0.2],
+    )
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--llm-jitter", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--output", help="write the results to this csv file")
+    args = parser.parse_args()
+
+    workload = load_workload(
+        args.workload,
+        question_column=args.question_column,
+        answer_column=args.answer_column,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    results = sweep(
+        workload,
+        args.embeddings,
+        args.score_thresholds,
+        llm_latency=args.llm_latency,
+        llm_jitter=args.llm_jitter,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        max_concurrency=args.max_concurrency,
+    )
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(results.to_string(index=False, float_format="{:.4f}".format))
+    if args.output:
+        results.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
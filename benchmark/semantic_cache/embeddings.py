@@ -0,0 +1,54 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import re
+from typing import Callable, List
+
+import numpy as np
+
+HASHING_DIMENSIONS = 512
+
+
+def hashing_embedding(texts: List[str]) -> np.ndarray:
+    """Deterministic bag of words and character trigram embedding used to run the
+    benchmark without downloading a model."""
+    embeddings = np.zeros((len(texts), HASHING_DIMENSIONS), dtype="float32")
+    for row, text in enumerate(texts):
+        words = re.findall(r"\w+", text.lower())
+        features = words + [
+            word[i : i + 3] for word in words for i in range(max(1, len(word) - 2))
+        ]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode(), digest_size=4).digest()
+            embeddings[row, int.from_bytes(digest, "little") % HASHING_DIMENSIONS] += 1
+    return embeddings
+
+
+def get_embedding(
+    provider: str, model: str = None
+) -> Callable[[List[str]], np.ndarray]:
+    """Return a function embedding a list of texts into a 2D array.
+
+    `HASHING` runs offline. `HUGGINGFACE` and `OPENAI` build the same langchain
+    embeddings as the ChatGPT functions.
+    """
+    if provider == "HASHING":
+        return hashing_embedding
+
+    from evadb.functions.chatgpt_langchain import construct_embedding
+
+    args = [provider] if model is None else [provider, model]
+    embedding = construct_embedding(*args)
+    return lambda texts: np.array(embedding.embed_documents(texts))
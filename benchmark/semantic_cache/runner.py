@@ -0,0 +1,150 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmark.semantic_cache.embeddings import get_embedding
+from benchmark.semantic_cache.stub_llm import StubLLM
+from evadb.utils.request_executor import ConcurrentRequestExecutor
+from evadb.utils.semantic_cache import SemanticCache
+
+
+@dataclass
+class BenchmarkResult:
+    embedding: str
+    score_threshold: float
+    num_questions: int
+    duration: float
+    throughput: float
+    p50_latency: float
+    p99_latency: float
+    hit_rate: float
+    semantic_hit_rate: float
+    false_positive_rate: float
+    accuracy: float
+    llm_calls: int
+
+
+def run_benchmark(
+    workload: pd.DataFrame,
+    embed: Callable[[List[str]], np.ndarray],
+    llm: StubLLM,
+    score_threshold: float = 0.05,
+    batch_size: int = 16,
+    max_concurrency: int = 8,
+    embedding_name: str = "",
+) -> BenchmarkResult:
+    """Replay the workload through a cold `SemanticCache` in front of the `llm`.
+
+    The questions are processed in batches like the ChatGPT functions do: all the
+    questions of a batch are looked up at once, then the misses are completed
+    concurrently and added to the cache. The latency of a question is its share of
+    the batch lookup time plus, on a miss, the time of its completion.
+    """
+    executor = ConcurrentRequestExecutor(max_concurrency=max_concurrency, max_retries=0)
+
+    def timed_completion(question: str) -> Tuple[str, float]:
+        start = time.perf_counter()
+        answer = llm.complete(question)
+        return answer, time.perf_counter() - start
+
+    latencies = []
+    correct = 0
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SemanticCache(cache_dir, embed=embed, score_threshold=score_threshold)
+        start = time.perf_counter()
+        for offset in range(0, len(workload), batch_size):
+            batch = workload.iloc[offset : offset + batch_size]
+            lookup_start = time.perf_counter()
+            responses = cache.lookup_many(
+                list(batch["question"]), expected=list(batch["answer"])
+            )
+            # the batch is embedded and looked up at once, its time is shared
+            lookup_time = (time.perf_counter() - lookup_start) / len(batch)
+            latencies.extend([lookup_time] * len(batch))
+            misses = [idx for idx, response in enumerate(responses) if response is None]
+
+            questions = [batch["question"].iloc[idx] for idx in misses]
+            completions = executor.map(timed_completion, questions)
+            for idx, (response, elapsed) in zip(misses, completions):
+                latencies[offset + idx] += elapsed
+                responses[idx] = response
+            if misses:
+                cache.update_many(
+                    questions,
+                    [response for response, _ in completions],
+                    tokens=[len(question.split()) for question in questions],
+                )
+
+            correct += sum(
+                response == answer
+                for response, answer in zip(responses, batch["answer"])
+            )
+        duration = time.perf_counter() - start
+        stats = cache.stats
+
+    num_questions = len(workload)
+    return BenchmarkResult(
+        embedding=embedding_name,
+        score_threshold=score_threshold,
+        num_questions=num_questions,
+        duration=duration,
+        throughput=num_questions / duration if duration else 0.0,
+        p50_latency=float(np.percentile(latencies, 50)) if latencies else 0.0,
+        p99_latency=float(np.percentile(latencies, 99)) if latencies else 0.0,
+        hit_rate=stats.hit_rate,
+        semantic_hit_rate=stats.semantic_hits / num_questions if num_questions else 0.0,
+        false_positive_rate=stats.false_positive_rate or 0.0,
+        accuracy=correct / num_questions if num_questions else 0.0,
+        llm_calls=len(latencies) - stats.hits,
+    )
+
+
+def sweep(
+    workload: pd.DataFrame,
+    embeddings: List[str],
+    score_thresholds: List[float],
+    llm_latency: float = 0.2,
+    llm_jitter: float = 0.0,
+    seed: int = 0,
+    **kwargs,
+) -> pd.DataFrame:
+    """Run the benchmark for every embedding provider and score threshold.
+
+    `embeddings` are given as `PROVIDER` or `PROVIDER:model`, e.g.
+    `HUGGINGFACE:sentence-transformers/all-mpnet-base-v2`.
+    """
+    answers = dict(zip(workload["question"], workload["answer"]))
+    results = []
+    for embedding_name in embeddings:
+        provider, _, model = embedding_name.partition(":")
+        embed = get_embedding(provider, model or None)
+        for score_threshold in score_thresholds:
+            llm = StubLLM(answers, latency=llm_latency, jitter=llm_jitter, seed=seed)
+            result = run_benchmark(
+                workload,
+                embed,
+                llm,
+                score_threshold=score_threshold,
+                embedding_name=embedding_name,
+                **kwargs,
+            )
+            results.append(asdict(result))
+    return pd.DataFrame(results)
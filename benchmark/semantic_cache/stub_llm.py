@@ -0,0 +1,59 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+import threading
+import time
+from typing import Dict
+
+
+class StubLLM:
+    """Deterministic stand-in for a chat completion API.
+
+    Answers every known question with its reference answer after sleeping for
+    `latency` seconds (plus a uniform `jitter`, drawn from a seeded generator).
+    Unknown questions are answered with `unknown_answer`.
+
+    Args:
+        answers (Dict[str, str]): reference answer of each question
+        latency (float, optional): seconds spent per completion
+        jitter (float, optional): maximum extra seconds added to the latency
+        seed (int, optional): seed of the jitter generator
+    """
+
+    def __init__(
+        self,
+        answers: Dict[str, str],
+        latency: float = 0.2,
+        jitter: float = 0.0,
+        seed: int = 0,
+        unknown_answer: str = "unknown",
+    ):
+        self._answers = dict(answers)
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._unknown_answer = unknown_answer
+        self._lock = threading.Lock()
+        self.num_calls = 0
+        self.num_tokens = 0
+
+    def complete(self, question: str) -> str:
+        with self._lock:
+            delay = self._latency + self._random.uniform(0, self._jitter)
+            self.num_calls += 1
+            self.num_tokens += len(question.split())
+        if delay > 0:
+            time.sleep(delay)
+        return self._answers.get(question, self._unknown_answer)
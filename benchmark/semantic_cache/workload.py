@@ -0,0 +1,43 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_WORKLOAD = Path(__file__).parent / "questions.csv"
+
+
+def load_workload(
+    path: str = DEFAULT_WORKLOAD,
+    question_column: str = "question",
+    answer_column: str = "answer",
+    repeat: int = 1,
+    seed: int = None,
+) -> pd.DataFrame:
+    """Load a question workload with its reference answers.
+
+    The workload is replayed `repeat` times and shuffled with `seed`, if given, so
+    that paraphrases and repeated questions are spread across the batches.
+
+    Returns:
+        pd.DataFrame: `question` and `answer` columns
+    """
+    df = pd.read_csv(path)[[question_column, answer_column]]
+    df.columns = ["question", "answer"]
+    df["answer"] = df["answer"].astype(str).str.strip().str.lower()
+    df = pd.concat([df] * repeat, ignore_index=True)
+    if seed is not None:
+        df = df.sample(frac=1, random_state=seed).reset_index(drop=True)
+    return df
@@ -40,8 +40,15 @@ from evadb.utils.logging_manager import logger
 def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
     # setup the context
     # we read the GPUs from the catalog and populate in the context
-    gpus_ids = binder._catalog().get_configuration_catalog_value("gpu_ids")
-    node._context = Context(gpus_ids)
+    catalog = binder._catalog()
+    gpus_ids = catalog.get_configuration_catalog_value("gpu_ids")
+    node._context = Context(
+        gpus_ids,
+        gpu_batch_size=catalog.get_configuration_catalog_value("gpu_batch_size", 1),
+        adaptive_batch_size=catalog.get_configuration_catalog_value(
+            "adaptive_batch_size", False
+        ),
+    )
 
     # handle the special case of "extract_object"
     if node.name.upper() == str(FunctionType.EXTRACT_OBJECT):
@@ -118,6 +125,8 @@ def bind_func_expr(binder: StatementBinder, node: FunctionExpression):
                     properties["openai_api_key"] = openai_key
 
             node.function = lambda: function_class(**properties)
+            if getattr(function_class, "deduplicated", False) is True:
+                node.enable_deduplication()
         except Exception as e:
             err_msg = (
                 f"{str(e)}. Please verify that the function class name in the "
@@ -15,7 +15,7 @@
 import datetime
 import shutil
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Tuple
 
 from evadb.catalog.catalog_type import (
     ColumnType,
@@ -25,6 +25,7 @@ from evadb.catalog.catalog_type import (
 )
 from evadb.catalog.catalog_utils import (
     construct_function_cache_catalog_entry,
+    generate_function_cache_path,
     get_document_table_column_definitions,
     get_image_table_column_definitions,
     get_pdf_table_column_definitions,
@@ -39,6 +40,7 @@ from evadb.catalog.models.utils import (
     FunctionCostCatalogEntry,
     FunctionIOCatalogEntry,
     FunctionMetadataCatalogEntry,
+    FunctionStatsCatalogEntry,
     IndexCatalogEntry,
     JobCatalogEntry,
     JobHistoryCatalogEntry,
@@ -63,6 +65,9 @@ from evadb.catalog.services.function_io_catalog_service import FunctionIOCatalog
 from evadb.catalog.services.function_metadata_catalog_service import (
     FunctionMetadataCatalogService,
 )
+from evadb.catalog.services.function_stats_catalog_service import (
+    FunctionStatsCatalogService,
+)
 from evadb.catalog.services.index_catalog_service import IndexCatalogService
 from evadb.catalog.services.job_catalog_service import JobCatalogService
 from evadb.catalog.services.job_history_catalog_service import JobHistoryCatalogService
@@ -78,6 +83,7 @@ from evadb.utils.generic_utils import (
     get_file_checksum,
     remove_directory_contents,
 )
+from evadb.utils.kv_cache import drop_memory_tier
 from evadb.utils.logging_manager import logger
 
 
@@ -100,6 +106,9 @@ class CatalogManager(object):
         self._function_cost_catalog_service = FunctionCostCatalogService(
             self._sql_config.session
         )
+        self._function_stats_catalog_service = FunctionStatsCatalogService(
+            self._sql_config.session
+        )
         self._function_io_service = FunctionIOCatalogService(self._sql_config.session)
         self._function_metadata_service = FunctionMetadataCatalogService(
             self._sql_config.session
@@ -542,6 +551,30 @@ class CatalogManager(object):
     def get_function_cost_catalog_entry(self, name: str):
         return self._function_cost_catalog_service.get_entry_by_name(name)
 
+    "function stats catalog services"
+
+    def upsert_function_stats_catalog_entry(
+        self, function_id: int, name: str, counters: Dict[str, float]
+    ):
+        """Accumulates the stats counters of a function.
+
+        Arguments:
+            function_id(int): unique function id
+            name(str): the name of the function
+            counters(Dict[str, float]): increments of the counters, see
+                `FunctionStats.counters`
+        """
+
+        self._function_stats_catalog_service.upsert_entry(function_id, name, counters)
+
+    def get_function_stats_catalog_entry(self, name: str) -> FunctionStatsCatalogEntry:
+        return self._function_stats_catalog_service.get_entry_by_name(name)
+
+    def get_all_function_stats_catalog_entries(
+        self,
+    ) -> List[FunctionStatsCatalogEntry]:
+        return self._function_stats_catalog_service.get_all_entries()
+
     "FunctionIO services"
 
     def get_function_io_catalog_input_entries(
@@ -607,12 +640,43 @@ class CatalogManager(object):
     ) -> FunctionCacheCatalogEntry:
         return self._function_cache_service.get_entry_by_name(name)
 
+    def get_function_cache_catalog_entries_by_function(
+        self, function_obj: FunctionCatalogEntry
+    ) -> List[FunctionCacheCatalogEntry]:
+        return self._function_cache_service.get_entries_by_function_id(
+            function_obj.row_id
+        )
+
+    def insert_function_cache_catalog_entry_with_name(
+        self,
+        name: str,
+        function_obj: FunctionCatalogEntry,
+        args: Tuple[str],
+        function_depends: List[int],
+        col_depends: List[int],
+    ) -> FunctionCacheCatalogEntry:
+        """Insert a cache that is not built from a bound function expression, such as
+        the caches imported from a snapshot. `name` is the signature of the cached
+        function expression."""
+        cache_dir = self.get_configuration_catalog_value("cache_dir")
+        entry = FunctionCacheCatalogEntry(
+            name=name,
+            function_id=function_obj.row_id,
+            cache_path=generate_function_cache_path(cache_dir, name, function_obj.name),
+            args=tuple(args),
+            function_depends=function_depends,
+            col_depends=col_depends,
+        )
+        return self._function_cache_service.insert_entry(entry)
+
     def drop_function_cache_catalog_entry(
         self, entry: FunctionCacheCatalogEntry
     ) -> bool:
         # remove the data structure associated with the entry
         if entry:
-            shutil.rmtree(entry.cache_path)
+            # the cache directory is only created once the cache is first opened
+            shutil.rmtree(entry.cache_path, ignore_errors=True)
+            drop_memory_tier(entry.cache_path)
         return self._function_cache_service.delete_entry(entry)
 
     """ function Metadata Catalog"""
@@ -646,6 +710,7 @@ class CatalogManager(object):
         columns: List[ColumnDefinition],
         identifier_column: str = None,
         table_type: TableType = TableType.STRUCTURED_DATA,
+        file_format: str = None,
     ) -> TableCatalogEntry:
         """Create a valid table catalog tuple and insert into the table
 
@@ -654,6 +719,8 @@ class CatalogManager(object):
             columns (List[ColumnDefinition]): columns definitions of the table
             identifier_column (str, optional): Specify unique columns. Defaults to None.
             table_type (TableType, optional): table type. Defaults to TableType.STRUCTURED_DATA.
+            file_format (str, optional): suffix of the file url, selecting the
+                storage engine of the structured data. Defaults to None.
 
         Returns:
             TableCatalogEntry: entry that has been inserted into the table catalog
@@ -663,6 +730,8 @@ class CatalogManager(object):
 
         dataset_location = self.get_configuration_catalog_value("datasets_dir")
         file_url = str(generate_file_path(dataset_location, table_name))
+        if file_format is not None:
+            file_url = f"{file_url}.{file_format}"
         table_catalog_entry = self.insert_table_catalog_entry(
             table_name,
             file_url,
@@ -32,6 +32,7 @@ from evadb.catalog.models.utils import (
     TableCatalogEntry,
 )
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.constants import FUNCTION_CACHE_PROPERTIES
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.create_statement import ColConstraintInfo, ColumnDefinition
@@ -50,6 +51,14 @@ def is_pdf_table(table: TableCatalogEntry):
     return table.table_type == TableType.PDF_DATA
 
 
+def is_structured_table(table: TableCatalogEntry):
+    return table.table_type == TableType.STRUCTURED_DATA
+
+
+def is_parquet_table(table: TableCatalogEntry):
+    return is_structured_table(table) and str(table.file_url).endswith(".parquet")
+
+
 def is_string_col(col: ColumnCatalogEntry):
     return col.type == ColumnType.TEXT or col.array_type == NdArrayType.STR
 
@@ -217,6 +226,15 @@ def xform_column_definitions_to_catalog_entries(
     return result_list
 
 
+def generate_function_cache_path(
+    cache_dir: str, cache_name: str, function_name: str
+) -> str:
+    """Returns a unique path under `cache_dir` to store the cache `cache_name`"""
+    # add salt to the cache_name so that we generate unique name
+    path = str(get_str_hash(cache_name + uuid.uuid4().hex))
+    return str(Path(cache_dir) / Path(f"{path}_{function_name}"))
+
+
 def construct_function_cache_catalog_entry(
     func_expr: FunctionExpression, cache_dir: str
 ) -> FunctionCacheCatalogEntry:
@@ -238,13 +256,10 @@ def construct_function_cache_catalog_entry(
     for expr in func_expr.find_all(TupleValueExpression):
         col_depends.append(expr.col_object.row_id)
     cache_name = func_expr.signature()
-
-    # add salt to the cache_name so that we generate unique name
-    path = str(get_str_hash(cache_name + uuid.uuid4().hex))
-    cache_path = str(Path(cache_dir) / Path(f"{path}_{func_expr.name}"))
+    cache_path = generate_function_cache_path(cache_dir, cache_name, func_expr.name)
     args = tuple([arg.signature() for arg in func_expr.children])
     entry = FunctionCacheCatalogEntry(
-        name=func_expr.signature(),
+        name=cache_name,
         function_id=func_expr.function_obj.row_id,
         cache_path=cache_path,
         args=args,
@@ -279,7 +294,9 @@ def get_metadata_entry_or_val(
 
 def get_metadata_properties(function_obj: FunctionCatalogEntry) -> Dict:
     """
-    Return all the metadata properties as key value pair
+    Return all the metadata properties as key value pair. Properties that
+    configure the function cache (see `FUNCTION_CACHE_PROPERTIES`) are skipped as
+    they are not arguments of the function.
 
     Args:
         function_obj (FunctionCatalogEntry): An object of type `FunctionCatalogEntry` which is
@@ -289,6 +306,8 @@ def get_metadata_properties(function_obj: FunctionCatalogEntry) -> Dict:
     """
     properties = {}
     for metadata in function_obj.metadata:
+        if metadata.key in FUNCTION_CACHE_PROPERTIES:
+            continue
         properties[metadata.key] = metadata.value
     return properties
 
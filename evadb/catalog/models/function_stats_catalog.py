@@ -0,0 +1,82 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
+
+from evadb.catalog.models.base_model import BaseModel
+from evadb.catalog.models.utils import FunctionStatsCatalogEntry
+
+
+class FunctionStatsCatalog(BaseModel):
+    """The `FunctionStatsCatalog` catalog accumulates the runtime metrics of the functions across queries. It maintains the following information for each function.
+    `_row_id:` an autogenerated unique identifier.
+    `_function_id`: the row_id of the function
+    `_function_name:` name of the function
+    `_num_calls:` number of rows evaluated by the function
+    `_elapsed_time:` total time spent evaluating the function
+    `_cache_misses:` rows missing in the function cache
+    `_cache_evictions:` / `_cache_expirations:` function cache entries removed to
+    stay within the size limit of the cache or after their ttl
+    `_dedup_hits:` rows answered by an earlier row with the same arguments
+    `_semantic_cache_hits:` / `_semantic_cache_misses:` lookups of the semantic cache
+    `_semantic_hits:` hits answered by a similar but different prompt
+    `_labeled_hits:` hits whose expected response was known
+    `_false_positives:` labeled hits returning another response
+    `_tokens_saved:` model tokens saved by the semantic cache hits
+    `_embedding_time:` / `_lookup_time:` / `_model_time:` time spent embedding
+    prompts, searching the semantic cache, and calling the model
+    """
+
+    __tablename__ = "function_stats_catalog"
+
+    _function_id = Column(
+        "function_id",
+        Integer,
+        ForeignKey("function_catalog._row_id", ondelete="CASCADE"),
+    )
+    _function_name = Column(
+        "name", String(128), ForeignKey("function_catalog.name", ondelete="CASCADE")
+    )
+    _num_calls = Column("num_calls", Integer, default=0)
+    _elapsed_time = Column("elapsed_time", Float, default=0.0)
+    _cache_misses = Column("cache_misses", Integer, default=0)
+    _cache_evictions = Column("cache_evictions", Integer, default=0)
+    _cache_expirations = Column("cache_expirations", Integer, default=0)
+    _dedup_hits = Column("dedup_hits", Integer, default=0)
+    _semantic_cache_hits = Column("semantic_cache_hits", Integer, default=0)
+    _semantic_cache_misses = Column("semantic_cache_misses", Integer, default=0)
+    _semantic_hits = Column("semantic_hits", Integer, default=0)
+    _labeled_hits = Column("labeled_hits", Integer, default=0)
+    _false_positives = Column("false_positives", Integer, default=0)
+    _tokens_saved = Column("tokens_saved", Integer, default=0)
+    _embedding_time = Column("embedding_time", Float, default=0.0)
+    _lookup_time = Column("lookup_time", Float, default=0.0)
+    _model_time = Column("model_time", Float, default=0.0)
+
+    def __init__(self, function_id: int, name: str, **counters):
+        self._function_id = function_id
+        self._function_name = name
+        for key in FunctionStatsCatalogEntry.counter_names():
+            setattr(self, f"_{key}", counters.get(key, 0))
+
+    def as_dataclass(self) -> "FunctionStatsCatalogEntry":
+        return FunctionStatsCatalogEntry(
+            function_id=self._function_id,
+            name=self._function_name,
+            row_id=self._row_id,
+            **{
+                key: getattr(self, f"_{key}")
+                for key in FunctionStatsCatalogEntry.counter_names()
+            },
+        )
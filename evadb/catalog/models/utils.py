@@ -15,7 +15,7 @@
 import contextlib
 import datetime
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Tuple
 
 import sqlalchemy
@@ -193,6 +193,61 @@ class FunctionCostCatalogEntry:
         return {"function_id": self.function_id, "name": self.name, "cost": self.cost}
 
 
+@dataclass(unsafe_hash=True)
+class FunctionStatsCatalogEntry:
+    """Dataclass representing an entry in the `FunctionStatsCatalog`."""
+
+    name: str
+    function_id: int = None
+    num_calls: int = 0
+    elapsed_time: float = 0.0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    cache_expirations: int = 0
+    dedup_hits: int = 0
+    semantic_cache_hits: int = 0
+    semantic_cache_misses: int = 0
+    semantic_hits: int = 0
+    labeled_hits: int = 0
+    false_positives: int = 0
+    tokens_saved: int = 0
+    embedding_time: float = 0.0
+    lookup_time: float = 0.0
+    model_time: float = 0.0
+    row_id: int = None
+
+    @classmethod
+    def counter_names(cls) -> List[str]:
+        return [
+            f.name
+            for f in fields(cls)
+            if f.name not in ("name", "function_id", "row_id")
+        ]
+
+    def display_format(self):
+        lookups = self.semantic_cache_hits + self.semantic_cache_misses
+        return {
+            "name": self.name,
+            "num_calls": self.num_calls,
+            "elapsed_time": self.elapsed_time,
+            "cache_misses": self.cache_misses,
+            "cache_evictions": self.cache_evictions,
+            "cache_expirations": self.cache_expirations,
+            "dedup_ratio": self.dedup_hits / self.num_calls if self.num_calls else 0.0,
+            "semantic_cache_hits": self.semantic_cache_hits,
+            "semantic_cache_misses": self.semantic_cache_misses,
+            "hit_rate": self.semantic_cache_hits / lookups if lookups else None,
+            "semantic_hits": self.semantic_hits,
+            "false_positive_rate": (
+                self.false_positives / self.labeled_hits if self.labeled_hits else None
+            ),
+            "tokens_saved": self.tokens_saved,
+            "embedding_time": self.embedding_time,
+            "lookup_time": self.lookup_time,
+            "model_time": self.model_time,
+        }
+
+
 @dataclass(unsafe_hash=True)
 class IndexCatalogEntry:
     """Dataclass representing an entry in the IndexCatalogEntry."""
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
+
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.expression import select
@@ -81,6 +83,19 @@ class FunctionCacheCatalogService(BaseService):
         except NoResultFound:
             return None
 
+    def get_entries_by_function_id(
+        self, function_id: int
+    ) -> List[FunctionCacheCatalogEntry]:
+        """Get all the caches built on the outputs of the function"""
+        entries = (
+            self.session.execute(
+                select(self.model).filter(self.model._function_id == function_id)
+            )
+            .scalars()
+            .all()
+        )
+        return [entry.as_dataclass() for entry in entries]
+
     def delete_entry(self, cache: FunctionCacheCatalogEntry):
         """Delete cache table from the db
         Arguments:
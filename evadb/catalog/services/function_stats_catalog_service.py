@@ -0,0 +1,77 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import select
+
+from evadb.catalog.models.function_stats_catalog import (
+    FunctionStatsCatalog,
+    FunctionStatsCatalogEntry,
+)
+from evadb.catalog.services.base_service import BaseService
+from evadb.utils.errors import CatalogError
+
+
+class FunctionStatsCatalogService(BaseService):
+    def __init__(self, db_session: Session):
+        super().__init__(FunctionStatsCatalog, db_session)
+
+    def upsert_entry(self, function_id: int, name: str, counters: Dict[str, float]):
+        """Adds the counters to the stats entry of the function, creating it if
+        required
+
+        Arguments:
+            function_id(int): id of the function
+            name (str) : name of the function
+            counters (Dict[str, float]): increments of the stats counters
+        """
+        try:
+            function_obj = self.session.execute(
+                select(self.model).filter(self.model._function_id == function_id)
+            ).scalar_one_or_none()
+            if function_obj:
+                function_obj.update(
+                    self.session,
+                    **{
+                        f"_{key}": (getattr(function_obj, f"_{key}") or 0) + value
+                        for key, value in counters.items()
+                    },
+                )
+            else:
+                self.model(function_id, name, **counters).save(self.session)
+        except Exception as e:
+            raise CatalogError(
+                f"Error while upserting entry to FunctionStatsCatalog: {str(e)}"
+            )
+
+    def get_entry_by_name(self, name: str) -> FunctionStatsCatalogEntry:
+        """return the function stats entry that matches the name provided.
+           None if no such entry found.
+
+        Arguments:
+            name (str): name to be searched
+        """
+        try:
+            function_obj = self.session.execute(
+                select(self.model).filter(self.model._function_name == name)
+            ).scalar_one_or_none()
+            if function_obj:
+                return function_obj.as_dataclass()
+            return None
+        except Exception as e:
+            raise CatalogError(
+                f"Error while getting entry for function {name} from FunctionStatsCatalog: {str(e)}"
+            )
@@ -37,6 +37,7 @@ CATALOG_TABLES = [
     "index_catalog",
     "functionio_catalog",
     "function_cost_catalog",
+    "function_stats_catalog",
     "function_metadata_catalog",
     "job_catalog",
     "job_history_catalog",
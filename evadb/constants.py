@@ -18,6 +18,19 @@ NO_GPU = -1
 UNDEFINED_GROUP_ID = -1
 # remove this when we implement the cacheable logic in the function itself
 CACHEABLE_FUNCTIONS = ["Yolo", "FaceDetector", "OCRExtractor", "HFObjectDetector"]
+# bytes of results a deduplicated function expression keeps during a query
+DEDUPLICATION_MEMORY_SIZE = 16777216
+# function metadata consumed by the function cache instead of the function itself
+FUNCTION_CACHE_MEMORY_SIZE = "cache_memory_size"
+FUNCTION_CACHE_MAX_SIZE = "cache_max_size"
+FUNCTION_CACHE_TTL = "cache_ttl"
+FUNCTION_CACHE_FROM = "cache_from"
+FUNCTION_CACHE_PROPERTIES = [
+    FUNCTION_CACHE_MEMORY_SIZE,
+    FUNCTION_CACHE_MAX_SIZE,
+    FUNCTION_CACHE_TTL,
+    FUNCTION_CACHE_FROM,
+]
 IFRAMES = "IFRAMES"
 AUDIORATE = "AUDIORATE"
 DEFAULT_FUNCTION_EXPRESSION_COST = 100
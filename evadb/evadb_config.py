@@ -33,8 +33,21 @@ BASE_EVADB_CONFIG = {
     "application": "evadb",
     "mode": "release",
     "batch_mem_size": 30000000,
+    "adaptive_batch_size": False,  # resize the scanned batches to the throughput
+    "max_batch_mem_size": 268435456,  # largest adaptive batch
+    "batch_backend": "pandas",  # "arrow" keeps the scanned batches in Arrow tables
+    "structured_data_format": "sqlite",  # "parquet" stores new tables in Parquet
+    # NDARRAY values: "pickle", "raw", "zstd" or "lz4", or a dict of them keyed
+    # by "table.column" for the columns that differ from "raw"
+    "ndarray_serialization": "raw",
+    # bytes buffered by ORDER BY, hash join builds and GROUP BY. Queries
+    # exceeding it abort with an error, nothing is spilled. 0 = no limit
+    "query_memory_limit": 0,
     "gpu_batch_size": 1,  # batch size used for gpu_operations
     "gpu_ids": [0],
+    "function_cache_memory_size": 67108864,  # in-memory tier of function caches
+    "function_cache_max_size": 1073741824,  # disk size of each function cache
+    "function_cache_ttl": 0,  # seconds before cached results expire, 0 never expires
     "host": "0.0.0.0",
     "port": 8803,
     "socket_timeout": 60,
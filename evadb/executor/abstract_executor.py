@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Any, Generator, Iterable, List, TypeVar
 if TYPE_CHECKING:
     from evadb.catalog.catalog_manager import CatalogManager
 from evadb.database import EvaDBDatabase
+from evadb.executor.executor_utils import QueryMemoryBudget
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.abstract_plan import AbstractPlan
 
@@ -36,6 +37,7 @@ class AbstractExecutor(ABC):
         self._db = db
         self._node = node
         self._children = []
+        self._memory_budget = None
 
     # @lru_cache(maxsize=None)
     def catalog(self) -> "CatalogManager":
@@ -72,6 +74,17 @@ class AbstractExecutor(ABC):
     def db(self) -> EvaDBDatabase:
         return self._db
 
+    @property
+    def memory_budget(self) -> QueryMemoryBudget:
+        """Memory budget of the query, shared by all the executors of the plan"""
+        if self._memory_budget is None:
+            self._memory_budget = QueryMemoryBudget()
+        return self._memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, memory_budget: QueryMemoryBudget):
+        self._memory_budget = memory_budget
+
     @abstractmethod
     def exec(self, *args, **kwargs) -> Iterable[Batch]:
         """
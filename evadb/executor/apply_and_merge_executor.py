@@ -37,19 +37,25 @@ class ApplyAndMergeExecutor(AbstractExecutor):
         self.func_expr = node.func_expr
         self.do_unnest = node.do_unnest
         self.alias = node.alias
+        self.columns = node.columns
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
         child_executor = self.children[0]
         for batch in child_executor.exec(**kwargs):
             func_result = self.func_expr.evaluate(batch)
 
+            # drop the input columns not needed above before merging them
+            if self.columns is not None and set(self.columns).issubset(batch.columns):
+                batch = batch.project(self.columns)
             output = Batch.merge_column_wise([batch, func_result])
             if self.do_unnest:
-                output.unnest(func_result.columns)
-                # we reset the index as after unnest there can be duplicate index
-                output.reset_index()
-
-            yield output
+                # the unnested rows are emitted in batches no larger than the
+                # input batch
+                yield from output.iter_unnest(
+                    func_result.columns, max_rows=max(1, len(batch))
+                )
+            else:
+                yield output
 
         # persist stats of function expression
         instrument_function_expression_cost(self.func_expr, self.catalog())
@@ -49,8 +49,13 @@ class CreateExecutor(AbstractExecutor):
         logger.debug(f"Creating table {self.node.table_info}")
 
         if not is_native_table:
+            file_format = self.catalog().get_configuration_catalog_value(
+                "structured_data_format", "sqlite"
+            )
             catalog_entry = self.catalog().create_and_insert_table_catalog_entry(
-                self.node.table_info, self.node.column_list
+                self.node.table_info,
+                self.node.column_list,
+                file_format=None if file_format == "sqlite" else file_format,
             )
         else:
             catalog_entry = create_table_catalog_entry_for_native_table(
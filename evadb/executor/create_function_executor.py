@@ -25,7 +25,10 @@ from typing import Dict, List
 import numpy as np
 import pandas as pd
 
-from evadb.catalog.catalog_utils import get_metadata_properties
+from evadb.catalog.catalog_utils import (
+    get_metadata_entry_or_val,
+    get_metadata_properties,
+)
 from evadb.catalog.models.function_catalog import FunctionCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
@@ -37,6 +40,7 @@ from evadb.configuration.constants import (
     SKLEARN_SUPPORTED_MODELS,
     EvaDB_INSTALLATION_DIR,
 )
+from evadb.constants import FUNCTION_CACHE_FROM
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
 from evadb.functions.decorators.utils import load_io_from_function_decorators
@@ -44,6 +48,7 @@ from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.create_function_plan import CreateFunctionPlan
 from evadb.third_party.huggingface.create import gen_hf_io_catalog_entries
 from evadb.utils.errors import FunctionIODefinitionError
+from evadb.utils.function_cache_snapshot import import_function_cache
 from evadb.utils.generic_utils import (
     load_function_class_from_file,
     string_comparison_case_insensitive,
@@ -55,6 +60,7 @@ from evadb.utils.generic_utils import (
     try_to_import_ultralytics,
 )
 from evadb.utils.logging_manager import logger
+from evadb.utils.semantic_cache import default_semantic_cache_path, uses_semantic_cache
 
 
 def root_mean_squared_error(y_true, y_pred):
@@ -699,7 +705,9 @@ class CreateFunctionExecutor(AbstractExecutor):
         Generic functions are loaded from a file. We check for inputs passed by the user during CREATE or try to load io from decorators.
         """
         impl_path = self.node.impl_path.absolute().as_posix()
-        function = self._try_initializing_function(impl_path)
+        function = self._try_initializing_function(
+            impl_path, function_args=self._semantic_cache_args(impl_path)
+        )
         io_list = self._resolve_function_io(function)
 
         return (
@@ -710,6 +718,31 @@ class CreateFunctionExecutor(AbstractExecutor):
             self.node.metadata,
         )
 
+    def _semantic_cache_args(self, impl_path: str) -> Dict:
+        """Records the semantic cache path of a function backed by a SemanticCache
+        in its metadata, so that DROP FUNCTION removes exactly that cache. A path
+        given by the user in the metadata is kept."""
+        try:
+            function_class = load_function_class_from_file(impl_path, self.node.name)
+        except Exception:
+            # reported by _try_initializing_function
+            return {}
+        if not uses_semantic_cache(function_class):
+            return {}
+
+        semantic_cache_path = get_metadata_entry_or_val(
+            self.node, "semantic_cache_path"
+        )
+        if semantic_cache_path is None:
+            cache_dir = self.catalog().get_configuration_catalog_value("cache_dir")
+            semantic_cache_path = str(
+                default_semantic_cache_path(cache_dir, self.node.name)
+            )
+            self.node.metadata.append(
+                FunctionMetadataCatalogEntry("semantic_cache_path", semantic_cache_path)
+            )
+        return {"semantic_cache_path": semantic_cache_path}
+
     def exec(self, *args, **kwargs):
         """Create function executor
 
@@ -818,6 +851,19 @@ class CreateFunctionExecutor(AbstractExecutor):
             msg = f"Function {self.node.name} overwritten."
         else:
             msg = f"Function {self.node.name} added to the database."
+
+        # warm up the caches of the function with the snapshot given by CACHE FROM
+        function_obj = self.catalog().get_function_catalog_entry_by_name(name)
+        snapshot_path = None
+        if function_obj:
+            snapshot_path = get_metadata_entry_or_val(function_obj, FUNCTION_CACHE_FROM)
+        if snapshot_path is not None:
+            counts = import_function_cache(self.catalog(), function_obj, snapshot_path)
+            msg += (
+                f" Loaded {counts['function_cache_entries']} function cache and"
+                f" {counts['semantic_cache_entries']} semantic cache entries from"
+                f" {snapshot_path}."
+            )
         if best_score and train_time:
             yield Batch(
                 pd.DataFrame(
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 
+import shutil
+
 import pandas as pd
 
 from evadb.database import EvaDBDatabase
@@ -25,6 +27,7 @@ from evadb.plan_nodes.drop_object_plan import DropObjectPlan
 from evadb.storage.storage_engine import StorageEngine
 from evadb.third_party.vector_stores.utils import VectorStoreFactory
 from evadb.utils.logging_manager import logger
+from evadb.utils.semantic_cache import get_semantic_cache_path
 
 
 class DropObjectExecutor(AbstractExecutor):
@@ -97,6 +100,13 @@ class DropObjectExecutor(AbstractExecutor):
             for cache in function_entry.dep_caches:
                 self.catalog().drop_function_cache_catalog_entry(cache)
 
+            # the semantic cache recorded in the metadata of the function is not a
+            # function cache, drop it as well so that a re-created function does
+            # not return stale responses
+            semantic_cache_path = get_semantic_cache_path(function_entry)
+            if semantic_cache_path is not None:
+                shutil.rmtree(semantic_cache_path, ignore_errors=True)
+
             # todo also delete the indexes associated with the table
 
             self.catalog().delete_function_catalog_entry_by_name(function_name)
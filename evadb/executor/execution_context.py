@@ -27,9 +27,16 @@ class Context:
     if using horovod: current rank etc.
     """
 
-    def __init__(self, user_provided_gpu_conf=[]):
+    def __init__(
+        self,
+        user_provided_gpu_conf=[],
+        gpu_batch_size: int = 1,
+        adaptive_batch_size: bool = False,
+    ):
         self._user_provided_gpu_conf = user_provided_gpu_conf
         self._gpus = self._populate_gpu_ids()
+        self.gpu_batch_size = gpu_batch_size
+        self.adaptive_batch_size = adaptive_batch_size
 
     @property
     def gpus(self):
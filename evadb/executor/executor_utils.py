@@ -39,6 +39,75 @@ class ExecutorError(Exception):
     pass
 
 
+class QueryMemoryBudget:
+    """Bytes of the batches buffered by the blocking operators of a query
+    (ORDER BY, hash join build, GROUP BY).
+
+    The operators reserve the batches they buffer through a `reservation`, which
+    releases them once the operator is done. The limit does not bound the memory
+    of these operators: nothing is spilled to disk, so a reservation exceeding
+    the limit aborts the query with an `ExecutorError` instead of exhausting the
+    memory of the process.
+
+    Arguments:
+        limit (int): maximum number of bytes, 0 disables the accounting
+    """
+
+    def __init__(self, limit: int = 0):
+        self.limit = int(limit or 0)
+        self.used = 0
+        self.peak = 0
+
+    def reservation(self, operator: str) -> "MemoryReservation":
+        return MemoryReservation(self, operator)
+
+
+class MemoryReservation:
+    """Bytes reserved by one operator, released when leaving the `with` block
+
+    Arguments:
+        budget (QueryMemoryBudget): budget of the query
+        operator (str): name of the operator, reported when the limit is exceeded
+    """
+
+    def __init__(self, budget: QueryMemoryBudget, operator: str):
+        self._budget = budget
+        self._operator = operator
+        self.nbytes = 0
+
+    def reserve(self, batch: Batch) -> None:
+        """Reserve the bytes of `batch`
+
+        Raises:
+            ExecutorError: if the query exceeds its memory limit
+        """
+        budget = self._budget
+        if not budget.limit:
+            return
+        nbytes = batch.nbytes
+        if budget.used + nbytes > budget.limit:
+            raise ExecutorError(
+                f"{self._operator} exceeded the query memory limit: "
+                f"{budget.used + nbytes} bytes needed, query_memory_limit is "
+                f"{budget.limit} bytes. Raise it with SET query_memory_limit = "
+                "<bytes>, or disable it with 0."
+            )
+        budget.used += nbytes
+        budget.peak = max(budget.peak, budget.used)
+        self.nbytes += nbytes
+
+    def release(self) -> None:
+        """Release all the bytes reserved so far"""
+        self._budget.used -= self.nbytes
+        self.nbytes = 0
+
+    def __enter__(self) -> "MemoryReservation":
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
 def instrument_function_expression_cost(
     expr: Union[AbstractExpression, List[AbstractExpression]],
     catalog: "CatalogManager",
@@ -62,6 +131,11 @@ def instrument_function_expression_cost(
                     func_expr.function_obj.name,
                     func_expr._stats.prev_cost,
                 )
+                catalog.upsert_function_stats_catalog_entry(
+                    function_id,
+                    func_expr.function_obj.name,
+                    func_expr.stats_delta(),
+                )
 
 
 def apply_project(batch: Batch, project_list: List[AbstractExpression]):
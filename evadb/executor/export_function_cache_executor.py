@@ -0,0 +1,45 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+
+from evadb.database import EvaDBDatabase
+from evadb.executor.abstract_executor import AbstractExecutor
+from evadb.executor.executor_utils import ExecutorError
+from evadb.models.storage.batch import Batch
+from evadb.parser.export_statement import ExportFunctionCacheStatement
+from evadb.utils.function_cache_snapshot import export_function_cache
+
+
+class ExportFunctionCacheExecutor(AbstractExecutor):
+    def __init__(self, db: EvaDBDatabase, node: ExportFunctionCacheStatement):
+        super().__init__(db, node)
+
+    def exec(self, *args, **kwargs):
+        function_obj = self.catalog().get_function_catalog_entry_by_name(
+            self.node.function_name
+        )
+        if function_obj is None:
+            raise ExecutorError(f"Function {self.node.function_name} does not exist.")
+
+        counts = export_function_cache(self.catalog(), function_obj, self.node.path)
+        yield Batch(
+            pd.DataFrame(
+                [
+                    f"Exported {counts['function_cache_entries']} function cache and"
+                    f" {counts['semantic_cache_entries']} semantic cache entries of"
+                    f" {self.node.function_name} to {self.node.path}."
+                ]
+            )
+        )
@@ -44,9 +44,11 @@ class FunctionScanExecutor(AbstractExecutor):
 
             if not res.empty():
                 if self.do_unnest:
-                    res.unnest(res.columns)
-
-                yield res
+                    yield from res.iter_unnest(
+                        res.columns, max_rows=max(1, len(lateral_input))
+                    )
+                else:
+                    yield res
 
             # persist stats of function expression
             instrument_function_expression_cost(self.func_expr, self.catalog())
@@ -42,11 +42,15 @@ class GroupByExecutor(AbstractExecutor):
         child_executor = self.children[0]
 
         buffer = Batch(pd.DataFrame())
-        for batch in child_executor.exec(**kwargs):
-            new_batch = buffer + batch
-            # We assume that all the segments exactly of segment_length size
-            # and discard any dangling frames in the end.
-            while len(new_batch) >= self._segment_length:
-                yield new_batch[: self._segment_length]
-                new_batch = new_batch[self._segment_length :]
-            buffer = new_batch
+        with self.memory_budget.reservation("GROUP BY") as reservation:
+            for batch in child_executor.exec(**kwargs):
+                new_batch = buffer + batch
+                # a segment is buffered until it is complete
+                reservation.release()
+                reservation.reserve(new_batch)
+                # We assume that all the segments exactly of segment_length size
+                # and discard any dangling frames in the end.
+                while len(new_batch) >= self._segment_length:
+                    yield new_batch[: self._segment_length]
+                    new_batch = new_batch[self._segment_length :]
+                buffer = new_batch
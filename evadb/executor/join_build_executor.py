@@ -32,8 +32,14 @@ class BuildJoinExecutor(AbstractExecutor):
         # build in memory hash table and pass to the probe phase
         # Assumption the hash table fits in memory
         # Todo: Implement a partition based hash join (grace hash join)
-        cumm_batches = [batch for batch in child_executor.exec() if not batch.empty()]
-        cumm_batches = Batch.concat(cumm_batches)
-        hash_keys = [key.col_alias for key in self.build_keys]
-        cumm_batches.reassign_indices_to_hash(hash_keys)
-        yield cumm_batches
+        with self.memory_budget.reservation("hash join build") as reservation:
+            cumm_batches = []
+            for batch in child_executor.exec():
+                if not batch.empty():
+                    reservation.reserve(batch)
+                    cumm_batches.append(batch)
+            cumm_batches = Batch.concat(cumm_batches)
+            hash_keys = [key.col_alias for key in self.build_keys]
+            cumm_batches.reassign_indices_to_hash(hash_keys)
+            # the hash table is held until the probe side is done
+            yield cumm_batches
@@ -36,15 +36,21 @@ class LimitExecutor(AbstractExecutor):
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
         child_executor = self.children[0]
         remaining_tuples = self._limit_count
-        # aggregates the batches into one large batch
-        for batch in child_executor.exec(**kwargs):
-            if len(batch) > remaining_tuples:
-                yield batch[:remaining_tuples]
-                return
-
-            remaining_tuples -= len(batch)
-            yield batch
-
-            if remaining_tuples <= 0:
-                assert remaining_tuples == 0
-                return
+        # close the child scan once the limit is reached so that storage
+        # engines release their cursors without reading the rest of the table
+        child_batches = child_executor.exec(**kwargs)
+        try:
+            for batch in child_batches:
+                if len(batch) > remaining_tuples:
+                    yield batch[:remaining_tuples]
+                    return
+
+                remaining_tuples -= len(batch)
+                yield batch
+
+                if remaining_tuples <= 0:
+                    assert remaining_tuples == 0
+                    return
+        finally:
+            if hasattr(child_batches, "close"):
+                child_batches.close()
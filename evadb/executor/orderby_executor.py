@@ -16,7 +16,7 @@ from typing import Iterator
 
 from evadb.database import EvaDBDatabase
 from evadb.executor.abstract_executor import AbstractExecutor
-from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.executor_utils import ExecutorError, MemoryReservation
 from evadb.expression.function_expression import FunctionExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
@@ -72,11 +72,16 @@ class OrderByExecutor(AbstractExecutor):
         return sort_type_bools
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        with self.memory_budget.reservation("ORDER BY") as reservation:
+            yield from self._sort(reservation, **kwargs)
+
+    def _sort(self, reservation: MemoryReservation, **kwargs) -> Iterator[Batch]:
         child_executor = self.children[0]
         aggregated_batch_list = []
 
         # aggregates the batches into one large batch
         for batch in child_executor.exec(**kwargs):
+            reservation.reserve(batch)
             self.batch_sizes.append(len(batch))
             aggregated_batch_list.append(batch)
         aggregated_batch = Batch.concat(aggregated_batch_list, copy=False)
@@ -25,8 +25,11 @@ from evadb.executor.create_job_executor import CreateJobExecutor
 from evadb.executor.delete_executor import DeleteExecutor
 from evadb.executor.drop_object_executor import DropObjectExecutor
 from evadb.executor.exchange_executor import ExchangeExecutor
-from evadb.executor.executor_utils import ExecutorError
+from evadb.executor.executor_utils import ExecutorError, QueryMemoryBudget
 from evadb.executor.explain_executor import ExplainExecutor
+from evadb.executor.export_function_cache_executor import (
+    ExportFunctionCacheExecutor,
+)
 from evadb.executor.function_scan_executor import FunctionScanExecutor
 from evadb.executor.groupby_executor import GroupByExecutor
 from evadb.executor.hash_join_executor import HashJoinExecutor
@@ -50,6 +53,7 @@ from evadb.executor.use_executor import UseExecutor
 from evadb.executor.vector_index_scan_executor import VectorIndexScanExecutor
 from evadb.models.storage.batch import Batch
 from evadb.parser.create_statement import CreateDatabaseStatement, CreateJobStatement
+from evadb.parser.export_statement import ExportFunctionCacheStatement
 from evadb.parser.set_statement import SetStatement
 from evadb.parser.statement import AbstractStatement
 from evadb.parser.use_statement import UseStatement
@@ -71,6 +75,7 @@ class PlanExecutor:
     def __init__(self, evadb: EvaDBDatabase, plan: AbstractPlan):
         self._db = evadb
         self._plan = plan
+        self._memory_budget = QueryMemoryBudget()
 
     def _build_execution_tree(
         self, plan: Union[AbstractPlan, AbstractStatement]
@@ -96,6 +101,8 @@ class PlanExecutor:
             return SetExecutor(db=self._db, node=plan)
         elif isinstance(plan, CreateJobStatement):
             return CreateJobExecutor(db=self._db, node=plan)
+        elif isinstance(plan, ExportFunctionCacheStatement):
+            return ExportFunctionCacheExecutor(db=self._db, node=plan)
 
         # Get plan node type
         plan_opr_type = plan.opr_type
@@ -157,6 +164,8 @@ class PlanExecutor:
         elif plan_opr_type == PlanOprType.DELETE:
             executor_node = DeleteExecutor(db=self._db, node=plan)
 
+        executor_node.memory_budget = self._memory_budget
+
         # EXPLAIN does not need to build execution tree for its children
         if plan_opr_type != PlanOprType.EXPLAIN:
             # Build Executor Tree for children
@@ -172,10 +181,19 @@ class PlanExecutor:
     ) -> Iterator[Batch]:
         """execute the plan tree"""
         try:
+            self._memory_budget.limit = int(
+                self._db.catalog().get_configuration_catalog_value(
+                    "query_memory_limit", 0
+                )
+                or 0
+            )
             execution_tree = self._build_execution_tree(self._plan)
             output = execution_tree.exec()
             if output is not None:
-                yield from output
+                for batch in output:
+                    # the dictionary-encoded columns are internal to the plan
+                    batch.dictionary_decode()
+                    yield batch
         except Exception as e:
             if do_not_raise_exceptions is False:
                 if do_not_print_exceptions is False:
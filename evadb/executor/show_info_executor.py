@@ -34,6 +34,7 @@ class ShowInfoExecutor(AbstractExecutor):
             or ShowType.TABLES
             or ShowType.DATABASES
             or ShowType.CONFIGS
+            or ShowType.FUNCTION_STATS
         ), f"Show command does not support type {self.node.show_type}"
 
         if self.node.show_type is ShowType.FUNCTIONS:
@@ -50,6 +51,10 @@ class ShowInfoExecutor(AbstractExecutor):
             databases = self.catalog().get_all_database_catalog_entries()
             for db in databases:
                 show_entries.append(db.display_format())
+        elif self.node.show_type is ShowType.FUNCTION_STATS:
+            stats = self.catalog().get_all_function_stats_catalog_entries()
+            for entry in stats:
+                show_entries.append(entry.display_format())
         elif self.node.show_type is ShowType.CONFIGS:
             show_entries = {}
             # CONFIGS is a special word, which is used to display all the configurations
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
 from typing import Iterator
 
 from evadb.catalog.catalog_type import TableType
@@ -21,7 +22,9 @@ from evadb.executor.executor_utils import ExecutorError
 from evadb.models.storage.batch import Batch
 from evadb.plan_nodes.storage_plan import StoragePlan
 from evadb.storage.storage_engine import StorageEngine
+from evadb.utils.generic_utils import try_to_import_pyarrow
 from evadb.utils.logging_manager import logger
+from evadb.utils.stats import AdaptiveBatchSizer
 
 
 class StorageExecutor(AbstractExecutor):
@@ -29,13 +32,62 @@ class StorageExecutor(AbstractExecutor):
         super().__init__(db, node)
 
     def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        batch_sizer = self._batch_sizer()
+        batches = self._read(batch_sizer or self.node.batch_mem_size)
+        if batch_sizer is not None:
+            batches = self._adapt_batch_size(batches, batch_sizer)
+        batch_backend = self.catalog().get_configuration_catalog_value(
+            "batch_backend", "pandas"
+        )
+        if batch_backend == "arrow":
+            # downstream projections and filters share the Arrow buffers
+            try_to_import_pyarrow()
+            from evadb.models.storage.arrow_batch import ArrowBatch
+
+            batches = map(ArrowBatch.from_batch, batches)
+        return batches
+
+    def _batch_sizer(self) -> AdaptiveBatchSizer:
+        """Controller of the batch size, if adaptive batch sizing is enabled.
+
+        The batches start at `batch_mem_size` bytes and are resized between
+        1/16th of it and `max_batch_mem_size`, or the query memory limit if it is
+        lower."""
+        catalog = self.catalog()
+        if not catalog.get_configuration_catalog_value("adaptive_batch_size", False):
+            return None
+        initial = self.node.batch_mem_size
+        maximum = int(
+            catalog.get_configuration_catalog_value("max_batch_mem_size", initial)
+        )
+        memory_limit = int(
+            catalog.get_configuration_catalog_value("query_memory_limit", 0) or 0
+        )
+        if memory_limit:
+            maximum = min(maximum, memory_limit)
+        minimum = min(max(1, initial // 16), maximum)
+        return AdaptiveBatchSizer(initial, minimum, maximum)
+
+    def _adapt_batch_size(
+        self, batches: Iterator[Batch], batch_sizer: AdaptiveBatchSizer
+    ) -> Iterator[Batch]:
+        # A batch is done once the downstream operators ask for the next one, the
+        # elapsed time covers reading it and running the rest of the plan on it
+        start = time.perf_counter()
+        for batch in batches:
+            yield batch
+            end = time.perf_counter()
+            batch_sizer.observe(len(batch), end - start)
+            start = end
+
+    def _read(self, batch_mem_size) -> Iterator[Batch]:
         try:
             storage_engine = StorageEngine.factory(self.db, self.node.table)
 
             if self.node.table.table_type == TableType.VIDEO_DATA:
                 return storage_engine.read(
                     self.node.table,
-                    self.node.batch_mem_size,
+                    batch_mem_size,
                     predicate=self.node.predicate,
                     sampling_rate=self.node.sampling_rate,
                     sampling_type=self.node.sampling_type,
@@ -47,7 +99,12 @@ class StorageExecutor(AbstractExecutor):
             elif self.node.table.table_type == TableType.DOCUMENT_DATA:
                 return storage_engine.read(self.node.table, self.node.chunk_params)
             elif self.node.table.table_type == TableType.STRUCTURED_DATA:
-                return storage_engine.read(self.node.table, self.node.batch_mem_size)
+                return storage_engine.read(
+                    self.node.table,
+                    batch_mem_size,
+                    columns=self.node.columns,
+                    predicate=self.node.predicate,
+                )
             elif self.node.table.table_type == TableType.NATIVE_DATA:
                 return storage_engine.read(self.node.table)
             elif self.node.table.table_type == TableType.PDF_DATA:
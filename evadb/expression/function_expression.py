@@ -13,22 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
-from typing import Callable, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
 from evadb.catalog.models.function_catalog import FunctionCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
-from evadb.constants import NO_GPU
+from evadb.constants import DEDUPLICATION_MEMORY_SIZE, NO_GPU
 from evadb.executor.execution_context import Context
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
 from evadb.functions.gpu_compatible import GPUCompatible
 from evadb.models.storage.batch import Batch
 from evadb.parser.alias import Alias
-from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.kv_cache import DiskKVCache, LRUMemoryCache, build_cache_keys
 from evadb.utils.logging_manager import logger
-from evadb.utils.stats import FunctionStats
+from evadb.utils.stats import FunctionStats, SemanticCacheStats
 
 
 class FunctionExpression(AbstractExpression):
@@ -71,6 +71,10 @@ class FunctionExpression(AbstractExpression):
         self.projection_columns: List[str] = []
         self._cache: FunctionExpressionCache = None
         self._stats = FunctionStats()
+        self._persisted_stats: Dict[str, float] = {}
+        # results of the function keyed by the hash of its arguments, shared by
+        # all the batches of the query if the function is deduplicated
+        self._dedup_results: LRUMemoryCache = None
 
     @property
     def name(self):
@@ -103,23 +107,46 @@ class FunctionExpression(AbstractExpression):
     def has_cache(self):
         return self._cache is not None
 
+    def enable_deduplication(self):
+        if self._dedup_results is None:
+            self._dedup_results = LRUMemoryCache(DEDUPLICATION_MEMORY_SIZE)
+        return self
+
+    def is_deduplicated(self):
+        return self._dedup_results is not None
+
     def consolidate_stats(self):
         if self.function_obj is None:
             return
 
         # if the function expression support cache only approximate using cache_miss entries.
+        # rows answered by deduplication did not invoke the function either.
+        num_func_calls = self._stats.num_calls - self._stats.dedup_hits
         if self.has_cache() and self._stats.cache_misses > 0:
-            cost_per_func_call = (
-                self._stats.timer.total_elapsed_time / self._stats.cache_misses
-            )
-        else:
-            cost_per_func_call = self._stats.timer.total_elapsed_time / (
-                self._stats.num_calls
-            )
+            num_func_calls = self._stats.cache_misses - self._stats.dedup_hits
+        cost_per_func_call = self._stats.timer.total_elapsed_time / max(
+            num_func_calls, 1
+        )
 
         if abs(self._stats.prev_cost - cost_per_func_call) > cost_per_func_call / 10:
             self._stats.prev_cost = cost_per_func_call
 
+    def stats_delta(self) -> Dict[str, float]:
+        """Return the stats accumulated since the previous call. Functions with a
+        semantic cache expose its metrics through `semantic_cache_stats`."""
+        semantic_cache_stats = getattr(
+            self._function_instance, "semantic_cache_stats", None
+        )
+        if not isinstance(semantic_cache_stats, SemanticCacheStats):
+            semantic_cache_stats = None
+        counters = self._stats.counters(semantic_cache_stats)
+        delta = {
+            key: value - self._persisted_stats.get(key, 0)
+            for key, value in counters.items()
+        }
+        self._persisted_stats = counters
+        return delta
+
     def evaluate(self, batch: Batch, **kwargs) -> Batch:
         func = self._gpu_enabled_function()
         # record the time taken for the function execution
@@ -165,6 +192,14 @@ class FunctionExpression(AbstractExpression):
         if self._function_instance is None:
             self._function_instance = self.function()
             if isinstance(self._function_instance, GPUCompatible):
+                if hasattr(self._function_instance, "gpu_batch_size"):
+                    # see PytorchAbstractClassifierFunction
+                    self._function_instance.gpu_batch_size = (
+                        self._context.gpu_batch_size
+                    )
+                    self._function_instance.adaptive_batch_size = (
+                        self._context.adaptive_batch_size
+                    )
                 device = self._context.gpu_device()
                 if device != NO_GPU:
                     self._function_instance = self._function_instance.to_device(device)
@@ -172,65 +207,109 @@ class FunctionExpression(AbstractExpression):
 
     def _apply_function_expression(self, func: Callable, batch: Batch, **kwargs):
         """
-        If cache is not enabled, call the func on the batch and return.
-        If cache is enabled:
-        (1) iterate over the input batch rows and check if we have the value in the
-        cache;
-        (2) for all cache miss rows, call the func;
-        (3) iterate over each cache miss row and store the results in the cache;
+        If neither cache nor deduplication is enabled, call the func on the batch
+        and return. Otherwise:
+        (1) hash the cache key columns of the whole batch and probe the cache in
+        bulk;
+        (2) for all cache miss rows, call the func, once per distinct key if the
+        function is deduplicated;
+        (3) store the results of the cache miss rows in bulk;
         (4) stitch back the partial cache results with the new func calls.
         """
         func_args = Batch.merge_column_wise(
             [child.evaluate(batch, **kwargs) for child in self.children]
         )
 
-        if not self._cache:
+        deduplicate = self.is_deduplicated() and self.function_obj is not None
+        if not self._cache and not deduplicate:
             return func_args.apply_function_expression(func)
 
         output_cols = [obj.name for obj in self.function_obj.outputs]
 
         # 1. check cache
-        # We are required to iterate over the batch row by row and check the cache.
-        # This can hurt performance, as we have to stitch together columns to generate
-        # row tuples. Is there an alternative approach we can take?
-
         results = np.full([len(batch), len(output_cols)], None)
         cache_keys = func_args
         # cache keys can be different from func_args
         # see optimize_cache_key
-        if self._cache.key:
+        if self._cache and self._cache.key:
             cache_keys = Batch.merge_column_wise(
                 [child.evaluate(batch, **kwargs) for child in self._cache.key]
             )
             assert len(cache_keys) == len(batch), "Not all rows have the cache key"
 
+        keys = build_cache_keys(cache_keys.frames)
         cache_miss = np.full(len(batch), True)
-        for idx, (_, key) in enumerate(cache_keys.iterrows()):
-            val = self._cache.store.get(key.to_numpy())
-            results[idx] = val
-            cache_miss[idx] = val is None
+        if self._cache:
+            for idx, val in enumerate(self._cache.store.get_many(keys)):
+                if val is not None:
+                    results[idx] = val
+                    cache_miss[idx] = False
 
-        # log the cache misses
-        self._stats.cache_misses += sum(cache_miss)
+            # log the cache misses
+            self._stats.cache_misses += sum(cache_miss)
 
         # 2. call func for cache miss rows
         if cache_miss.any():
+            missing_keys = [key for key, miss in zip(keys, cache_miss) if miss]
             func_args = func_args[list(cache_miss)]
-            cache_miss_results = func_args.apply_function_expression(func)
+            if deduplicate:
+                cache_miss_values = self._apply_deduplicated(
+                    func, func_args, missing_keys, len(output_cols)
+                )
+            else:
+                cache_miss_results = func_args.apply_function_expression(func)
+                cache_miss_values = cache_miss_results.to_numpy()
 
             # 3. set the cache results
-            missing_keys = cache_keys[list(cache_miss)]
-            for key, value in zip(
-                missing_keys.iterrows(), cache_miss_results.iterrows()
-            ):
-                self._cache.store.set(key[1].to_numpy(), value[1].to_numpy())
+            if self._cache:
+                disk_stats = self._cache.store.disk_stats
+                num_evictions = disk_stats.evictions
+                num_expirations = disk_stats.expirations
+                self._cache.store.set_many(missing_keys, list(cache_miss_values))
+                # the entries removed to bound the cache, see DiskKVCache._cull
+                self._stats.cache_evictions += disk_stats.evictions - num_evictions
+                self._stats.cache_expirations += (
+                    disk_stats.expirations - num_expirations
+                )
 
             # 4. merge the cache results
-            results[cache_miss] = cache_miss_results.to_numpy()
+            results[cache_miss] = cache_miss_values
 
         # 5. return the correct batch
         return Batch(pd.DataFrame(results, columns=output_cols))
 
+    def _apply_deduplicated(
+        self, func: Callable, func_args: Batch, keys: List[bytes], num_cols: int
+    ) -> np.ndarray:
+        """Call the func once per key not seen earlier in the query and scatter the
+        results back to all the rows with the same key. The results of the earlier
+        batches are kept up to `DEDUPLICATION_MEMORY_SIZE` bytes, the least
+        recently used ones being evicted first."""
+        results = {}
+        first_row = {}
+        for idx, key in enumerate(keys):
+            if key in results or key in first_row:
+                continue
+            value = self._dedup_results.get(key)
+            if value is None:
+                first_row[key] = idx
+            else:
+                results[key] = value
+
+        if first_row:
+            unique_args = func_args[list(first_row.values())]
+            unique_values = unique_args.apply_function_expression(func).to_numpy()
+            for key, value in zip(first_row.keys(), unique_values):
+                results[key] = value
+                self._dedup_results.set(key, value)
+
+        self._stats.dedup_hits += len(keys) - len(first_row)
+
+        values = np.full([len(keys), num_cols], None)
+        for idx, key in enumerate(keys):
+            values[idx] = results[key]
+        return values
+
     def __str__(self) -> str:
         args = [str(child) for child in self.children]
         expr_str = f"{self.name}({','.join(args)})"
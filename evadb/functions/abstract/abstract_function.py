@@ -29,6 +29,9 @@ class AbstractFunction(metaclass=ABCMeta):
 
     """
 
+    # evaluate the function once per distinct set of arguments within a query
+    deduplicated = False
+
     def __init__(self, *args, **kwargs):
         self.setup(*args, **kwargs)
 
@@ -22,11 +22,13 @@ from evadb.functions.abstract.abstract_function import (
     AbstractTransformationFunction,
 )
 from evadb.functions.gpu_compatible import GPUCompatible
+from evadb.models.storage.batch import stack_tensor_cells
 from evadb.utils.generic_utils import (
     try_to_import_pillow,
     try_to_import_torch,
     try_to_import_torchvision,
 )
+from evadb.utils.stats import AdaptiveBatchSizer, Timer
 
 try_to_import_pillow()
 try_to_import_torch()
@@ -43,8 +45,18 @@ class PytorchAbstractClassifierFunction(
     """
     A pytorch based classifier. Used to make sure we make maximum
     utilization of features provided by pytorch without reinventing the wheel.
+
+    The frames are passed to `forward` in chunks of `gpu_batch_size` frames. With
+    `adaptive_batch_size`, the chunks start at `gpu_batch_size` frames and their
+    size adapts to the observed throughput of the model, up to
+    `gpu_batch_mem_size` bytes of input. Both settings are set from the
+    configuration when the function is bound to a query.
     """
 
+    gpu_batch_size = 1
+    adaptive_batch_size = False
+    gpu_batch_mem_size = 268435456
+
     def __init__(self, *args, **kwargs):
         self.transforms = [transforms.ToTensor()]
         nn.Module.__init__(self, *args, **kwargs)
@@ -57,6 +69,40 @@ class PytorchAbstractClassifierFunction(
         composed = Compose(self.transforms)
         return composed(Image.fromarray(images)).unsqueeze(0)
 
+    def transform_tensor(self, frames: np.ndarray):
+        """
+        Vectorized version of the default `transform` for a contiguous
+        (N, H, W, C) uint8 array of frames. The array is shared with torch and
+        converted on the device of the model.
+
+        Arguments:
+            frames (np.ndarray): frames stacked in a single array
+
+        Returns:
+            Tensor: (N, C, H, W) float tensor with values in [0, 1]
+        """
+        import torch
+
+        tensor = torch.from_numpy(frames).to(self.get_device())
+        return tensor.permute(0, 3, 1, 2).float().div(255)
+
+    def _uses_default_transform(self) -> bool:
+        # `transform_tensor` only replaces the default ToTensor transform
+        return (
+            type(self).transform is PytorchAbstractClassifierFunction.transform
+            and len(self.transforms) == 1
+            and isinstance(self.transforms[0], transforms.ToTensor)
+        )
+
+    def _can_transform_tensor(self, frames: np.ndarray) -> bool:
+        # ToTensor only scales uint8 HWC images
+        return (
+            frames is not None
+            and frames.dtype == np.uint8
+            and frames.ndim == 4
+            and frames.shape[-1] in (1, 3, 4)
+        )
+
     def __call__(self, *args, **kwargs) -> pd.DataFrame:
         """
         This method transforms the list of frames by
@@ -70,25 +116,56 @@ class PytorchAbstractClassifierFunction(
         """
 
         frames = args[0]
+        tensor = None
         if isinstance(frames, pd.DataFrame):
+            if self._uses_default_transform():
+                tensor = stack_tensor_cells(frames.iloc[:, 0].to_numpy())
             frames = frames.transpose().values.tolist()[0]
 
-        # hardcoding it for now, need to be fixed @xzdandy
-        gpu_batch_size = 1
         import torch
 
-        tens_batch = torch.cat([self.transform(x) for x in frames]).to(
-            self.get_device()
-        )
-
-        if gpu_batch_size:
-            chunks = torch.split(tens_batch, gpu_batch_size)
-            outcome = pd.DataFrame()
-            for tensor in chunks:
-                outcome = pd.concat([outcome, self.forward(tensor)], ignore_index=True)
-            return outcome
+        if self._can_transform_tensor(tensor):
+            tens_batch = self.transform_tensor(tensor)
         else:
-            return self.forward(frames)
+            tens_batch = torch.cat([self.transform(x) for x in frames]).to(
+                self.get_device()
+            )
+
+        if not len(tens_batch):
+            return pd.DataFrame()
+
+        if not self.adaptive_batch_size:
+            gpu_batch_size = int(self.gpu_batch_size or len(tens_batch))
+            outcomes = [
+                self.forward(chunk) for chunk in torch.split(tens_batch, gpu_batch_size)
+            ]
+            return pd.concat(outcomes, ignore_index=True)
+
+        gpu_batch_sizer = self._gpu_batch_sizer(tens_batch)
+        outcomes = []
+        start = 0
+        while start < len(tens_batch):
+            chunk = tens_batch[start : start + gpu_batch_sizer.size]
+            timer = Timer()
+            with timer:
+                outcomes.append(self.forward(chunk))
+            gpu_batch_sizer.observe(len(chunk), timer.total_elapsed_time)
+            start += len(chunk)
+        return pd.concat(outcomes, ignore_index=True)
+
+    def _gpu_batch_sizer(self, tens_batch) -> AdaptiveBatchSizer:
+        # kept across calls, so that the chunk size converges over the batches
+        max_rows = max(
+            1,
+            self.gpu_batch_mem_size
+            // max(1, tens_batch[0].element_size() * tens_batch[0].nelement()),
+        )
+        sizer = getattr(self, "_gpu_batch_sizer_state", None)
+        if sizer is None or sizer.maximum != max_rows:
+            initial = int(self.gpu_batch_size or 1)
+            sizer = AdaptiveBatchSizer(initial, 1, max_rows)
+            self._gpu_batch_sizer_state = sizer
+        return sizer
 
     def as_numpy(self, val) -> np.ndarray:
         """
@@ -17,13 +17,13 @@
 import os
 
 import pandas as pd
-from retry import retry
 
 from evadb.catalog.catalog_type import NdArrayType
 from evadb.functions.abstract.abstract_function import AbstractFunction
 from evadb.functions.decorators.decorators import forward, setup
 from evadb.functions.decorators.io_descriptors.data_types import PandasDataframe
 from evadb.utils.generic_utils import try_to_import_openai
+from evadb.utils.request_executor import ConcurrentRequestExecutor
 
 _VALID_CHAT_COMPLETION_MODEL = [
     "gpt-4",
@@ -40,6 +40,9 @@ class ChatGPT(AbstractFunction):
     Arguments:
         model (str) : ID of the OpenAI model to use. Refer to '_VALID_CHAT_COMPLETION_MODEL' for a list of supported models.
         temperature (float) : Sampling temperature to use in the model. Higher value results in a more random output.
+        max_concurrency (int) : Maximum number of completion requests issued in parallel.
+        requests_per_minute (float) : Rate limit of the completion requests. 0 disables rate limiting.
+        openai_base_url (str) : Optional endpoint of an OpenAI compatible server.
 
     Input Signatures:
         query (str)   : The task / question that the user wants the model to accomplish / respond.
@@ -75,6 +78,8 @@ class ChatGPT(AbstractFunction):
         Both of the above cases would generate a summary for each row / video transcript of the table in the response.
     """
 
+    deduplicated = True
+
     @property
     def name(self) -> str:
         return "ChatGPT"
@@ -85,11 +90,18 @@ class ChatGPT(AbstractFunction):
         model="gpt-3.5-turbo",
         temperature: float = 0,
         openai_api_key="",
+        max_concurrency: int = 8,
+        requests_per_minute: float = 0,
+        openai_base_url: str = "",
     ) -> None:
         assert model in _VALID_CHAT_COMPLETION_MODEL, f"Unsupported ChatGPT {model}"
         self.model = model
         self.temperature = temperature
         self.openai_api_key = openai_api_key
+        self.openai_base_url = openai_base_url
+        self.executor = ConcurrentRequestExecutor(
+            max_concurrency=max_concurrency, requests_per_minute=requests_per_minute
+        )
 
     @forward(
         input_signatures=[
@@ -124,11 +136,14 @@ class ChatGPT(AbstractFunction):
             len(api_key) != 0
         ), "Please set your OpenAI API key using SET OPENAI_API_KEY = 'sk-' or environment variable (OPENAI_API_KEY)"
 
-        client = OpenAI(api_key=api_key)
+        # retries are handled by the executor so that rate limits are shared
+        client = OpenAI(
+            api_key=api_key, base_url=self.openai_base_url or None, max_retries=0
+        )
 
-        @retry(tries=6, delay=20)
-        def completion_with_backoff(**kwargs):
-            return client.chat.completions.create(**kwargs)
+        def completion(params):
+            response = client.chat.completions.create(**params)
+            return response.choices[0].message.content
 
         queries = text_df[text_df.columns[0]]
         content = text_df[text_df.columns[0]]
@@ -142,7 +157,7 @@ class ChatGPT(AbstractFunction):
 
         # openai api currently supports answers to a single prompt only
         # so this function is designed for that
-        results = []
+        requests = []
 
         for query, content in zip(queries, content):
             params = {
@@ -172,10 +187,10 @@ class ChatGPT(AbstractFunction):
                 ],
             )
 
-            response = completion_with_backoff(**params)
-            answer = response.choices[0].message.content
-            results.append(answer)
+            requests.append(params)
 
+        # the completions are requested concurrently, the results keep the row order
+        results = self.executor.map(completion, requests)
         df = pd.DataFrame({"response": results})
 
         return df
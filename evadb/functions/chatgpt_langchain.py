@@ -14,13 +14,14 @@
 # limitations under the License.
 
 
+import json
 import os
+import tempfile
 
+import numpy as np
 import pandas as pd
 from langchain.globals import set_llm_cache
-from retry import retry
 
-from langchain.cache import RedisSemanticCache
 from langchain_openai import OpenAIEmbeddings
 
 from evadb.catalog.catalog_type import NdArrayType
@@ -28,6 +29,9 @@ from evadb.functions.abstract.abstract_function import AbstractFunction
 from evadb.functions.decorators.decorators import forward, setup
 from evadb.functions.decorators.io_descriptors.data_types import PandasDataframe
 from evadb.utils.generic_utils import try_to_import_openai, try_to_import_langchain_openai
+from evadb.utils.logging_manager import logger
+from evadb.utils.request_executor import ConcurrentRequestExecutor
+from evadb.utils.semantic_cache import SemanticCache
 
 _VALID_CHAT_COMPLETION_MODEL = [
     "gpt-4",
@@ -67,6 +71,8 @@ class ChatGPTUsingLangchain(AbstractFunction):
     Arguments:
         model (str) : ID of the OpenAI model to use. Refer to '_VALID_CHAT_COMPLETION_MODEL' for a list of supported models.
         temperature (float) : Sampling temperature to use in the model. Higher value results in a more random output.
+        max_concurrency (int) : Maximum number of completion requests issued in parallel.
+        requests_per_minute (float) : Rate limit of the completion requests. 0 disables rate limiting.
 
     Input Signatures:
         query (str)   : The task / question that the user wants the model to accomplish / respond.
@@ -102,10 +108,18 @@ class ChatGPTUsingLangchain(AbstractFunction):
         Both of the above cases would generate a summary for each row / video transcript of the table in the response.
     """
 
+    deduplicated = True
+
     @property
     def name(self) -> str:
         return "ChatGPTUsingLangchain"
 
+    @property
+    def semantic_cache_stats(self):
+        if self.semantic_cache is not None:
+            return self.semantic_cache.stats
+        return None
+
     @setup(cacheable=True, function_type="chat-completion", batchable=True)
     def setup(
             self,
@@ -113,27 +127,61 @@ class ChatGPTUsingLangchain(AbstractFunction):
             temperature: float = 0,
             openai_api_key="",
             use_semantic_cache=True,
-            cache_provider="REDIS",
+            cache_provider="EVADB",
             semantic_cache_embedding="OPENAI",
             semantic_cache_model=None,#"sentence-transformers/all-mpnet-base-v2",
             score_threshold=0.05,
-            vector_store_url="redis://localhost:6379"
+            semantic_cache_max_size=2**30,
+            semantic_cache_path=None,
+            semantic_cache_ttl=None,
+            vector_store_url="redis://localhost:6379",
+            max_concurrency=8,
+            requests_per_minute=0,
     ) -> None:
         assert model in _VALID_CHAT_COMPLETION_MODEL, f"Unsupported ChatGPT {model}"
         self.model = model
         self.temperature = temperature
         self.openai_api_key = openai_api_key
+        self.executor = ConcurrentRequestExecutor(
+            max_concurrency=max_concurrency, requests_per_minute=requests_per_minute
+        )
+        self.semantic_cache = None
+        self._semantic_cache_dir = None
 
-        # Redis
         if use_semantic_cache:
-            embedding = construct_embedding(semantic_cache_embedding, semantic_cache_model)
-            semantic_cache = RedisSemanticCache(redis_url=vector_store_url,
-                                                embedding=embedding,
-                                                score_threshold=score_threshold)
-            # semantic_cache.clear()
-            set_llm_cache(
-                semantic_cache
-            )
+            embedding_args = [semantic_cache_embedding]
+            if semantic_cache_model is not None:
+                embedding_args.append(semantic_cache_model)
+            embedding = construct_embedding(*embedding_args)
+            if cache_provider == "EVADB":
+                # embedded cache persisted next to the function caches of the database,
+                # CREATE FUNCTION records its path. The functions built directly
+                # cache in a temporary directory, removed along with the function
+                if semantic_cache_path is None:
+                    self._semantic_cache_dir = tempfile.TemporaryDirectory(
+                        prefix="evadb_semantic_cache_"
+                    )
+                    semantic_cache_path = self._semantic_cache_dir.name
+                # looked up by the function for the whole batch instead of through
+                # langchain, which embeds the prompts one at a time
+                self.semantic_cache = SemanticCache(
+                    str(semantic_cache_path),
+                    embed=lambda texts: np.array(embedding.embed_documents(texts)),
+                    score_threshold=score_threshold,
+                    max_cache_size=semantic_cache_max_size,
+                    ttl=semantic_cache_ttl,
+                )
+            elif cache_provider == "REDIS":
+                from langchain.cache import RedisSemanticCache
+
+                semantic_cache = RedisSemanticCache(redis_url=vector_store_url,
+                                                    embedding=embedding,
+                                                    score_threshold=score_threshold)
+                set_llm_cache(
+                    semantic_cache
+                )
+            else:
+                raise ValueError(f"Unknown semantic cache provider given: {cache_provider}")
 
     @forward(
         input_signatures=[
@@ -170,20 +218,20 @@ class ChatGPTUsingLangchain(AbstractFunction):
         ), "Please set your OpenAI API key using SET OPENAI_API_KEY = 'sk-' or environment variable (OPENAI_API_KEY)"
 
         skip_cache = False
-        if len(text_df.columns) > 2:
+        if len(text_df.columns) > 3:
             skip_cache = text_df.iloc[0, 3]
 
-        if skip_cache:
-            print(f"Skipping cache: {skip_cache}")
-            llm = ChatOpenAI(model=self.model, temperature=self.temperature, api_key=api_key, cache=False)
+        # retries are handled by the executor so that rate limits are shared
+        if skip_cache or self.semantic_cache is not None:
+            # the evadb semantic cache is looked up below, not by langchain
+            llm = ChatOpenAI(model=self.model, temperature=self.temperature, api_key=api_key, cache=False, max_retries=0)
         else:
-            print("Using cache")
-            llm = ChatOpenAI(model=self.model, temperature=self.temperature, api_key=api_key)
-
+            llm = ChatOpenAI(model=self.model, temperature=self.temperature, api_key=api_key, max_retries=0)
 
-        @retry(tries=6, delay=20)
-        def completion_with_backoff(messages):
-            return llm.invoke(messages)
+        def completion(messages):
+            message = llm.invoke(messages)
+            usage = getattr(message, "usage_metadata", None) or {}
+            return message.content, usage.get("total_tokens", 0)
 
         queries = text_df[text_df.columns[0]]
         content = text_df[text_df.columns[0]]
@@ -197,7 +245,7 @@ class ChatGPTUsingLangchain(AbstractFunction):
 
         # openai api currently supports answers to a single prompt only
         # so this function is designed for that
-        results = []
+        requests = []
 
         for query, content in zip(queries, content):
             messages = [
@@ -205,14 +253,34 @@ class ChatGPTUsingLangchain(AbstractFunction):
                  prompt if prompt is not None else "You are a helpful assistant that accomplishes user tasks."),
                 ("user", f"Here is a piece of text: \"{content}\"\n Complete the following task: {query}"),
             ]
-
-            response = completion_with_backoff(messages)
-            answer = response.content
-            results.append(answer)
+            requests.append(messages)
+
+        if self.semantic_cache is None or skip_cache:
+            # the completions are requested concurrently, the results keep the row order
+            results = [answer for answer, _ in self.executor.map(completion, requests)]
+            return pd.DataFrame({"response": results})
+
+        # the prompts of the whole batch are embedded at once, and the embeddings
+        # of the misses are reused to insert their responses
+        cache_namespace = f"{self.model}:{self.temperature}"
+        cache_keys = [json.dumps(messages) for messages in requests]
+        results = self.semantic_cache.lookup_many(cache_keys, namespace=cache_namespace)
+        misses = [idx for idx, answer in enumerate(results) if answer is None]
+
+        stats = self.semantic_cache.stats
+        with stats.model_timer:
+            answers = self.executor.map(completion, [requests[idx] for idx in misses])
+        for idx, (answer, _) in zip(misses, answers):
+            results[idx] = answer
+        if misses:
+            self.semantic_cache.update_many(
+                [cache_keys[idx] for idx in misses],
+                [answer for answer, _ in answers],
+                namespace=cache_namespace,
+                tokens=[tokens for _, tokens in answers],
+            )
+        self.semantic_cache.persist()
+        logger.debug(f"Semantic cache hits: {stats.hits} | misses: {stats.misses}")
 
         df = pd.DataFrame({"response": results})
-        from langchain.globals import get_llm_cache
-        llm_cache = get_llm_cache()
-
-        print (f"Cache hits: {llm_cache.cache_hits} | Cache misses: {llm_cache.cache_misses}")
         return df
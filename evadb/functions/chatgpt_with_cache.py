@@ -14,21 +14,21 @@
 # limitations under the License.
 
 
+import json
 import os
+import tempfile
 
+import numpy as np
 import pandas as pd
-from gptcache.embedding import Onnx
-from gptcache.manager import get_data_manager, CacheBase, VectorBase
-from gptcache.similarity_evaluation import SearchDistanceEvaluation
-from retry import retry
-from gptcache.adapter.openai import cache_openai_chat_complete
-from gptcache import cache
 
 from evadb.catalog.catalog_type import NdArrayType
 from evadb.functions.abstract.abstract_function import AbstractFunction
+from evadb.functions.chatgpt_langchain import construct_embedding
 from evadb.functions.decorators.decorators import forward, setup
 from evadb.functions.decorators.io_descriptors.data_types import PandasDataframe
 from evadb.utils.generic_utils import try_to_import_openai
+from evadb.utils.request_executor import ConcurrentRequestExecutor
+from evadb.utils.semantic_cache import SemanticCache
 
 _VALID_CHAT_COMPLETION_MODEL = [
     "gpt-4",
@@ -80,31 +80,56 @@ class ChatGPTWithCache(AbstractFunction):
         Both of the above cases would generate a summary for each row / video transcript of the table in the response.
     """
 
+    deduplicated = True
+
     @property
     def name(self) -> str:
         return "ChatGPTWithCache"
 
+    @property
+    def semantic_cache_stats(self):
+        return self.semantic_cache.stats
+
     @setup(cacheable=False, function_type="chat-completion", batchable=True)
     def setup(
         self,
         model="gpt-3.5-turbo",
         temperature: float = 0,
         openai_api_key="",
+        semantic_cache_embedding="HUGGINGFACE",
+        semantic_cache_model="sentence-transformers/all-mpnet-base-v2",
+        score_threshold=0.05,
+        semantic_cache_max_size=2**30,
+        semantic_cache_path=None,
+        semantic_cache_ttl=None,
+        max_concurrency=8,
+        requests_per_minute=0,
     ) -> None:
-        print("Running set up")
         assert model in _VALID_CHAT_COMPLETION_MODEL, f"Unsupported ChatGPTWithCache {model}"
         self.model = model
         self.temperature = temperature
         self.openai_api_key = openai_api_key
 
-        onnx = Onnx()
-        data_manager = get_data_manager(CacheBase("sqlite"), VectorBase("faiss", dimension=onnx.dimension))
-        cache.init(
-            embedding_func=onnx.to_embeddings,
-            data_manager=data_manager,
-            similarity_evaluation=SearchDistanceEvaluation(),
+        embedding = construct_embedding(semantic_cache_embedding, semantic_cache_model)
+        # CREATE FUNCTION records the path in the cache_dir of the database,
+        # the functions built directly cache in a temporary directory, removed
+        # along with the function
+        self._semantic_cache_dir = None
+        if semantic_cache_path is None:
+            self._semantic_cache_dir = tempfile.TemporaryDirectory(
+                prefix="evadb_semantic_cache_"
+            )
+            semantic_cache_path = self._semantic_cache_dir.name
+        self.semantic_cache = SemanticCache(
+            str(semantic_cache_path),
+            embed=lambda texts: np.array(embedding.embed_documents(texts)),
+            score_threshold=score_threshold,
+            max_cache_size=semantic_cache_max_size,
+            ttl=semantic_cache_ttl,
+        )
+        self.executor = ConcurrentRequestExecutor(
+            max_concurrency=max_concurrency, requests_per_minute=requests_per_minute
         )
-        cache.set_openai_key()
 
     @forward(
         input_signatures=[
@@ -141,13 +166,13 @@ class ChatGPTWithCache(AbstractFunction):
             len(api_key) != 0
         ), "Please set your OpenAI API key using SET OPENAI_API_KEY = 'sk-' or environment variable (OPENAI_API_KEY)"
 
-        client = OpenAI(api_key=api_key)
+        client = OpenAI(api_key=api_key, max_retries=0)
         print ("Initialized OpenAI client")
 
-        @retry(tries=6, delay=20)
-        def completion_with_backoff(**kwargs):
-            print(f"Calling completion api with: {kwargs}")
-            return cache_openai_chat_complete(client, **kwargs)
+        def completion(params):
+            response = client.chat.completions.create(**params)
+            tokens = response.usage.total_tokens if response.usage else 0
+            return response.choices[0].message.content, tokens
 
         queries = text_df[text_df.columns[0]]
         content = text_df[text_df.columns[0]]
@@ -161,7 +186,8 @@ class ChatGPTWithCache(AbstractFunction):
 
         # openai api currently supports answers to a single prompt only
         # so this function is designed for that
-        results = []
+        requests = []
+        cache_namespace = f"{self.model}:{self.temperature}"
 
         for query, content in zip(queries, content):
             params = {
@@ -190,13 +216,28 @@ class ChatGPTWithCache(AbstractFunction):
                     },
                 ],
             )
+            requests.append(params)
+
+        # the conversation is the cache key, the model settings its namespace;
+        # the prompts of the whole batch are embedded at once
+        cache_keys = [json.dumps(params["messages"]) for params in requests]
+        results = self.semantic_cache.lookup_many(cache_keys, namespace=cache_namespace)
+        misses = [idx for idx, answer in enumerate(results) if answer is None]
+
+        # request the cache misses concurrently and back-fill the cache
+        with self.semantic_cache.stats.model_timer:
+            answers = self.executor.map(completion, [requests[idx] for idx in misses])
+        for idx, (answer, _) in zip(misses, answers):
+            results[idx] = answer
+        if misses:
+            self.semantic_cache.update_many(
+                [cache_keys[idx] for idx in misses],
+                [answer for answer, _ in answers],
+                namespace=cache_namespace,
+                tokens=[tokens for _, tokens in answers],
+            )
 
-            print ("Calling for prompt")
-            response = completion_with_backoff(**params)
-            print ("Done with prompt")
-            answer = response.choices[0].message.content
-            results.append(answer)
-
+        self.semantic_cache.persist()
         df = pd.DataFrame({"response": results})
 
         return df
@@ -17,7 +17,10 @@ import multiprocessing
 
 import pandas
 
-from evadb.configuration.constants import EvaDB_DATABASE_DIR
+from evadb.configuration.constants import (
+    DEFAULT_MESSAGE_CHUNK_SIZE,
+    EvaDB_DATABASE_DIR,
+)
 from evadb.database import EvaDBDatabase, init_evadb_instance
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.functions.function_bootstrap_queries import init_builtin_functions
@@ -131,11 +134,24 @@ class EvaDBCursor(object):
         prefix = await self._connection._reader.readline()
         if prefix != b"":
             message_length = int(prefix)
-            message = await self._connection._reader.readexactly(message_length)
+            message = await self._read_message(message_length)
             response = Response.deserialize(message)
         self._pending_query = False
         return response
 
+    async def _read_message(self, message_length: int) -> bytearray:
+        # read into a writable buffer that the arrays of the response share
+        message = bytearray(message_length)
+        view = memoryview(message)
+        offset = 0
+        while offset < message_length:
+            chunk = await self._connection._reader.readexactly(
+                min(DEFAULT_MESSAGE_CHUNK_SIZE, message_length - offset)
+            )
+            view[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return message
+
     async def fetch_all_async(self) -> Response:
         """
         fetch_all is the same as fetch_one for now.
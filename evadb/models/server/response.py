@@ -14,7 +14,7 @@
 # limitations under the License.
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from evadb.executor.executor_utils import ExecutorError
 from evadb.models.storage.batch import Batch
@@ -38,7 +38,12 @@ class Response:
     query_time: Optional[float] = None
 
     def serialize(self):
-        return PickleSerializer.serialize(self)
+        return b"".join(Response.serialize_to_buffers(self))
+
+    def serialize_to_buffers(self) -> List[memoryview]:
+        """Serialize the response keeping the buffers of the batch out of band,
+        see `PickleSerializer.serialize_to_buffers`."""
+        return PickleSerializer.serialize_to_buffers(self)
 
     @classmethod
     def deserialize(cls, data):
@@ -0,0 +1,304 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from evadb.models.storage.batch import Batch, stack_tensor_cells, tensor_to_cells
+
+
+class ArrowBatch(Batch):
+    """Batch backed by an Apache Arrow table.
+
+    Projections, slices, filters, column-wise merges and concatenations are
+    performed on the Arrow table and share its buffers instead of copying Python
+    objects. NDARRAY columns whose cells have the same shape and dtype are stored
+    as a single contiguous fixed shape tensor column.
+
+    `frames` returns a pandas view of the table for the code relying on pandas.
+    Since the caller may modify that view in place, the batch is backed by the
+    DataFrame from then on and behaves exactly as a `Batch`.
+
+    Use `ArrowBatch.from_batch` to create one, it falls back to a `Batch` for the
+    frames Arrow cannot represent. This module requires pyarrow, check it with
+    `try_to_import_pyarrow` before importing it.
+
+    Arguments:
+        table (pyarrow.Table): the data of the batch
+    """
+
+    def __init__(self, table):
+        super().__init__()
+        # the frames are converted from the table on first access
+        self._table = table
+        self._pandas = None
+
+    @classmethod
+    def from_batch(cls, batch: Batch) -> Batch:
+        """Convert `batch` to an `ArrowBatch`, or return it as is if its frames
+        cannot be converted (ragged arrays, Python objects, custom index, ...)."""
+        if batch.is_arrow():
+            return batch
+        table = frames_to_table(batch.frames)
+        return batch if table is None else cls(table)
+
+    @property
+    def _frames(self) -> pd.DataFrame:
+        if self._pandas is None:
+            self._pandas = table_to_frames(self._table)
+            self._table = None
+        return self._pandas
+
+    @_frames.setter
+    def _frames(self, frames: pd.DataFrame):
+        self._pandas = frames
+        self._table = None
+
+    @property
+    def table(self):
+        """The Arrow table backing the batch, None once `frames` was accessed."""
+        return self._table
+
+    def is_arrow(self) -> bool:
+        return self._table is not None
+
+    def __len__(self):
+        if self.is_arrow():
+            return self._table.num_rows
+        return len(self._pandas)
+
+    @property
+    def nbytes(self) -> int:
+        if self.is_arrow():
+            return self._table.nbytes
+        return super().nbytes
+
+    @property
+    def columns(self):
+        if self.is_arrow():
+            return list(self._table.column_names)
+        return list(self._pandas.columns)
+
+    def column_as_numpy_array(self, column_name: str) -> np.ndarray:
+        if self.is_arrow():
+            return column_to_numpy(self._table.column(column_name))
+        return super().column_as_numpy_array(column_name)
+
+    def column_arrays(self) -> List[np.ndarray]:
+        if not self.is_arrow():
+            return super().column_arrays()
+        arrays = []
+        for column in self._table.columns:
+            if isinstance(column.type, pa.FixedShapeTensorType):
+                arrays.append(tensor_to_cells(column_to_numpy(column)))
+            elif pa.types.is_dictionary(column.type):
+                # the indices and dictionary are kept as a Categorical
+                arrays.append(column.to_pandas().array)
+            else:
+                arrays.append(column_to_numpy(column))
+        return arrays
+
+    def dictionary_encode(self, cols: List[str] = None, max_ratio: float = 0.5):
+        # the dictionary-encoded columns of the Arrow tables come from the
+        # Categoricals of the batches they are converted from
+        if not self.is_arrow():
+            super().dictionary_encode(cols, max_ratio)
+
+    def dictionary_decode(self) -> None:
+        if not self.is_arrow():
+            return super().dictionary_decode()
+        table = self._table
+        for idx, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(
+                    idx, field.name, table.column(idx).cast(field.type.value_type)
+                )
+        self._table = table
+
+    def column_as_tensor(self, column_name: str) -> Optional[np.ndarray]:
+        if self.is_arrow():
+            column = self._table.column(column_name)
+            if isinstance(column.type, pa.FixedShapeTensorType):
+                return column_to_numpy(column)
+            return None
+        return super().column_as_tensor(column_name)
+
+    def make_tensor_columns_contiguous(self) -> None:
+        # tensor columns of Arrow tables are already contiguous
+        if not self.is_arrow():
+            super().make_tensor_columns_contiguous()
+
+    def to_numpy(self):
+        if self.is_arrow():
+            return self._read_only_frames().to_numpy()
+        return super().to_numpy()
+
+    def __str__(self) -> str:
+        if self.is_arrow():
+            return str(Batch(self._read_only_frames()))
+        return super().__str__()
+
+    def __eq__(self, other: Batch):
+        if not isinstance(other, Batch):
+            return False
+        if self.is_arrow():
+            return Batch(self._read_only_frames()) == other
+        return super().__eq__(other)
+
+    def _get_frames_from_indices(self, required_frame_ids):
+        if self.is_arrow():
+            indices = np.asarray(required_frame_ids, dtype=np.int64)
+            return ArrowBatch(self._table.take(indices))
+        return super()._get_frames_from_indices(required_frame_ids)
+
+    def project(self, cols: None) -> Batch:
+        if not self.is_arrow():
+            return super().project(cols)
+        cols = cols or []
+        unknown_cols = set(cols) - set(self._table.column_names)
+        assert len(unknown_cols) == 0, list(unknown_cols)
+        return ArrowBatch(self._table.select(cols))
+
+    def drop_zero(self, outcomes: Batch) -> None:
+        if not self.is_arrow():
+            return super().drop_zero(outcomes)
+        mask = np.asarray(outcomes.to_numpy() > 0).reshape(len(self), -1)[:, 0]
+        self._table = self._table.filter(pa.array(mask, type=pa.bool_()))
+
+    def reset_index(self):
+        # Arrow tables have no index
+        if not self.is_arrow():
+            super().reset_index()
+
+    def rename(self, columns: Dict[str, str]) -> None:
+        if not self.is_arrow():
+            return super().rename(columns)
+        self._set_column_names([columns.get(c, c) for c in self.columns])
+
+    def _set_column_names(self, names: List[str]) -> None:
+        if not self.is_arrow():
+            return super()._set_column_names(names)
+        self._table = self._table.rename_columns([str(name) for name in names])
+
+    def _read_only_frames(self) -> pd.DataFrame:
+        # pandas view of the table that is not kept, unlike `frames`
+        return table_to_frames(self._table)
+
+    @classmethod
+    def merge_tables_column_wise(cls, batches: List["ArrowBatch"]) -> "ArrowBatch":
+        tables = [batch.table for batch in batches]
+        num_rows = tables[0].num_rows
+        assert all(
+            table.num_rows == num_rows for table in tables
+        ), "Merging of batches with different number of rows"
+        columns, names = [], []
+        for table in tables:
+            columns.extend(table.columns)
+            names.extend(table.column_names)
+        return cls(pa.Table.from_arrays(columns, names=names))
+
+    @classmethod
+    def concat_tables(cls, batches: List["ArrowBatch"]) -> Batch:
+        tables = [batch.table for batch in batches if len(batch)]
+        if not tables:
+            return batches[0]
+        try:
+            return cls(pa.concat_tables(tables))
+        except pa.ArrowInvalid:
+            # mismatching schemas, e.g. tensor columns of different shapes
+            return Batch(
+                pd.concat([table_to_frames(t) for t in tables], ignore_index=True)
+            )
+
+
+def frames_to_table(frames: pd.DataFrame):
+    """Convert the frames of a batch to an Arrow table, or return None if some
+    column cannot be represented by Arrow."""
+    if not isinstance(frames.index, pd.RangeIndex) or frames.index.start != 0:
+        return None
+    if frames.index.step != 1:
+        return None
+    if not all(isinstance(col, str) for col in frames.columns):
+        return None
+    if frames.columns.duplicated().any():
+        return None
+
+    arrays = []
+    for name in frames.columns:
+        array = _series_to_array(frames[name])
+        if array is None:
+            return None
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=list(frames.columns))
+
+
+def table_to_frames(table) -> pd.DataFrame:
+    """Convert an Arrow table to the frames of a batch. Tensor columns become
+    object columns whose cells are views on the contiguous tensor buffer."""
+    return pd.DataFrame(
+        {
+            name: _column_to_series(column)
+            for name, column in zip(table.column_names, table.columns)
+        },
+        columns=table.column_names,
+    )
+
+
+def column_to_numpy(column) -> np.ndarray:
+    if isinstance(column.type, pa.FixedShapeTensorType):
+        # (num_rows, *shape) array sharing the Arrow buffer, combine_chunks
+        # copies even a single chunk
+        if column.num_chunks == 1:
+            return column.chunk(0).to_numpy_ndarray()
+        return column.combine_chunks().to_numpy_ndarray()
+    return column.to_numpy()
+
+
+def _series_to_array(series: pd.Series):
+    values = series.to_numpy()
+    if values.dtype == object and len(values):
+        tensor = stack_tensor_cells(values)
+        if tensor is not None:
+            return pa.FixedShapeTensorArray.from_numpy_ndarray(tensor)
+        if any(isinstance(value, (np.ndarray, list, dict)) for value in values):
+            return None
+    try:
+        array = pa.Array.from_pandas(series)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    if values.dtype == object and not _is_object_type(array.type):
+        # e.g. [1, None] would come back as a float column with NaN
+        return None
+    return array
+
+
+def _is_object_type(arrow_type) -> bool:
+    # the Arrow types converted back to object columns by `to_pandas`
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+def _column_to_series(column) -> pd.Series:
+    if isinstance(column.type, pa.FixedShapeTensorType):
+        tensor = column_to_numpy(column)
+        return pd.Series(tensor_to_cells(tensor))
+    return column.to_pandas()
@@ -12,14 +12,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Callable, Iterable, List, TypeVar, Union
+import functools
+import itertools
+import operator
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar, Union
 
 import numpy as np
 import pandas as pd
 
 from evadb.expression.abstract_expression import ExpressionType
+from evadb.models.storage.batch_kernels import (
+    compare_columns,
+    contains_columns,
+    dictionary_encode,
+    hash_columns,
+    like_column,
+)
 from evadb.parser.alias import Alias
-from evadb.utils.generic_utils import PickleSerializer
+from evadb.utils.generic_utils import PickleSerializer, get_nbytes
 from evadb.utils.logging_manager import logger
 
 Batch = TypeVar("Batch")
@@ -56,6 +66,21 @@ class Batch:
     def columns(self):
         return list(self._frames.columns)
 
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the batch: the buffers of its columns, plus the arrays,
+        strings and other objects referenced by its object columns."""
+        frames = self._frames
+        nbytes = int(frames.memory_usage(index=True, deep=False).sum())
+        for idx, dtype in enumerate(frames.dtypes):
+            if dtype == object:
+                nbytes += sum(map(get_nbytes, frames.iloc[:, idx].to_numpy()))
+        return nbytes
+
+    def is_arrow(self) -> bool:
+        """True if the batch is backed by an Arrow table, see `ArrowBatch`."""
+        return False
+
     def column_as_numpy_array(self, column_name: str) -> np.ndarray:
         """Return a column as numpy array
 
@@ -67,62 +92,139 @@ class Batch:
         """
         return self._frames[column_name].to_numpy()
 
+    def column_as_tensor(self, column_name: str) -> Optional[np.ndarray]:
+        """Return an NDARRAY column as a single (N, *cell_shape) array
+
+        The cells of the columns made contiguous by `make_tensor_columns_contiguous`
+        are views on one buffer, which is returned without copying. Otherwise the
+        cells are stacked.
+
+        Args:
+            column_name (str): the name of the required column
+
+        Returns:
+            numpy.ndarray: the stacked column, or None if the cells are not arrays
+            of the same shape and dtype (ragged data)
+        """
+        return stack_tensor_cells(self._frames[column_name].to_numpy())
+
+    def make_tensor_columns_contiguous(self) -> None:
+        """Store every NDARRAY column whose cells share the same shape and dtype
+        (e.g., the frames of a video) in a single contiguous buffer. The cells
+        become views on that buffer, ragged columns are left as they are."""
+        for column in self.columns:
+            values = self._frames[column].to_numpy()
+            if values.dtype != object or not len(values):
+                continue
+            tensor = stack_tensor_cells(values)
+            if tensor is not None and not _is_view_of(values, tensor):
+                self._frames[column] = pd.Series(
+                    tensor_to_cells(tensor), index=self._frames.index
+                )
+
     def serialize(self):
-        obj = {"frames": self._frames, "batch_size": len(self)}
-        return PickleSerializer.serialize(obj)
+        return b"".join(self.serialize_to_buffers())
+
+    def serialize_to_buffers(self) -> List[memoryview]:
+        """Serialize the batch without copying the frame buffers, see
+        `PickleSerializer.serialize_to_buffers`."""
+        obj = {"frames": self.frames, "batch_size": len(self)}
+        return PickleSerializer.serialize_to_buffers(obj)
 
     @classmethod
     def deserialize(cls, data):
         obj = PickleSerializer.deserialize(data)
         return cls(frames=obj["frames"])
 
+    def column_arrays(self) -> List[np.ndarray]:
+        """Return the columns as numpy arrays, in order (names may repeat). The
+        dictionary-encoded columns are returned as pandas Categoricals."""
+        frames = self._frames
+        if frames.shape[1] == 1 and not isinstance(
+            frames.dtypes.iloc[0], pd.CategoricalDtype
+        ):
+            # avoids creating a Series, the array is a view for a single block
+            return [frames.to_numpy()[:, 0]]
+        arrays = []
+        for idx in range(frames.shape[1]):
+            column = frames.iloc[:, idx]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                arrays.append(column.array)
+            else:
+                arrays.append(column.to_numpy())
+        return arrays
+
+    def dictionary_encode(self, cols: List[str] = None, max_ratio: float = 0.5):
+        """
+        Dictionary-encode the string columns repeating a few distinct values, such
+        as the labels of detected objects, into pandas Categoricals. Equality
+        predicates on them compare integer codes and LIKE matches each distinct
+        string once. Only the columns without NULLs and with at most `max_ratio`
+        distinct values per row are encoded.
+
+        Arguments:
+            cols (List[str]): columns to encode, all the columns if None
+            max_ratio (float): maximum ratio of distinct values to rows
+        """
+        frames = self._frames
+        for idx, col in enumerate(frames.columns):
+            if cols is not None and col not in cols:
+                continue
+            encoded = dictionary_encode(frames.iloc[:, idx].to_numpy(), max_ratio)
+            if encoded is not None:
+                frames.isetitem(idx, encoded)
+
+    def dictionary_decode(self) -> None:
+        """Decode the dictionary-encoded columns back into columns of strings"""
+        frames = self._frames
+        for idx, dtype in enumerate(frames.dtypes):
+            if isinstance(dtype, pd.CategoricalDtype):
+                frames.isetitem(idx, np.asarray(frames.iloc[:, idx].array))
+
     @classmethod
     def from_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() == batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.eq)
 
     @classmethod
     def from_greater(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() > batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.gt)
 
     @classmethod
     def from_lesser(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() < batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.lt)
 
     @classmethod
     def from_greater_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() >= batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.ge)
 
     @classmethod
     def from_lesser_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() <= batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.le)
 
     @classmethod
     def from_not_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(pd.DataFrame(batch1.to_numpy() != batch2.to_numpy()))
+        return cls._compare(batch1, batch2, operator.ne)
 
     @classmethod
-    def compare_contains(cls, batch1: Batch, batch2: Batch) -> None:
-        return cls(
-            pd.DataFrame(
-                [all(x in p for x in q) for p, q in zip(left, right)]
-                for left, right in zip(batch1.to_numpy(), batch2.to_numpy())
-            )
+    def _compare(cls, batch1: Batch, batch2: Batch, op: Callable) -> Batch:
+        # column by column, so each column keeps its own dtype
+        return Batch(
+            compare_columns(batch1.column_arrays(), batch2.column_arrays(), op)
         )
 
+    @classmethod
+    def compare_contains(cls, batch1: Batch, batch2: Batch) -> None:
+        return cls(contains_columns(batch1.column_arrays(), batch2.column_arrays()))
+
     @classmethod
     def compare_is_contained(cls, batch1: Batch, batch2: Batch) -> None:
-        return cls(
-            pd.DataFrame(
-                [all(x in q for x in p) for p, q in zip(left, right)]
-                for left, right in zip(batch1.to_numpy(), batch2.to_numpy())
-            )
-        )
+        return cls(contains_columns(batch2.column_arrays(), batch1.column_arrays()))
 
     @classmethod
     def compare_like(cls, batch1: Batch, batch2: Batch) -> None:
-        col = batch1._frames.iloc[:, 0]
-        regex = batch2._frames.iloc[:, 0][0]
-        return cls(pd.DataFrame(col.astype("str").str.match(pat=regex)))
+        values = batch1.column_arrays()[0]
+        regex = batch2.column_arrays()[0][0]
+        return cls(like_column(values, regex))
 
     def __str__(self) -> str:
         with pd.option_context(
@@ -151,9 +253,9 @@ class Batch:
             return self._get_frames_from_indices(indices)
         elif isinstance(indices, slice):
             start = indices.start if indices.start else 0
-            end = indices.stop if indices.stop else len(self.frames)
+            end = indices.stop if indices.stop else len(self)
             if end < 0:
-                end = len(self._frames) + end
+                end = len(self) + end
             step = indices.step if indices.step else 1
             return self._get_frames_from_indices(range(start, end, step))
         elif isinstance(indices, int):
@@ -229,8 +331,10 @@ class Batch:
         return self._frames[~self._frames[0]].index.tolist()
 
     def update_indices(self, indices: List, other: Batch):
+        # the frames can share their buffers with the batch they are projected
+        # from, they are copied before being written into
+        self._frames = self._frames.copy()
         self._frames.iloc[indices] = other._frames
-        self._frames = pd.DataFrame(self._frames)
 
     def file_paths(self) -> Iterable:
         yield from self._frames["file_path"]
@@ -238,13 +342,23 @@ class Batch:
     def project(self, cols: None) -> Batch:
         """
         Takes as input the column list, returns the projection.
-        We do a copy for now.
+        The projection shares the column buffers of the batch, only the column
+        labels are new.
         """
         cols = cols or []
         verified_cols = [c for c in cols if c in self._frames]
         unknown_cols = list(set(cols) - set(verified_cols))
         assert len(unknown_cols) == 0, unknown_cols
-        return Batch(self._frames[verified_cols])
+        frames = self._frames
+        if len(set(verified_cols)) < len(verified_cols) or not frames.columns.is_unique:
+            return Batch(frames[verified_cols])
+        if not verified_cols:
+            return Batch(pd.DataFrame(index=frames.index))
+        # frames[cols] takes a copy of the selected blocks, the columns are
+        # picked one by one instead so that they are not copied
+        return Batch(
+            pd.DataFrame({col: frames[col] for col in verified_cols}, copy=False)
+        )
 
     @classmethod
     def merge_column_wise(cls, batches: List[Batch], auto_renaming=False) -> Batch:
@@ -260,13 +374,17 @@ class Batch:
         if not len(batches):
             return Batch()
 
+        if all(batch.is_arrow() for batch in batches):
+            from evadb.models.storage.arrow_batch import ArrowBatch
+
+            return ArrowBatch.merge_tables_column_wise(batches)
+
         frames = [batch.frames for batch in batches]
 
         # Check merging matched indices
-        frames_index = [list(frame.index) for frame in frames]
-        for i, frame_index in enumerate(frames_index):
-            assert (
-                frame_index == frames_index[i - 1]
+        for i, frame in enumerate(frames):
+            assert frame.index.equals(
+                frames[i - 1].index
             ), "Merging of DataFrames with unmatched indices can cause undefined behavior"
 
         new_frames = pd.concat(frames, axis=1, copy=False, ignore_index=False)
@@ -302,9 +420,15 @@ class Batch:
 
         # pd.concat will convert generator into list, so it does not hurt
         # if we convert ourselves.
-        frame_list = list([batch.frames for batch in batch_list])
-        if len(frame_list) == 0:
+        batch_list = list(batch_list)
+        if len(batch_list) == 0:
             return Batch()
+        if all(batch.is_arrow() for batch in batch_list):
+            from evadb.models.storage.arrow_batch import ArrowBatch
+
+            return ArrowBatch.concat_tables(batch_list)
+
+        frame_list = list([batch.frames for batch in batch_list])
         frame = pd.concat(frame_list, ignore_index=True, copy=copy)
 
         return Batch(frame)
@@ -362,8 +486,8 @@ class Batch:
         """
         Hash indices and replace the indices with those hash values.
         """
-        self._frames.index = self._frames[indices].apply(
-            lambda x: hash(tuple(x)), axis=1
+        self._frames.index = pd.Index(
+            hash_columns([self._frames[col].to_numpy() for col in indices])
         )
 
     def aggregate(self, method: str) -> None:
@@ -374,6 +498,8 @@ class Batch:
         Arguments:
             method: string with one of the five above options
         """
+        # pandas does not aggregate unordered categoricals
+        self.dictionary_decode()
         self._frames = self._frames.agg([method])
 
     def empty(self):
@@ -392,6 +518,67 @@ class Batch:
         self._frames = self._frames.explode(cols)
         self._frames.dropna(inplace=True)
 
+    def iter_unnest(
+        self, cols: List[str] = None, max_rows: int = None
+    ) -> Iterator[Batch]:
+        """
+        Unnest columns and drop rows with no data, like `unnest`, but yield the
+        output in batches of at most `max_rows` rows (or of the rows unnested from
+        a single input row, if more). The other columns are repeated for one output
+        batch at a time, using the offsets of the unnested values, instead of
+        exploding the whole batch at once. The output batches have a fresh index.
+        """
+        frames = self._frames
+        if cols is None:
+            cols = list(self.columns)
+        if not len(frames) or not len(cols):
+            yield Batch(frames.reset_index(drop=True))
+            return
+
+        # values of every row of the unnested columns, scalars count as one value
+        cells = {col: _list_cells(frames[col].to_numpy()) for col in cols}
+        lengths = np.fromiter(
+            (len(value) for value in cells[cols[0]]), dtype=np.int64, count=len(frames)
+        )
+        for col in cols[1:]:
+            col_lengths = np.fromiter(
+                (len(value) for value in cells[col]), dtype=np.int64, count=len(frames)
+            )
+            if not np.array_equal(lengths, col_lengths):
+                raise ValueError("columns must have matching element counts")
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+        max_rows = max_rows or int(offsets[-1]) or 1
+        start = 0
+        while start < len(frames):
+            # the input rows whose output fits in max_rows, at least one
+            end = int(
+                np.searchsorted(offsets, offsets[start] + max_rows, side="right") - 1
+            )
+            end = min(max(end, start + 1), len(frames))
+            num_rows = int(offsets[end] - offsets[start])
+            if num_rows:
+                positions = np.repeat(np.arange(start, end), lengths[start:end])
+                chunk = {}
+                for col in frames.columns:
+                    if col in cells:
+                        chunk[col] = np.fromiter(
+                            itertools.chain.from_iterable(cells[col][start:end]),
+                            dtype=object,
+                            count=num_rows,
+                        )
+                    else:
+                        chunk[col] = frames[col].array.take(positions)
+                output = pd.DataFrame(chunk, columns=frames.columns)
+                output.dropna(inplace=True)
+                if len(output):
+                    output.reset_index(drop=True, inplace=True)
+                    batch = Batch(output)
+                    # e.g., the labels of the objects detected in the frames
+                    batch.dictionary_encode(cols)
+                    yield batch
+            start = end
+
     def reverse(self) -> None:
         """Reverses dataframe"""
         self._frames = self._frames[::-1]
@@ -410,39 +597,26 @@ class Batch:
         # t1.a -> t2.a
         if isinstance(alias, str):
             alias = Alias(alias)
-        new_col_names = []
-        if len(alias.col_names):
-            if len(self.columns) != len(alias.col_names):
-                err_msg = (
-                    f"Expected {len(alias.col_names)} columns {alias.col_names},"
-                    f"got {len(self.columns)} columns {self.columns}."
-                )
-                raise RuntimeError(err_msg)
-            new_col_names = [
-                "{}.{}".format(alias.alias_name, col_name)
-                for col_name in alias.col_names
-            ]
-        else:
-            for col_name in self.columns:
-                if "." in str(col_name):
-                    new_col_names.append(
-                        "{}.{}".format(alias.alias_name, str(col_name).split(".")[1])
-                    )
-                else:
-                    new_col_names.append("{}.{}".format(alias.alias_name, col_name))
-
-        self._frames.columns = new_col_names
+        if len(alias.col_names) and len(self.columns) != len(alias.col_names):
+            err_msg = (
+                f"Expected {len(alias.col_names)} columns {alias.col_names},"
+                f"got {len(self.columns)} columns {self.columns}."
+            )
+            raise RuntimeError(err_msg)
+        self._set_column_names(
+            _aliased_column_names(
+                alias.alias_name, tuple(alias.col_names), tuple(self.columns)
+            )
+        )
 
     def drop_column_alias(self) -> None:
         # table1.a, table1.b, table1.c -> a, b, c
-        new_col_names = []
-        for col_name in self.columns:
-            if isinstance(col_name, str) and "." in col_name:
-                new_col_names.append(col_name.split(".")[1])
-            else:
-                new_col_names.append(col_name)
+        self._set_column_names(_unaliased_column_names(tuple(self.columns)))
 
-        self._frames.columns = new_col_names
+    def _set_column_names(self, names: List[str]) -> None:
+        # relabelling only touches the column index, not the column buffers
+        if list(names) != self.columns:
+            self._frames.columns = names
 
     def to_numpy(self):
         return self._frames.to_numpy()
@@ -450,3 +624,104 @@ class Batch:
     def rename(self, columns) -> None:
         "Rename column names"
         self._frames.rename(columns=columns, inplace=True)
+
+
+# The scans and the function expressions relabel every batch they produce with
+# the same few aliases, the relabelled column names are computed once
+@functools.lru_cache(maxsize=1024)
+def _aliased_column_names(
+    alias_name: str, alias_col_names: tuple, columns: tuple
+) -> tuple:
+    if len(alias_col_names):
+        return tuple(
+            "{}.{}".format(alias_name, col_name) for col_name in alias_col_names
+        )
+    new_col_names = []
+    for col_name in columns:
+        if "." in str(col_name):
+            new_col_names.append(
+                "{}.{}".format(alias_name, str(col_name).split(".")[1])
+            )
+        else:
+            new_col_names.append("{}.{}".format(alias_name, col_name))
+    return tuple(new_col_names)
+
+
+@functools.lru_cache(maxsize=1024)
+def _unaliased_column_names(columns: tuple) -> tuple:
+    new_col_names = []
+    for col_name in columns:
+        if isinstance(col_name, str) and "." in col_name:
+            new_col_names.append(col_name.split(".")[1])
+        else:
+            new_col_names.append(col_name)
+    return tuple(new_col_names)
+
+
+def _list_cells(values: np.ndarray) -> List:
+    # the values of every cell, as `DataFrame.explode` would unnest them
+    return [value if pd.api.types.is_list_like(value) else [value] for value in values]
+
+
+def stack_tensor_cells(values: np.ndarray) -> Optional[np.ndarray]:
+    """Stack an object array of numpy arrays into a (N, *cell_shape) array.
+
+    If the cells are consecutive views on one contiguous buffer, the matching
+    slice of that buffer is returned without copying.
+
+    Returns:
+        numpy.ndarray: the stacked array, or None if the cells are not arrays
+        of the same shape and dtype
+    """
+    if not len(values):
+        return None
+    first = values[0]
+    if not isinstance(first, np.ndarray) or first.dtype == object or first.ndim == 0:
+        return None
+    for value in values:
+        if (
+            not isinstance(value, np.ndarray)
+            or value.shape != first.shape
+            or value.dtype != first.dtype
+        ):
+            return None
+
+    base = first.base
+    if (
+        isinstance(base, np.ndarray)
+        and base.ndim == first.ndim + 1
+        and base.shape[1:] == first.shape
+        and base.dtype == first.dtype
+        and base.flags["C_CONTIGUOUS"]
+    ):
+        start, offset = divmod(_address(first) - _address(base), first.nbytes)
+        if offset == 0 and start >= 0:
+            tensor = base[start : start + len(values)]
+            if _is_view_of(values, tensor):
+                return tensor
+    return np.stack(values)
+
+
+def tensor_to_cells(tensor: np.ndarray) -> np.ndarray:
+    """Split a (N, *cell_shape) array into an object array of N views on it."""
+    cells = np.empty(len(tensor), dtype=object)
+    cells[:] = list(tensor)
+    return cells
+
+
+def _address(array: np.ndarray) -> int:
+    return array.__array_interface__["data"][0]
+
+
+def _is_view_of(values: np.ndarray, tensor: np.ndarray) -> bool:
+    # whether the i-th cell is the i-th row of `tensor`
+    if len(values) != len(tensor) or not tensor.flags["C_CONTIGUOUS"]:
+        return False
+    address, step = _address(tensor), tensor[0].nbytes if len(tensor) else 0
+    return all(
+        isinstance(value, np.ndarray)
+        and value.shape == tensor.shape[1:]
+        and value.flags["C_CONTIGUOUS"]
+        and _address(value) == address + idx * step
+        for idx, value in enumerate(values)
+    )
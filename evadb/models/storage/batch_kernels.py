@@ -0,0 +1,260 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Vectorized kernels over the columns of a batch. The comparison kernels take
+the columns of both sides as lists of numpy arrays (pandas Categoricals for the
+dictionary-encoded columns) and return the DataFrame of booleans expected by
+`ComparisonExpression`; `hash_columns` computes the keys of the hash join."""
+
+import operator
+from itertools import chain
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from evadb.utils.generic_utils import is_pyarrow_available
+
+ColumnArray = Union[np.ndarray, pd.Categorical]
+
+
+def dictionary_encode(
+    values: np.ndarray, max_ratio: float = 0.5
+) -> Optional[pd.Categorical]:
+    """Dictionary-encode an object column of strings into a Categorical, whose
+    codes index the sorted distinct strings. Columns with NULLs, values that are
+    not strings, or more than `max_ratio` distinct values per row are not encoded
+    and None is returned."""
+    if values.dtype != object or not len(values):
+        return None
+    if pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return None
+    codes, uniques = pd.factorize(values, sort=True)
+    if len(uniques) > max_ratio * len(values):
+        return None
+    return pd.Categorical.from_codes(codes, categories=uniques)
+
+
+def compare_columns(
+    left: List[ColumnArray], right: List[ColumnArray], op: Callable
+) -> pd.DataFrame:
+    """Apply the comparison `op` (e.g., `operator.eq`) to each pair of columns."""
+    left, right = _broadcast_columns(left, right)
+    return _to_frames([_compare(lcol, rcol, op) for lcol, rcol in zip(left, right)])
+
+
+def contains_columns(left: List[ColumnArray], right: List[ColumnArray]) -> pd.DataFrame:
+    """For each pair of columns, whether every element of the right cell is in
+    the left cell (CONTAINS). IS CONTAINED swaps the sides."""
+    left, right = _broadcast_columns(left, right)
+    return _to_frames(
+        [_contains(_dense(lcol), _dense(rcol)) for lcol, rcol in zip(left, right)]
+    )
+
+
+def like_column(values: ColumnArray, pattern: str) -> pd.DataFrame:
+    """Whether each value matches the regex `pattern` from its start (LIKE)."""
+    if isinstance(values, pd.Categorical):
+        # match the distinct strings only, the missing values (code -1) pick the
+        # outcome of NaN appended last
+        categories = np.append(np.asarray(values.categories, dtype=object), np.nan)
+        matches = like_column(categories, pattern).to_numpy()[:, 0]
+        return _to_frames([matches[values.codes]])
+
+    matches = None
+    if is_pyarrow_available():
+        matches = _arrow_match(values, pattern)
+    if matches is None:
+        matches = pd.Series(values).astype("str").str.match(pat=pattern).to_numpy()
+    return _to_frames([matches])
+
+
+def _to_frames(outcomes: List[np.ndarray]) -> pd.DataFrame:
+    # a single 2D block is much cheaper to build than one column at a time
+    block = np.empty((len(outcomes[0]), len(outcomes)), dtype=bool)
+    for idx, outcome in enumerate(outcomes):
+        block[:, idx] = outcome
+    return pd.DataFrame(block)
+
+
+def _dense(values: ColumnArray) -> np.ndarray:
+    if isinstance(values, pd.Categorical):
+        return np.asarray(values)
+    return values
+
+
+def _compare(left: ColumnArray, right: ColumnArray, op: Callable) -> np.ndarray:
+    if op in (operator.eq, operator.ne):
+        # e.g., a string constant compared to a dictionary-encoded column
+        if isinstance(left, pd.Categorical) and not isinstance(right, pd.Categorical):
+            right = _encode_with(left, right)
+        elif isinstance(right, pd.Categorical) and not isinstance(left, pd.Categorical):
+            left = _encode_with(right, left)
+    if (
+        op in (operator.eq, operator.ne)
+        and isinstance(left, pd.Categorical)
+        and isinstance(right, pd.Categorical)
+    ):
+        # compare the integer codes, once the codes of the right side are mapped
+        # to the dictionary of the left side (-2 if absent, -1 is NULL)
+        mapping = np.append(left.categories.get_indexer(right.categories), -1)
+        mapping[mapping == -1] = -2
+        mapping[-1] = -1
+        right_codes = mapping[right.codes]
+        equal = (left.codes == right_codes) & (left.codes >= 0)
+        return equal if op is operator.eq else ~equal
+    return op(_dense(left), _dense(right))
+
+
+def _encode_with(encoded: pd.Categorical, values: np.ndarray) -> ColumnArray:
+    """Encode the strings of `values` with the dictionary of `encoded`, the values
+    missing from the dictionary become NULL codes, which are never equal. The
+    values are returned as is if they are not strings."""
+    if values.dtype != object:
+        return values
+    try:
+        codes = encoded.categories.get_indexer(values)
+    except TypeError:
+        # unhashable values, e.g., lists
+        return values
+    return pd.Categorical.from_codes(codes, dtype=encoded.dtype)
+
+
+def _broadcast_columns(
+    left: List[np.ndarray], right: List[np.ndarray]
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    # a single column is compared to every column of the other side
+    if len(left) == 1 and len(right) > 1:
+        left = left * len(right)
+    elif len(right) == 1 and len(left) > 1:
+        right = right * len(left)
+    assert len(left) == len(right), "Cannot compare batches with different widths"
+    return left, right
+
+
+def _flatten(cells: np.ndarray) -> Tuple[np.ndarray, list]:
+    # row of every element of the list cells, and the elements
+    lengths = np.fromiter(map(len, cells), dtype=np.int64, count=len(cells))
+    rows = np.repeat(np.arange(len(cells)), lengths)
+    return rows, list(chain.from_iterable(cells))
+
+
+def _contains(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Set containment over exploded list cells: the (row, element) pairs of the
+    right side are looked up among the pairs of the left side."""
+    try:
+        lrows, lvalues = _flatten(left)
+        rrows, rvalues = _flatten(right)
+        codes, uniques = pd.factorize(
+            pd.Series(lvalues + rvalues, dtype=object), use_na_sentinel=False
+        )
+    except TypeError:
+        # unhashable elements (e.g., nested lists) or cells that are not lists
+        return np.array(
+            [all(x in p for x in q) for p, q in zip(left, right)], dtype=bool
+        )
+
+    num_codes = len(uniques)
+    lkeys = lrows * num_codes + codes[: len(lvalues)]
+    rkeys = rrows * num_codes + codes[len(lvalues) :]
+    missing = ~np.isin(rkeys, lkeys)
+    return np.bincount(rrows[missing], minlength=len(right)) == 0
+
+
+def _arrow_match(values: np.ndarray, pattern: str):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # RE2 and Python regexes only agree on ASCII text, e.g., \w is ASCII-only in
+    # RE2. Patterns RE2 does not support (backreferences, lookarounds) raise.
+    if not pattern.isascii():
+        return None
+    try:
+        array = pa.array(values, type=pa.string())
+        if array.null_count or not pc.all(pc.string_is_ascii(array)).as_py():
+            return None
+        # Python's $ also matches before a trailing newline, and its \s also
+        # matches \v and \x1c-\x1f
+        if "$" in pattern and pc.any(pc.ends_with(array, "\n")).as_py():
+            return None
+        if ("\\s" in pattern or "\\S" in pattern) and pc.any(
+            pc.match_substring_regex(array, "[\\x0b\\x1c-\\x1f]")
+        ).as_py():
+            return None
+        matches = pc.match_substring_regex(array, f"^(?:{pattern})")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    return matches.to_numpy(zero_copy_only=False)
+
+
+# multiplier of the FNV hash, used to combine the hashes of the key columns
+_HASH_MULTIPLIER = np.uint64(1099511628211)
+
+
+def hash_columns(columns: List[np.ndarray]) -> np.ndarray:
+    """Hash each row of the key `columns` into a uint64 join key, in one pass
+    per column.
+
+    Values comparing equal hash equally across columns and dtypes, e.g., the
+    INTEGER 1 and the FLOAT 1.0, so that both sides of a join agree. Rows with a
+    NULL key get unique random keys since NULL never equals NULL.
+    """
+    num_rows = len(columns[0]) if columns else 0
+    hashes = np.zeros(num_rows, dtype=np.uint64)
+    nulls = np.zeros(num_rows, dtype=bool)
+    for column in columns:
+        column_nulls = np.asarray(pd.isna(column), dtype=bool)
+        column_hashes = np.zeros(num_rows, dtype=np.uint64)
+        column_hashes[~column_nulls] = _hash_values(column[~column_nulls])
+        hashes = (hashes * _HASH_MULTIPLIER) ^ column_hashes
+        nulls |= column_nulls
+
+    if nulls.any():
+        hashes[nulls] = np.random.default_rng().integers(
+            0, np.iinfo(np.uint64).max, size=nulls.sum(), dtype=np.uint64
+        )
+    return hashes
+
+
+def _hash_values(values: np.ndarray) -> np.ndarray:
+    if values.dtype == object:
+        kind = pd.api.types.infer_dtype(values, skipna=False)
+        if kind == "string":
+            return pd.util.hash_array(values, categorize=True)
+        try:
+            if kind in ("integer", "boolean"):
+                values = values.astype(np.int64)
+            elif kind in ("floating", "mixed-integer-float"):
+                values = values.astype(np.float64)
+            else:
+                return _python_hash(values)
+        except (OverflowError, TypeError, ValueError):
+            return _python_hash(values)
+
+    if values.dtype.kind in "biu":
+        return pd.util.hash_array(values.astype(np.int64, copy=False))
+    if values.dtype.kind == "f":
+        # integral floats hash as the equal integers
+        hashes = pd.util.hash_array(values)
+        integral = np.isfinite(values) & (np.floor(values) == values)
+        integral &= np.abs(values) < 2**63
+        hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+        return hashes
+    return pd.util.hash_array(values)
+
+
+def _python_hash(values: np.ndarray) -> np.ndarray:
+    # values of mixed or unknown types
+    hashes = np.fromiter(map(hash, values), dtype=np.int64, count=len(values))
+    return hashes.view(np.uint64)
@@ -182,6 +182,7 @@ class LogicalGet(Operator):
         sampling_rate: int = None,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
         children=None,
     ):
         self._video = video
@@ -192,6 +193,7 @@ class LogicalGet(Operator):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._columns = columns
         super().__init__(OperatorType.LOGICALGET, children)
 
     @property
@@ -222,6 +224,10 @@ class LogicalGet(Operator):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def columns(self):
+        return self._columns
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalGet):
@@ -236,6 +242,7 @@ class LogicalGet(Operator):
             and self.sampling_rate == other.sampling_rate
             and self.sampling_type == other.sampling_type
             and self.chunk_params == other.chunk_params
+            and self.columns == other.columns
         )
 
     def __hash__(self) -> int:
@@ -250,6 +257,7 @@ class LogicalGet(Operator):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
             )
         )
 
@@ -1173,6 +1181,10 @@ class LogicalApplyAndMerge(Operator):
     input data. This means that if the function does not return any output for a given
     input row, that row will be dropped from the output. We can consider expanding this
     to support left joins and other types of joins in the future.
+
+    `columns` lists the input columns kept in the output, the others are dropped
+    before merging with the function output. All the input columns are kept if it
+    is None.
     """
 
     def __init__(
@@ -1180,12 +1192,14 @@ class LogicalApplyAndMerge(Operator):
         func_expr: FunctionExpression,
         alias: Alias,
         do_unnest: bool = False,
+        columns: List[str] = None,
         children: List = None,
     ):
         super().__init__(OperatorType.LOGICAL_APPLY_AND_MERGE, children)
         self._func_expr = func_expr
         self._do_unnest = do_unnest
         self._alias = alias
+        self._columns = columns
         self._merge_type = JoinType.INNER_JOIN
 
     @property
@@ -1200,6 +1214,10 @@ class LogicalApplyAndMerge(Operator):
     def do_unnest(self):
         return self._do_unnest
 
+    @property
+    def columns(self):
+        return self._columns
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalApplyAndMerge):
@@ -1209,6 +1227,7 @@ class LogicalApplyAndMerge(Operator):
             and self.func_expr == other.func_expr
             and self.do_unnest == other.do_unnest
             and self.alias == other.alias
+            and self.columns == other.columns
             and self._merge_type == other._merge_type
         )
 
@@ -1219,6 +1238,7 @@ class LogicalApplyAndMerge(Operator):
                 self.func_expr,
                 self.do_unnest,
                 self.alias,
+                tuple(self.columns or []),
                 self._merge_type,
             )
         )
@@ -18,12 +18,23 @@ from typing import List, Tuple
 if typing.TYPE_CHECKING:
     from evadb.optimizer.optimizer_context import OptimizerContext
 
-from evadb.catalog.catalog_utils import get_table_primary_columns
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.catalog_utils import (
+    get_metadata_entry_or_val,
+    get_table_primary_columns,
+)
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.function_io_catalog import FunctionIOCatalogEntry
 from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
-from evadb.constants import CACHEABLE_FUNCTIONS, DEFAULT_FUNCTION_EXPRESSION_COST
+from evadb.constants import (
+    CACHEABLE_FUNCTIONS,
+    DEFAULT_FUNCTION_EXPRESSION_COST,
+    FUNCTION_CACHE_MAX_SIZE,
+    FUNCTION_CACHE_MEMORY_SIZE,
+    FUNCTION_CACHE_TTL,
+)
 from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
 from evadb.expression.expression_utils import (
     conjunction_list_to_expression_tree,
@@ -36,6 +47,7 @@ from evadb.expression.function_expression import (
     FunctionExpression,
     FunctionExpressionCache,
 )
+from evadb.expression.logical_expression import LogicalExpression
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.parser.alias import Alias
 from evadb.parser.create_statement import ColumnDefinition
@@ -191,6 +203,76 @@ def extract_pushdown_predicate_for_alias(
     )
 
 
+def is_storage_filter(predicate: AbstractExpression, table_alias: str) -> bool:
+    """Checks if the predicate can be evaluated by the storage engine of a
+    structured table, i.e., it only compares the scalar columns of the table with
+    each other or with constants, and combines the comparisons with AND and OR.
+
+    Args:
+        predicate (AbstractExpression): predicate expression to check
+        table_alias (str): alias of the table read by the storage engine
+    """
+    if isinstance(predicate, LogicalExpression):
+        return predicate.etype in [
+            ExpressionType.LOGICAL_AND,
+            ExpressionType.LOGICAL_OR,
+        ] and all(is_storage_filter(child, table_alias) for child in predicate.children)
+
+    if isinstance(predicate, ComparisonExpression):
+        # sql drops the NULL rows of col != value, the filter above keeps them
+        return predicate.etype in [
+            ExpressionType.COMPARE_EQUAL,
+            ExpressionType.COMPARE_GREATER,
+            ExpressionType.COMPARE_LESSER,
+            ExpressionType.COMPARE_GEQ,
+            ExpressionType.COMPARE_LEQ,
+        ] and all(is_storage_filter(child, table_alias) for child in predicate.children)
+
+    if isinstance(predicate, TupleValueExpression):
+        # the ndarray columns are stored serialized
+        return (
+            isinstance(predicate.col_object, ColumnCatalogEntry)
+            and predicate.col_object.type != ColumnType.NDARRAY
+            and str(predicate.col_alias).split(".")[0] == table_alias
+        )
+
+    if isinstance(predicate, ConstantValueExpression):
+        # NULL comparisons do not have the same semantics in sql
+        return isinstance(predicate.value, (bool, int, float, str))
+
+    return False
+
+
+def extract_storage_pushdown_predicate(
+    predicate: AbstractExpression, table_alias: str
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate into the conjuncts that the storage engine of a
+    structured table can evaluate and the remaining predicate
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+        table_alias (str): alias of the table read by the storage engine
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    if predicate is None:
+        return None, None
+
+    pushdown_preds = []
+    rem_pred = []
+    for pred in to_conjunction_list(predicate):
+        if is_storage_filter(pred, table_alias):
+            pushdown_preds.append(pred)
+        else:
+            rem_pred.append(pred)
+
+    return (
+        conjunction_list_to_expression_tree(pushdown_preds),
+        conjunction_list_to_expression_tree(rem_pred),
+    )
+
+
 def optimize_cache_key_for_tuple_value_expression(
     context: "OptimizerContext", tv_expr: TupleValueExpression
 ):
@@ -269,9 +351,30 @@ def enable_cache_init(
     if not cache_entry:
         cache_entry = catalog.insert_function_cache_catalog_entry(func_expr)
 
-    cache = FunctionExpressionCache(
-        key=tuple(optimized_key), store=DiskKVCache(cache_entry.cache_path)
+    # the cache settings can be overridden per function using the
+    # `cache_memory_size`, `cache_max_size` and `cache_ttl` metadata
+    memory_cache_size = get_metadata_entry_or_val(
+        func_expr.function_obj,
+        FUNCTION_CACHE_MEMORY_SIZE,
+        catalog.get_configuration_catalog_value("function_cache_memory_size", 0),
+    )
+    max_cache_size = get_metadata_entry_or_val(
+        func_expr.function_obj,
+        FUNCTION_CACHE_MAX_SIZE,
+        catalog.get_configuration_catalog_value("function_cache_max_size", 2**30),
+    )
+    ttl = get_metadata_entry_or_val(
+        func_expr.function_obj,
+        FUNCTION_CACHE_TTL,
+        catalog.get_configuration_catalog_value("function_cache_ttl", 0),
+    )
+    store = DiskKVCache(
+        cache_entry.cache_path,
+        max_cache_size=int(max_cache_size),
+        memory_cache_size=int(memory_cache_size),
+        ttl=float(ttl),
     )
+    cache = FunctionExpressionCache(key=tuple(optimized_key), store=store)
     return cache
 
 
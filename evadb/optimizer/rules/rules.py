@@ -17,8 +17,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from evadb.catalog.catalog_type import TableType, VectorStoreType
-from evadb.catalog.catalog_utils import is_video_table
+from evadb.catalog.catalog_utils import (
+    is_parquet_table,
+    is_structured_table,
+    is_video_table,
+)
 from evadb.catalog.models.utils import IndexCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
 from evadb.constants import CACHEABLE_FUNCTIONS
 from evadb.executor.execution_context import Context
 from evadb.expression.expression_utils import (
@@ -34,6 +39,7 @@ from evadb.optimizer.optimizer_utils import (
     extract_equi_join_keys,
     extract_pushdown_predicate,
     extract_pushdown_predicate_for_alias,
+    extract_storage_pushdown_predicate,
     get_expression_execution_cost,
 )
 from evadb.optimizer.rules.pattern import Pattern
@@ -115,7 +121,8 @@ class EmbedFilterIntoGet(Rule):
         return Promise.EMBED_FILTER_INTO_GET
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
-        # System supports predicate pushdown only while reading video data
+        # System supports predicate pushdown only while reading video data and
+        # structured data
         predicate = before.predicate
         lget: LogicalGet = before.children[0]
         if predicate and is_video_table(lget.table_obj):
@@ -125,17 +132,34 @@ class EmbedFilterIntoGet(Rule):
             pushdown_pred, _ = extract_pushdown_predicate(predicate, col_alias)
             if pushdown_pred:
                 return True
+        if predicate and is_structured_table(lget.table_obj) and not lget.predicate:
+            pushdown_pred, _ = extract_storage_pushdown_predicate(
+                predicate, lget.alias.alias_name
+            )
+            if pushdown_pred:
+                return True
         return False
 
     def apply(self, before: LogicalFilter, context: OptimizerContext):
         predicate = before.predicate
         lget = before.children[0]
-        # System only supports pushing basic range predicates on id
-        video_alias = lget.video.alias
-        col_alias = f"{video_alias}.id"
-        pushdown_pred, unsupported_pred = extract_pushdown_predicate(
-            predicate, col_alias
-        )
+        if is_structured_table(lget.table_obj):
+            # The storage engine filters the rows with the comparisons between
+            # the columns and constants
+            pushdown_pred, unsupported_pred = extract_storage_pushdown_predicate(
+                predicate, lget.alias.alias_name
+            )
+            if is_parquet_table(lget.table_obj):
+                # the parquet statistics only skip the row groups, the rows of
+                # the other row groups still have to be filtered
+                unsupported_pred = predicate
+        else:
+            # System only supports pushing basic range predicates on id
+            video_alias = lget.video.alias
+            col_alias = f"{video_alias}.id"
+            pushdown_pred, unsupported_pred = extract_pushdown_predicate(
+                predicate, col_alias
+            )
         if pushdown_pred:
             new_get_opr = LogicalGet(
                 lget.video,
@@ -145,6 +169,7 @@ class EmbedFilterIntoGet(Rule):
                 target_list=lget.target_list,
                 sampling_rate=lget.sampling_rate,
                 sampling_type=lget.sampling_type,
+                columns=lget.columns,
                 children=lget.children,
             )
             if unsupported_pred:
@@ -184,11 +209,73 @@ class EmbedSampleIntoGet(Rule):
             target_list=lget.target_list,
             sampling_rate=sample_freq,
             sampling_type=sample_type,
+            columns=lget.columns,
             children=lget.children,
         )
         yield new_get_opr
 
 
+class EmbedProjectIntoGet(Rule):
+    """The storage engine of a structured table reads only the columns that the
+    projection above references, instead of all the columns of the table.
+    Eg:
+
+    Project(T.a, Foo(T.b))              Project(T.a, Foo(T.b))
+            |                     ->            |
+         Get(T)                     Get(T, columns=[_row_id, a, b])
+
+    """
+
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALPROJECT)
+        pattern.append_child(Pattern(OperatorType.LOGICALGET))
+        super().__init__(RuleType.EMBED_PROJECT_INTO_GET, pattern)
+
+    def promise(self):
+        return Promise.EMBED_PROJECT_INTO_GET
+
+    def check(self, before: LogicalProject, context: OptimizerContext):
+        lget: LogicalGet = before.children[0]
+        return is_structured_table(lget.table_obj)
+
+    def apply(self, before: LogicalProject, context: OptimizerContext):
+        lget: LogicalGet = before.children[0]
+        # the row id is the key of the rows, e.g., for the function cache
+        columns = [IDENTIFIER_COLUMN]
+        for expr in before.target_list:
+            for col in expr.find_all(TupleValueExpression):
+                col_alias = str(col.col_alias)
+                if col.name == "*" or "." not in col_alias:
+                    # the referenced columns are unknown
+                    return
+                if (
+                    col_alias.split(".")[0] == lget.alias.alias_name
+                    and col.name not in columns
+                ):
+                    columns.append(col.name)
+
+        # we do not return a new plan if the columns are already pushed down
+        # this ensures we do not keep applying this optimization
+        if lget.columns == columns:
+            return
+
+        new_get_opr = LogicalGet(
+            lget.video,
+            lget.table_obj,
+            alias=lget.alias,
+            predicate=lget.predicate,
+            target_list=lget.target_list,
+            sampling_rate=lget.sampling_rate,
+            sampling_type=lget.sampling_type,
+            chunk_params=lget.chunk_params,
+            columns=columns,
+            children=lget.children,
+        )
+        root_node = LogicalProject(before.target_list)
+        root_node.append_child(new_get_opr)
+        yield root_node
+
+
 class CacheFunctionExpressionInProject(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALPROJECT)
@@ -278,7 +365,10 @@ class CacheFunctionExpressionInApply(Rule):
         # We should run this code conditionally
         new_func_expr = enable_cache(context, before.func_expr)
         after = LogicalApplyAndMerge(
-            func_expr=new_func_expr, alias=before.alias, do_unnest=before.do_unnest
+            func_expr=new_func_expr,
+            alias=before.alias,
+            do_unnest=before.do_unnest,
+            columns=before.columns,
         )
         after.append_child(before.children[0])
         yield after
@@ -443,6 +533,70 @@ class PushDownFilterThroughApplyAndMerge(Rule):
         yield root_node
 
 
+class PushDownProjectThroughApplyAndMerge(Rule):
+    """The ApplyAndMerge operator merges all the input columns with the function
+    output, and unnest repeats them for every output row of the function. The input
+    columns that the projection above does not reference are dropped by the
+    ApplyAndMerge operator instead, before they are merged and unnested.
+    Eg:
+
+    Project(id, T.label)                     Project(id, T.label)
+            |                                        |
+    ApplyAndMerge(unnest(Yolo(data)))  ->    ApplyAndMerge(unnest(Yolo(data)),
+            |                                              columns=[id])
+            A                                        |
+                                                     A
+
+    """
+
+    def __init__(self):
+        appply_merge_pattern = Pattern(OperatorType.LOGICAL_APPLY_AND_MERGE)
+        appply_merge_pattern.append_child(Pattern(OperatorType.DUMMY))
+        pattern = Pattern(OperatorType.LOGICALPROJECT)
+        pattern.append_child(appply_merge_pattern)
+        super().__init__(RuleType.PUSHDOWN_PROJECT_THROUGH_APPLY_AND_MERGE, pattern)
+
+    def promise(self):
+        return Promise.PUSHDOWN_PROJECT_THROUGH_APPLY_AND_MERGE
+
+    def check(self, before: LogicalProject, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalProject, context: OptimizerContext):
+        apply_and_merge: LogicalApplyAndMerge = before.children[0]
+        A: Dummy = apply_and_merge.children[0]
+        aliases = [
+            alias.alias_name
+            for alias in context.memo.get_group_by_id(A.group_id).aliases
+        ]
+
+        columns = []
+        for expr in before.target_list:
+            for col in expr.find_all(TupleValueExpression):
+                col_alias = str(col.col_alias)
+                if col.name == "*" or "." not in col_alias:
+                    # the referenced columns are unknown
+                    return
+                if col_alias.split(".")[0] in aliases and col_alias not in columns:
+                    columns.append(col_alias)
+
+        # we do not return a new plan if the columns are already pushed down
+        # this ensures we do not keep applying this optimization
+        if apply_and_merge.columns == columns:
+            return
+
+        after = LogicalApplyAndMerge(
+            func_expr=apply_and_merge.func_expr,
+            alias=apply_and_merge.alias,
+            do_unnest=apply_and_merge.do_unnest,
+            columns=columns,
+        )
+        after.append_child(A)
+        root_node = LogicalProject(before.target_list)
+        root_node.append_child(after)
+        yield root_node
+
+
 class XformExtractObjectToLinearFlow(Rule):
     """If the inner node of a lateral join is a Extract_Object function-valued
     expression, we eliminate the join node and make the inner node the parent of the
@@ -948,6 +1102,7 @@ class LogicalGetToSeqScan(Rule):
                 sampling_type=before.sampling_type,
                 chunk_params=before.chunk_params,
                 batch_mem_size=batch_mem_size,
+                columns=before.columns,
             )
         )
         yield after
@@ -1277,7 +1432,9 @@ class LogicalApplyAndMergeToPhysical(Rule):
         return True
 
     def apply(self, before: LogicalApplyAndMerge, context: OptimizerContext):
-        after = ApplyAndMergePlan(before.func_expr, before.alias, before.do_unnest)
+        after = ApplyAndMergePlan(
+            before.func_expr, before.alias, before.do_unnest, before.columns
+        )
         for child in before.children:
             after.append_child(child)
         yield after
@@ -1353,7 +1510,9 @@ class LogicalApplyAndMergeToRayPhysical(Rule):
         return True
 
     def apply(self, before: LogicalApplyAndMerge, context: OptimizerContext):
-        apply_plan = ApplyAndMergePlan(before.func_expr, before.alias, before.do_unnest)
+        apply_plan = ApplyAndMergePlan(
+            before.func_expr, before.alias, before.do_unnest, before.columns
+        )
 
         parallelism = 2
 
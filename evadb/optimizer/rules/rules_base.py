@@ -40,8 +40,10 @@ class RuleType(Flag):
     # REWRITE RULES BOTTOM UP APPLY SECOND (LOGICAL -> LOGICAL)
     EMBED_FILTER_INTO_GET = auto()
     EMBED_SAMPLE_INTO_GET = auto()
+    EMBED_PROJECT_INTO_GET = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
     PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE = auto()
+    PUSHDOWN_PROJECT_THROUGH_APPLY_AND_MERGE = auto()
     COMBINE_SIMILARITY_ORDERBY_AND_LIMIT_TO_VECTOR_INDEX_SCAN = auto()
     REORDER_PREDICATES = auto()
 
@@ -141,10 +143,12 @@ class Promise(IntEnum):
     # REWRITE RULES
     EMBED_FILTER_INTO_GET = auto()
     EMBED_SAMPLE_INTO_GET = auto()
+    EMBED_PROJECT_INTO_GET = auto()
     XFORM_EXTRACT_OBJECT_TO_LINEAR_FLOW = auto()
     XFORM_LATERAL_JOIN_TO_LINEAR_FLOW = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
     PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE = auto()
+    PUSHDOWN_PROJECT_THROUGH_APPLY_AND_MERGE = auto()
     COMBINE_SIMILARITY_ORDERBY_AND_LIMIT_TO_VECTOR_INDEX_SCAN = auto()
     REORDER_PREDICATES = auto()
 
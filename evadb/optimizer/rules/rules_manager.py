@@ -23,6 +23,7 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedProjectIntoGet,
     EmbedSampleIntoGet,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
@@ -57,6 +58,7 @@ from evadb.optimizer.rules.rules import (
     LogicalVectorIndexScanToPhysical,
     PushDownFilterThroughApplyAndMerge,
     PushDownFilterThroughJoin,
+    PushDownProjectThroughApplyAndMerge,
     ReorderPredicates,
     XformExtractObjectToLinearFlow,
     XformLateralJoinToLinearFlow,
@@ -83,8 +85,10 @@ class RulesManager:
             EmbedFilterIntoGet(),
             # EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedProjectIntoGet(),
             PushDownFilterThroughJoin(),
             PushDownFilterThroughApplyAndMerge(),
+            PushDownProjectThroughApplyAndMerge(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
             ReorderPredicates(),
         ]
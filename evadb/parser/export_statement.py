@@ -0,0 +1,50 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from evadb.parser.statement import AbstractStatement
+from evadb.parser.types import StatementType
+
+
+class ExportFunctionCacheStatement(AbstractStatement):
+    """EXPORT FUNCTION CACHE <function_name> TO '<path>'
+
+    Snapshots the caches of the function into a file, which can be loaded with
+    CREATE FUNCTION ... CACHE FROM '<path>'.
+    """
+
+    def __init__(self, function_name: str, path: str):
+        super().__init__(StatementType.EXPORT_FUNCTION_CACHE)
+        self._function_name = function_name
+        self._path = path
+
+    @property
+    def function_name(self):
+        return self._function_name
+
+    @property
+    def path(self):
+        return self._path
+
+    def __str__(self):
+        return f"EXPORT FUNCTION CACHE {self.function_name} TO '{self.path}'"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExportFunctionCacheStatement):
+            return False
+        return self.function_name == other.function_name and self.path == other.path
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.function_name, self.path))
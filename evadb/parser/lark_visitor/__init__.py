@@ -26,6 +26,7 @@ from evadb.parser.lark_visitor._create_statements import (
 from evadb.parser.lark_visitor._delete_statement import Delete
 from evadb.parser.lark_visitor._drop_statement import DropObject
 from evadb.parser.lark_visitor._explain_statement import Explain
+from evadb.parser.lark_visitor._export_statement import Export
 from evadb.parser.lark_visitor._expressions import Expressions
 from evadb.parser.lark_visitor._functions import Functions
 from evadb.parser.lark_visitor._insert_statements import Insert
@@ -78,6 +79,7 @@ class LarkInterpreter(
     DropObject,
     Show,
     Explain,
+    Export,
     Delete,
     Use,
     Set,
@@ -15,6 +15,7 @@
 
 from lark import Token, Tree
 
+from evadb.constants import FUNCTION_CACHE_FROM
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.aggregation_expression import AggregationExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
@@ -103,6 +104,9 @@ class Functions:
                     # Removing .value from key_value_pair[0] since key is now an ID_LITERAL
                     # Adding lower() to ensure the key is in lowercase
                     metadata.append((key_value_pair[0].lower(), value)),
+                elif child.data == "cache_from":
+                    # the snapshot is loaded by the executor, keep it with the metadata
+                    metadata.append((FUNCTION_CACHE_FROM, self.visit(child)))
 
         return CreateFunctionStatement(
             function_name,
@@ -116,6 +120,9 @@ class Functions:
             metadata,
         )
 
+    def cache_from(self, tree):
+        return self.visit(tree.children[2]).value
+
     def get_aggregate_function_type(self, agg_func_name):
         agg_func_type = None
         if agg_func_name == "COUNT":
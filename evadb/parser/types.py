@@ -43,6 +43,7 @@ class StatementType(EvaDBEnum):
     USE  # noqa: F821
     SET  # noqa: F821
     CREATE_JOB  # noqa: F821
+    EXPORT_FUNCTION_CACHE  # noqa: F821
     # add other types
 
 
@@ -73,6 +74,7 @@ class ShowType(EvaDBEnum):
     TABLES  # noqa: F821
     CONFIGS  # noqa: F821
     DATABASES  # noqa: F821
+    FUNCTION_STATS  # noqa: F821
 
 
 class FunctionType(EvaDBEnum):
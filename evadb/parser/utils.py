@@ -20,6 +20,7 @@ from evadb.parser.create_statement import (
 )
 from evadb.parser.drop_object_statement import DropObjectStatement
 from evadb.parser.explain_statement import ExplainStatement
+from evadb.parser.export_statement import ExportFunctionCacheStatement
 from evadb.parser.insert_statement import InsertTableStatement
 from evadb.parser.load_statement import LoadDataStatement
 from evadb.parser.parser import Parser
@@ -37,6 +38,7 @@ SKIP_BINDER_AND_OPTIMIZER_STATEMENTS = (
     CreateJobStatement,
     UseStatement,
     SetStatement,
+    ExportFunctionCacheStatement,
 )
 
 
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
+
 from evadb.expression.function_expression import FunctionExpression
 from evadb.parser.alias import Alias
 from evadb.plan_nodes.abstract_plan import AbstractPlan
@@ -26,14 +28,20 @@ class ApplyAndMergePlan(AbstractPlan):
         func_expr(FunctionExpression): parameterized function expression that
             reference columns from a table expression that precedes it.
         do_unnest(bool): if True perform unnest operation on the output of FunctionScan
+        columns(List[str]): input columns kept in the output, all if None
     """
 
     def __init__(
-        self, func_expr: FunctionExpression, alias: Alias, do_unnest: bool = False
+        self,
+        func_expr: FunctionExpression,
+        alias: Alias,
+        do_unnest: bool = False,
+        columns: List[str] = None,
     ):
         self._func_expr = func_expr
         self._alias = alias
         self._do_unnest = do_unnest
+        self._columns = columns
         super().__init__(PlanOprType.APPLY_AND_MERGE)
 
     @property
@@ -48,9 +56,25 @@ class ApplyAndMergePlan(AbstractPlan):
     def do_unnest(self):
         return self._do_unnest
 
+    @property
+    def columns(self):
+        return self._columns
+
     def __str__(self):
         plan = "UnnestApplyAndMergePlan" if self._do_unnest else "ApplyAndMergePlan"
+        if self._columns is not None:
+            return "{}(func_expr={}, columns={})".format(
+                plan, self._func_expr, self._columns
+            )
         return "{}(func_expr={})".format(plan, self._func_expr)
 
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self.func_expr, self.alias, self.do_unnest))
+        return hash(
+            (
+                super().__hash__(),
+                self.func_expr,
+                self.alias,
+                self.do_unnest,
+                tuple(self.columns or []),
+            )
+        )
@@ -42,6 +42,8 @@ class ShowInfoPlan(AbstractPlan):
             return "ShowTablePlan"
         elif self._show_type == ShowType.CONFIGS:
             return "ShowConfigPlan"
+        elif self._show_type == ShowType.FUNCTION_STATS:
+            return "ShowFunctionStatsPlan"
 
     def __hash__(self) -> int:
         return hash((super().__hash__(), self.show_type, self.show_val))
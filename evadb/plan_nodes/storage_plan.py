@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
+
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.parser.table_ref import TableRef
@@ -34,6 +36,7 @@ class StoragePlan(AbstractPlan):
         curr_shard (int): current curr_shard if data is sharded
         sampling_rate (int): uniform sampling rate
         sampling_type (str): special sampling type like IFRAMES
+        columns (List[str]): columns to read from storage, all if None
     """
 
     def __init__(
@@ -50,6 +53,7 @@ class StoragePlan(AbstractPlan):
         batch_mem_size: int = 30000000,
         sampling_type: str = None,
         chunk_params: dict = {},
+        columns: List[str] = None,
     ):
         super().__init__(PlanOprType.STORAGE_PLAN)
         self._table = table
@@ -64,6 +68,7 @@ class StoragePlan(AbstractPlan):
         self._sampling_rate = sampling_rate
         self._sampling_type = sampling_type
         self.chunk_params = chunk_params
+        self._columns = columns
 
     @property
     def table(self):
@@ -109,6 +114,10 @@ class StoragePlan(AbstractPlan):
     def sampling_type(self):
         return self._sampling_type
 
+    @property
+    def columns(self):
+        return self._columns
+
     def __str__(self):
         return "StoragePlan(video={}, \
             table_ref={},\
@@ -120,7 +129,8 @@ class StoragePlan(AbstractPlan):
             curr_shard={}, \
             predicate={}, \
             sampling_rate={}, \
-            sampling_type={})".format(
+            sampling_type={}, \
+            columns={})".format(
             self._table,
             self._table_ref,
             self._batch_mem_size,
@@ -132,6 +142,7 @@ class StoragePlan(AbstractPlan):
             self._predicate,
             self._sampling_rate,
             self._sampling_type,
+            self._columns,
         )
 
     def __hash__(self) -> int:
@@ -150,5 +161,6 @@ class StoragePlan(AbstractPlan):
                 self.sampling_rate,
                 self.sampling_type,
                 frozenset(self.chunk_params.items()),
+                tuple(self.columns or []),
             )
         )
@@ -14,13 +14,14 @@
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Dict, Iterator
+from typing import Dict, Iterator, List
 
 import pandas as pd
 
 from evadb.models.storage.batch import Batch
 from evadb.utils.errors import DatasetFileNotFoundError
-from evadb.utils.generic_utils import get_size
+from evadb.utils.generic_utils import get_nbytes
+from evadb.utils.stats import batch_size_limit
 
 
 class AbstractReader(metaclass=ABCMeta):
@@ -50,17 +51,24 @@ class AbstractReader(metaclass=ABCMeta):
         """
 
         data_batch = []
-        row_size = None
+        batch_size = 0
         for data in self._read():
-            if row_size is None:
-                row_size = 0
-                row_size = get_size(data)
             data_batch.append(data)
-            if len(data_batch) * row_size >= self.batch_mem_size:
-                yield Batch(pd.DataFrame(data_batch))
+            batch_size += get_nbytes(data)
+            # an adaptive batch size can change between two batches
+            if batch_size >= batch_size_limit(self.batch_mem_size):
+                yield self._create_batch(data_batch)
                 data_batch = []
+                batch_size = 0
         if data_batch:
-            yield Batch(pd.DataFrame(data_batch))
+            yield self._create_batch(data_batch)
+
+    def _create_batch(self, data_batch: List[Dict]) -> Batch:
+        batch = Batch(pd.DataFrame(data_batch))
+        # frames of the same shape are stored in one (N, H, W, C) buffer, which
+        # the functions consume without stacking them again
+        batch.make_tensor_columns_contiguous()
+        return batch
 
     @abstractmethod
     def _read(self) -> Iterator[Dict]:
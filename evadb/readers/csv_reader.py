@@ -12,14 +12,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+from typing import Dict, Iterator, List
 
 import numpy as np
 import pandas as pd
 
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.models.storage.batch import Batch
 from evadb.readers.abstract_reader import AbstractReader
 from evadb.utils.logging_manager import logger
+from evadb.utils.stats import batch_size_limit
+
+# rows parsed by pandas at a time
+CSV_CHUNK_SIZE = 10000
 
 
 class CSVReader(AbstractReader):
@@ -34,14 +39,42 @@ class CSVReader(AbstractReader):
         self._column_list = column_list
         super().__init__(*args, **kwargs)
 
+    def read(self) -> Iterator[Batch]:
+        """
+        Yields the pandas chunks of the CSV file as batches, without splitting
+        them into rows. The chunks are concatenated up to the batch memory size.
+        """
+        chunks = []
+        batch_size = 0
+        for chunk in self._read_chunks():
+            chunks.append(chunk)
+            batch_size += int(chunk.memory_usage(index=False, deep=True).sum())
+            # an adaptive batch size can change between two batches
+            if batch_size >= batch_size_limit(self.batch_mem_size):
+                yield self._create_chunk_batch(chunks)
+                chunks = []
+                batch_size = 0
+        if chunks:
+            yield self._create_chunk_batch(chunks)
+
+    def _create_chunk_batch(self, chunks: List[pd.DataFrame]) -> Batch:
+        batch = Batch(pd.concat(chunks, ignore_index=True))
+        batch.make_tensor_columns_contiguous()
+        return batch
+
     def _read(self) -> Iterator[Dict]:
+        for chunk in self._read_chunks():
+            for chunk_index, chunk_row in chunk.iterrows():
+                yield chunk_row
+
+    def _read_chunks(self) -> Iterator[pd.DataFrame]:
         # TODO: What is a good location to put this code?
         def convert_csv_string_to_ndarray(row_string):
             """
             Convert a string of comma separated values to a numpy
             float array
             """
-            return np.array([np.float32(val) for val in row_string.split(",")])
+            return np.array(row_string.split(","), dtype=np.float32)
 
         logger.info("Reading CSV frames")
 
@@ -54,7 +87,9 @@ class CSVReader(AbstractReader):
         ]
 
         col_map = {col.name: col for col in self._column_list}
-        for chunk in pd.read_csv(self.file_url, chunksize=512, usecols=col_list_names):
+        for chunk in pd.read_csv(
+            self.file_url, chunksize=CSV_CHUNK_SIZE, usecols=col_list_names
+        ):
             # apply the required conversions
             for col in chunk.columns:
                 # TODO: Is there a better way to do this?
@@ -65,6 +100,4 @@ class CSVReader(AbstractReader):
                     # convert the string to a numpy array
                     chunk[col] = chunk[col].apply(convert_csv_string_to_ndarray)
 
-            # yield the chunk
-            for chunk_index, chunk_row in chunk.iterrows():
-                yield chunk_row
+            yield chunk
@@ -138,9 +138,10 @@ async def handle_request(evadb: EvaDBDatabase, client_writer, request_message):
 
     logger.debug(response)
 
-    response_data = Response.serialize(response)
+    # the frame buffers of the batch are written without copying them
+    response_data = Response.serialize_to_buffers(response)
 
-    client_writer.write(b"%d\n" % len(response_data))
-    client_writer.write(response_data)
+    client_writer.write(b"%d\n" % sum(data.nbytes for data in response_data))
+    client_writer.writelines(response_data)
 
     return response
@@ -15,10 +15,12 @@
 from abc import ABCMeta, abstractmethod
 from typing import Iterator
 
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.expression.abstract_expression import AbstractExpression
 from evadb.models.storage.batch import Batch
+from evadb.utils.generic_utils import get_ndarray_serializer
 
 
 class AbstractStorageEngine(metaclass=ABCMeta):
@@ -32,6 +34,17 @@ class AbstractStorageEngine(metaclass=ABCMeta):
     def __init__(self, db: EvaDBDatabase):
         self.db = db
 
+    def _ndarray_serializer(self, table: TableCatalogEntry, column: ColumnCatalogEntry):
+        """Serializer of the values of an NDARRAY column, as configured by
+        `ndarray_serialization`. Any of them is read by
+        `NdArraySerializer.deserialize`."""
+        serialization = self.db.catalog().get_configuration_catalog_value(
+            "ndarray_serialization", "raw"
+        )
+        if isinstance(serialization, dict):
+            serialization = serialization.get(f"{table.name}.{column.name}", "raw")
+        return get_ndarray_serializer(serialization)
+
     @abstractmethod
     def create(self, table: TableCatalogEntry):
         """Interface that implements all the necessary task required for
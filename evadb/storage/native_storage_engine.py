@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Iterator, List
+from typing import Any, Dict, Iterator, List
 
 import numpy as np
 import pandas as pd
@@ -28,7 +28,7 @@ from evadb.database import EvaDBDatabase
 from evadb.models.storage.batch import Batch
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
 from evadb.third_party.databases.interface import get_database_handler
-from evadb.utils.generic_utils import PickleSerializer, rebatch
+from evadb.utils.generic_utils import NdArraySerializer, rebatch
 from evadb.utils.logging_manager import logger
 
 
@@ -72,11 +72,13 @@ def create_table(uri: str, table_name: str, columns: dict):
     session.close()
 
 
-def _dict_to_sql_row(dict_row: dict, columns: List[ColumnCatalogEntry]):
+def _dict_to_sql_row(
+    dict_row: dict, columns: List[ColumnCatalogEntry], serializers: Dict[str, Any]
+):
     # Serialize numpy data
     for col in columns:
         if col.type == ColumnType.NDARRAY:
-            dict_row[col.name] = PickleSerializer.serialize(dict_row[col.name])
+            dict_row[col.name] = serializers[col.name].serialize(dict_row[col.name])
         elif isinstance(dict_row[col.name], (np.generic,)):
             # Sqlalchemy does not consume numpy generic data types
             # convert numpy datatype to python generic datatype using tolist()
@@ -93,7 +95,7 @@ def _deserialize_sql_row(sql_row: tuple, columns: List[ColumnCatalogEntry]):
     for idx, col in enumerate(columns):
         # hack, we skip deserializing if sql_row[col.name] is not of type bytes
         if col.type == ColumnType.NDARRAY and isinstance(sql_row[col.name], bytes):
-            dict_row[col.name] = PickleSerializer.deserialize(sql_row[idx])
+            dict_row[col.name] = NdArraySerializer.deserialize(sql_row[idx])
         else:
             dict_row[col.name] = sql_row[idx]
     return dict_row
@@ -141,11 +143,16 @@ class NativeStorageEngine(AbstractStorageEngine):
             # Retrieve the SQLAlchemy table object for the existing table
             table_to_update = Table(table.name, metadata, autoload_with=engine)
             columns = rows.frames.keys()
+            serializers = {
+                col.name: self._ndarray_serializer(table, col)
+                for col in table.columns
+                if col.type == ColumnType.NDARRAY
+            }
             data = []
             # Todo: validate the data type before inserting into the table
             for record in rows.frames.values:
                 row_data = {col: record[idx] for idx, col in enumerate(columns)}
-                data.append(_dict_to_sql_row(row_data, table.columns))
+                data.append(_dict_to_sql_row(row_data, table.columns, serializers))
 
             Session = sessionmaker(bind=engine)
             session = Session()
@@ -0,0 +1,386 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import operator
+import shutil
+import sys
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.arrow_batch import ArrowBatch, table_to_frames
+from evadb.models.storage.batch import Batch, stack_tensor_cells
+from evadb.parser.alias import Alias
+from evadb.parser.table_ref import TableInfo
+from evadb.storage.abstract_storage_engine import AbstractStorageEngine
+from evadb.utils.generic_utils import NdArraySerializer
+from evadb.utils.logging_manager import logger
+from evadb.utils.stats import batch_size_limit
+
+# suffix of the `file_url` of the structured tables stored in Parquet files
+PARQUET_FILE_FORMAT = "parquet"
+
+# rows of a row group, the unit of the reads and of the min/max statistics
+ROW_GROUP_SIZE = 65536
+
+# file of the table directory holding the largest row id handed out, so that the
+# ids of the deleted rows are never reused
+LAST_ROW_ID_FILE = "_last_row_id"
+
+_ARROW_TYPES = {
+    ColumnType.BOOLEAN: pa.bool_(),
+    ColumnType.INTEGER: pa.int64(),
+    ColumnType.FLOAT: pa.float64(),
+    ColumnType.TEXT: pa.string(),
+}
+
+# comparisons with a constant, on the side of the column
+_COMPARISONS = {
+    ExpressionType.COMPARE_EQUAL: operator.eq,
+    ExpressionType.COMPARE_GREATER: operator.gt,
+    ExpressionType.COMPARE_LESSER: operator.lt,
+    ExpressionType.COMPARE_GEQ: operator.ge,
+    ExpressionType.COMPARE_LEQ: operator.le,
+}
+_SWAPPED = {
+    operator.eq: operator.eq,
+    operator.gt: operator.lt,
+    operator.lt: operator.gt,
+    operator.ge: operator.le,
+    operator.le: operator.ge,
+}
+
+
+class ParquetStorageEngine(AbstractStorageEngine):
+    """Storage engine of the structured tables backed by Parquet files.
+
+    The table is a directory of append-only Parquet files, one per write, split
+    into row groups of `ROW_GROUP_SIZE` rows with per-column min/max statistics.
+    The columns are written and read as whole Arrow arrays, without per-row
+    work: NDARRAY cells of the same shape and dtype are stored as a fixed shape
+    tensor and read back as views on one contiguous array, the other NDARRAY
+    cells are serialized with `NdArraySerializer`, Parquet compresses the pages.
+    The row ids are never reused, even after the rows holding the largest ids are
+    deleted.
+    """
+
+    def __init__(self, db: EvaDBDatabase):
+        super().__init__(db)
+        self._serializer = NdArraySerializer()
+
+    def create(self, table: TableCatalogEntry, **kwargs):
+        Path(table.file_url).mkdir(parents=True, exist_ok=True)
+
+    def drop(self, table: TableCatalogEntry):
+        try:
+            shutil.rmtree(table.file_url, ignore_errors=True)
+        except Exception as e:
+            err_msg = f"Failed to drop the table {table.name} with Exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def write(self, table: TableCatalogEntry, rows: Batch):
+        """
+        Append rows to the table, as a new Parquet file.
+
+        Arguments:
+            table: table metadata object to write into
+            rows : batch to be persisted in the storage.
+        """
+        if rows.empty():
+            return
+        try:
+            files = self._data_files(table)
+            start = self._last_row_id(table, files) + 1
+            frames = rows.frames
+            arrays = [pa.array(np.arange(start, start + len(rows), dtype=np.int64))]
+            names = [IDENTIFIER_COLUMN]
+            for col in table.columns:
+                if col.name in (IDENTIFIER_COLUMN, ROW_NUM_COLUMN):
+                    continue
+                if col.name in frames:
+                    values = frames[col.name].to_numpy()
+                else:
+                    values = np.full(len(rows), None, dtype=object)
+                arrays.append(self._to_arrow(values, col.type))
+                names.append(col.name)
+
+            path = Path(table.file_url) / "part-{:08d}.parquet".format(
+                self._file_number(files[-1]) + 1 if files else 0
+            )
+            self._write_table(pa.Table.from_arrays(arrays, names=names), path)
+        except Exception as e:
+            err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def read(
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[str] = None,
+        predicate: AbstractExpression = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the table and return a batch iterator for the tuples.
+
+        Argument:
+            table: table metadata object of the table to read
+            batch_mem_size (int): memory size of the batch read from storage
+            columns (List[str]): columns to read, all the columns if None
+            predicate (AbstractExpression): the row groups whose min/max
+                statistics cannot satisfy it are skipped, the rows of the other
+                row groups are returned unfiltered
+        Return:
+            Iterator of Batch read.
+        """
+        try:
+            as_arrow = (
+                self.db.catalog().get_configuration_catalog_value(
+                    "batch_backend", "pandas"
+                )
+                == "arrow"
+            )
+            if columns is not None:
+                columns = [col for col in columns if col != ROW_NUM_COLUMN]
+                if IDENTIFIER_COLUMN not in columns:
+                    columns = [IDENTIFIER_COLUMN] + columns
+            column_types = {col.name: col.type for col in table.columns}
+            bounds = _predicate_bounds(predicate)
+
+            for path in self._data_files(table):
+                parquet_file = pq.ParquetFile(path)
+                for idx in range(parquet_file.num_row_groups):
+                    if not _row_group_may_match(
+                        parquet_file.metadata.row_group(idx), bounds
+                    ):
+                        continue
+                    row_group = parquet_file.read_row_group(idx, columns=columns)
+                    yield from self._to_batches(
+                        row_group, column_types, batch_mem_size, as_arrow
+                    )
+        except Exception as e:
+            err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def delete(
+        self,
+        table: TableCatalogEntry,
+        predicate: AbstractExpression,
+        alias: Alias = None,
+    ):
+        """Delete the rows of the table satisfying the predicate. The files with
+        deleted rows are rewritten.
+
+        Argument:
+            table: table metadata object of the table
+            predicate: rows to remove
+            alias: alias of the table the columns of the predicate refer to
+        """
+        try:
+            column_types = {col.name: col.type for col in table.columns}
+            files = self._data_files(table)
+            if files:
+                # deleting the rows of the last file would lower the row ids of
+                # the next writes
+                self._write_last_row_id(table, self._last_row_id(table, files))
+            for path in files:
+                data = pq.read_table(path)
+                batch = next(
+                    self._to_batches(data, column_types, sys.maxsize, False),
+                    None,
+                )
+                if batch is None:
+                    continue
+                if alias is not None:
+                    batch.modify_column_alias(alias)
+                outcomes = predicate.evaluate(batch).frames.iloc[:, 0]
+                deleted = outcomes.fillna(False).to_numpy(dtype=bool)
+                if not deleted.any():
+                    continue
+                if deleted.all():
+                    path.unlink()
+                else:
+                    kept = pa.array(~deleted)
+                    self._write_table(data.filter(kept), path)
+        except Exception as e:
+            err_msg = (
+                f"Failed to delete from the table {table.name} with exception {str(e)}"
+            )
+            logger.exception(err_msg)
+            raise Exception(err_msg)
+
+    def rename(self, old_table: TableCatalogEntry, new_name: TableInfo):
+        raise Exception("Rename not supported for structured data table")
+
+    def _data_files(self, table: TableCatalogEntry) -> List[Path]:
+        return sorted(Path(table.file_url).glob("part-*.parquet"))
+
+    def _file_number(self, path: Path) -> int:
+        return int(path.stem.split("-")[1])
+
+    def _last_row_id(self, table: TableCatalogEntry, files: List[Path]) -> int:
+        # the row ids only grow, the last file holds the largest one unless its
+        # rows were deleted, which records the id in LAST_ROW_ID_FILE first
+        last_id = 0
+        path = Path(table.file_url) / LAST_ROW_ID_FILE
+        if path.exists():
+            last_id = int(path.read_text())
+        if not files:
+            return last_id
+        metadata = pq.ParquetFile(files[-1]).metadata
+        idx = metadata.schema.names.index(IDENTIFIER_COLUMN)
+        for row_group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(row_group).column(idx).statistics
+            if statistics is not None and statistics.has_min_max:
+                last_id = max(last_id, statistics.max)
+        return last_id
+
+    def _write_last_row_id(self, table: TableCatalogEntry, last_id: int):
+        path = Path(table.file_url) / LAST_ROW_ID_FILE
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(str(last_id))
+        tmp_path.replace(path)
+
+    def _write_table(self, data, path: Path):
+        # readers never see a partially written file
+        tmp_path = path.with_suffix(".tmp")
+        pq.write_table(
+            data, tmp_path, row_group_size=ROW_GROUP_SIZE, write_statistics=True
+        )
+        tmp_path.replace(path)
+
+    def _to_arrow(self, values: np.ndarray, column_type: ColumnType):
+        if column_type == ColumnType.NDARRAY:
+            tensor = stack_tensor_cells(values) if values.dtype == object else None
+            if tensor is not None and tensor.dtype != object:
+                return pa.FixedShapeTensorArray.from_numpy_ndarray(tensor)
+            # cells of different shapes or dtypes
+            return pa.array(
+                [self._serializer.serialize(value) for value in values],
+                type=pa.binary(),
+            )
+        if column_type in _ARROW_TYPES:
+            return pa.array(values, type=_ARROW_TYPES[column_type], from_pandas=True)
+        return pa.array(
+            [self._serializer.serialize(value) for value in values], type=pa.binary()
+        )
+
+    def _to_batches(
+        self, data, column_types: dict, batch_mem_size: int, as_arrow: bool
+    ) -> Iterator[Batch]:
+        data = data.append_column(ROW_NUM_COLUMN, data.column(IDENTIFIER_COLUMN))
+        # the serialized cells are deserialized in the frames of a pandas batch
+        pickled = [
+            field.name
+            for field in data.schema
+            if pa.types.is_binary(field.type)
+            and column_types.get(field.name) in (ColumnType.NDARRAY, ColumnType.ANY)
+        ]
+        text_columns = [
+            name
+            for name in data.column_names
+            if column_types.get(name) == ColumnType.TEXT
+        ]
+        row_bytes = max(1, data.nbytes // max(1, data.num_rows))
+        start = 0
+        while start < data.num_rows:
+            num_rows = max(1, batch_size_limit(batch_mem_size) // row_bytes)
+            chunk = data.slice(start, num_rows)
+            start += num_rows
+            if as_arrow and not pickled:
+                yield ArrowBatch(chunk)
+                continue
+            frames = table_to_frames(chunk)
+            for name in pickled:
+                values = np.empty(chunk.num_rows, dtype=object)
+                values[:] = [
+                    None if value is None else self._serializer.deserialize(value)
+                    for value in chunk.column(name).to_pylist()
+                ]
+                frames[name] = values
+            batch = Batch(frames)
+            batch.dictionary_encode(text_columns)
+            yield batch
+
+
+def _predicate_bounds(predicate: AbstractExpression) -> List[tuple]:
+    """(column, op, constant) of the comparisons of a conjunction between a
+    column and a constant, the row groups have to satisfy all of them"""
+    if predicate is None:
+        return []
+    if predicate.etype == ExpressionType.LOGICAL_AND:
+        return _predicate_bounds(predicate.children[0]) + _predicate_bounds(
+            predicate.children[1]
+        )
+    if not isinstance(predicate, ComparisonExpression):
+        return []
+    op = _COMPARISONS.get(predicate.etype)
+    left, right = predicate.children
+    if op is None:
+        return []
+    if isinstance(left, ConstantValueExpression) and isinstance(
+        right, TupleValueExpression
+    ):
+        left, right, op = right, left, _SWAPPED[op]
+    if isinstance(left, TupleValueExpression) and isinstance(
+        right, ConstantValueExpression
+    ):
+        return [(left.name, op, right.value)]
+    return []
+
+
+def _row_group_may_match(row_group, bounds: List[tuple]) -> bool:
+    if not bounds:
+        return True
+    statistics = {}
+    for idx in range(row_group.num_columns):
+        column = row_group.column(idx)
+        if column.statistics is not None and column.statistics.has_min_max:
+            statistics[column.path_in_schema] = column.statistics
+    for name, op, value in bounds:
+        stats = statistics.get(name)
+        if stats is None:
+            continue
+        try:
+            if not _range_may_match(stats.min, stats.max, op, value):
+                return False
+        except TypeError:
+            # values of incomparable types, e.g., a string and a number
+            continue
+    return True
+
+
+def _range_may_match(low, high, op: Callable, value) -> bool:
+    if op is operator.eq:
+        return low <= value <= high
+    if op is operator.gt:
+        return high > value
+    if op is operator.ge:
+        return high >= value
+    if op is operator.lt:
+        return low < value
+    return low <= value
@@ -16,7 +16,7 @@ from typing import Iterator, List
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import Table, inspect
+from sqlalchemy import Table, and_, func, inspect, or_, select
 from sqlalchemy.sql.expression import ColumnElement
 
 from evadb.catalog.catalog_type import ColumnType
@@ -26,16 +26,79 @@ from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.catalog.schema_utils import SchemaUtils
 from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
 from evadb.database import EvaDBDatabase
+from evadb.expression.abstract_expression import AbstractExpression, ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
 from evadb.parser.table_ref import TableInfo
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
-from evadb.utils.generic_utils import PickleSerializer, rebatch
+from evadb.utils.generic_utils import NdArraySerializer, rebatch
 from evadb.utils.logging_manager import logger
 
+# rows fetched by every page of a read
+SQL_FETCH_SIZE = 1000
+
 # Leveraging Dynamic schema in SQLAlchemy
 # https://sparrigan.github.io/sql/sqla/2016/01/03/dynamic-tables.html
 
 
+def predicate_to_filter_clause(
+    table: Table, predicate_node: AbstractExpression
+) -> "ColumnElement[bool]":
+    """Translate a predicate of comparisons between the columns of the table and
+    constants, combined with AND and OR, to a sqlalchemy filter clause."""
+    filter_clause = None
+    left = predicate_node.get_child(0)
+    right = predicate_node.get_child(1)
+
+    if isinstance(left, TupleValueExpression):
+        column = left.name
+        x = table.columns[column]
+    elif isinstance(left, ConstantValueExpression):
+        value = left.value
+        x = value
+    else:
+        left_filter_clause = predicate_to_filter_clause(table, left)
+
+    if isinstance(right, TupleValueExpression):
+        column = right.name
+        y = table.columns[column]
+    elif isinstance(right, ConstantValueExpression):
+        value = right.value
+        y = value
+    else:
+        right_filter_clause = predicate_to_filter_clause(table, right)
+
+    if isinstance(predicate_node, LogicalExpression):
+        if predicate_node.etype == ExpressionType.LOGICAL_AND:
+            filter_clause = and_(left_filter_clause, right_filter_clause)
+        elif predicate_node.etype == ExpressionType.LOGICAL_OR:
+            filter_clause = or_(left_filter_clause, right_filter_clause)
+
+    elif isinstance(predicate_node, ComparisonExpression):
+        assert (
+            predicate_node.etype != ExpressionType.COMPARE_CONTAINS
+            and predicate_node.etype != ExpressionType.COMPARE_IS_CONTAINED
+        ), f"Predicate type {predicate_node.etype} not supported in sql filters"
+
+        if predicate_node.etype == ExpressionType.COMPARE_EQUAL:
+            filter_clause = x == y
+        elif predicate_node.etype == ExpressionType.COMPARE_GREATER:
+            filter_clause = x > y
+        elif predicate_node.etype == ExpressionType.COMPARE_LESSER:
+            filter_clause = x < y
+        elif predicate_node.etype == ExpressionType.COMPARE_GEQ:
+            filter_clause = x >= y
+        elif predicate_node.etype == ExpressionType.COMPARE_LEQ:
+            filter_clause = x <= y
+        elif predicate_node.etype == ExpressionType.COMPARE_NEQ:
+            filter_clause = x != y
+
+    return filter_clause
+
+
 class SQLStorageEngine(AbstractStorageEngine):
     def __init__(self, db: EvaDBDatabase):
         """
@@ -44,25 +107,32 @@ class SQLStorageEngine(AbstractStorageEngine):
         super().__init__(db)
         self._sql_session = db.catalog().sql_config.session
         self._sql_engine = db.catalog().sql_config.engine
-        self._serializer = PickleSerializer
+        # reads the values of any of the configured ndarray serializations
+        self._serializer = NdArraySerializer
 
-    def _dict_to_sql_row(self, dict_row: dict, columns: List[ColumnCatalogEntry]):
+    def _column_to_sql_values(
+        self, table: TableCatalogEntry, column: pd.Series, col: ColumnCatalogEntry
+    ) -> List:
         # Serialize numpy data
-        for col in columns:
-            if col.type == ColumnType.NDARRAY:
-                dict_row[col.name] = self._serializer.serialize(dict_row[col.name])
-            elif isinstance(dict_row[col.name], (np.generic,)):
-                # Sqlalchemy does not consume numpy generic data types
-                # convert numpy datatype to python generic datatype using tolist()
-                # eg. np.int64 -> int
-                # https://stackoverflow.com/a/53067954
-                dict_row[col.name] = dict_row[col.name].tolist()
-        return dict_row
+        if col.type == ColumnType.NDARRAY:
+            serializer = self._ndarray_serializer(table, col)
+            return [serializer.serialize(value) for value in column]
+        # Sqlalchemy does not consume numpy generic data types, tolist()
+        # converts the column to python generic datatypes, eg. np.int64 -> int
+        # https://stackoverflow.com/a/53067954
+        values = column.tolist()
+        if column.dtype == object:
+            # the cells of object columns are returned as they are
+            values = [
+                value.tolist() if isinstance(value, np.generic) else value
+                for value in values
+            ]
+        return values
 
     def _deserialize_sql_row(self, sql_row: dict, columns: List[ColumnCatalogEntry]):
         # Deserialize numpy data
         dict_row = {}
-        for idx, col in enumerate(columns):
+        for col in columns:
             if col.type == ColumnType.NDARRAY:
                 dict_row[col.name] = self._serializer.deserialize(sql_row[col.name])
             else:
@@ -85,6 +155,23 @@ class SQLStorageEngine(AbstractStorageEngine):
             logger.exception(err_msg)
             raise Exception(err_msg)
 
+    def _read_pages(self, connection, table: Table, query) -> Iterator:
+        row_id = table.columns[IDENTIFIER_COLUMN]
+        # the rows written while the table is scanned are not read
+        last_row_id = connection.execute(select(func.max(row_id))).scalar()
+        if last_row_id is None:
+            return
+        query = query.where(row_id <= last_row_id).order_by(row_id)
+        page_query = query.limit(SQL_FETCH_SIZE)
+        while True:
+            page = connection.execute(page_query).fetchall()
+            yield from page
+            if len(page) < SQL_FETCH_SIZE:
+                return
+            page_query = query.where(
+                row_id > page[-1]._mapping[IDENTIFIER_COLUMN]
+            ).limit(SQL_FETCH_SIZE)
+
     def create(self, table: TableCatalogEntry, **kwargs):
         """
         Create an empty table in sql.
@@ -146,8 +233,6 @@ class SQLStorageEngine(AbstractStorageEngine):
         """
         try:
             table_to_update = self._try_loading_table_via_reflection(table.name)
-            columns = rows.frames.keys()
-            data = []
 
             # During table writes, assume row_id is automatically handled by
             # the sqlalchemy engine. Another assumption we make here is the
@@ -159,14 +244,16 @@ class SQLStorageEngine(AbstractStorageEngine):
             ]
 
             # Todo: validate the data type before inserting into the table
-            for record in rows.frames.values:
-                row_data = {
-                    col: record[idx]
-                    for idx, col in enumerate(columns)
-                    if col != ROW_NUM_COLUMN
-                }
-                data.append(self._dict_to_sql_row(row_data, table_columns))
-            self._sql_session.execute(table_to_update.insert(), data)
+            # The columns are converted as a whole and inserted with one
+            # executemany, instead of converting every cell of every row
+            column_names = [col.name for col in table_columns]
+            column_values = [
+                self._column_to_sql_values(table, rows.frames[col.name], col)
+                for col in table_columns
+            ]
+            data = [dict(zip(column_names, values)) for values in zip(*column_values)]
+            if data:
+                self._sql_session.execute(table_to_update.insert(), data)
             self._sql_session.commit()
         except Exception as e:
             err_msg = f"Failed to update the table {table.name} with exception {str(e)}"
@@ -174,7 +261,11 @@ class SQLStorageEngine(AbstractStorageEngine):
             raise Exception(err_msg)
 
     def read(
-        self, table: TableCatalogEntry, batch_mem_size: int = 30000000
+        self,
+        table: TableCatalogEntry,
+        batch_mem_size: int = 30000000,
+        columns: List[str] = None,
+        predicate: AbstractExpression = None,
     ) -> Iterator[Batch]:
         """
         Reads the table and return a batch iterator for the
@@ -183,18 +274,50 @@ class SQLStorageEngine(AbstractStorageEngine):
         Argument:
             table: table metadata object of the table to read
             batch_mem_size (int): memory size of the batch read from storage
+            columns (List[str]): columns to read, all the columns if None
+            predicate (AbstractExpression): only the rows satisfying it are read,
+                it is translated with `predicate_to_filter_clause`
         Return:
             Iterator of Batch read.
         """
         try:
             table_to_read = self._try_loading_table_via_reflection(table.name)
-            result = self._sql_session.execute(table_to_read.select()).fetchall()
-            result_iter = (
-                self._deserialize_sql_row(row._asdict(), table.columns)
-                for row in result
-            )
-            for df in rebatch(result_iter, batch_mem_size):
-                yield Batch(pd.DataFrame(df))
+            # the row id is always read as it is the key of the rows
+            table_columns = [
+                col
+                for col in table.columns
+                if columns is None
+                or col.name == IDENTIFIER_COLUMN
+                or col.name in columns
+            ]
+            query = table_to_read.select()
+            if columns is not None:
+                query = query.with_only_columns(
+                    *[table_to_read.columns[col.name] for col in table_columns]
+                )
+            if predicate is not None:
+                query = query.where(
+                    predicate_to_filter_clause(table_to_read, predicate)
+                )
+            # the rows are read on a connection of their own, in pages keyed on
+            # the row id. No cursor stays open while a batch is consumed, so the
+            # catalog session can commit in the middle of the scan, e.g., the
+            # writes of CREATE TABLE AS SELECT, without invalidating the read or
+            # waiting on its locks. The connection is closed when the consumer
+            # stops early, e.g., on a LIMIT.
+            with self._sql_engine.connect() as connection:
+                result_iter = (
+                    self._deserialize_sql_row(row._asdict(), table_columns)
+                    for row in self._read_pages(connection, table_to_read, query)
+                )
+                # the text columns often repeat a few values, e.g., object labels
+                text_columns = [
+                    col.name for col in table_columns if col.type == ColumnType.TEXT
+                ]
+                for df in rebatch(result_iter, batch_mem_size):
+                    batch = Batch(pd.DataFrame(df))
+                    batch.dictionary_encode(text_columns)
+                    yield batch
         except Exception as e:
             err_msg = f"Failed to read the table {table.name} with exception {str(e)}"
             logger.exception(err_msg)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_utils import is_parquet_table
 from evadb.catalog.models.table_catalog import TableCatalogEntry
 from evadb.database import EvaDBDatabase
 from evadb.storage.abstract_storage_engine import AbstractStorageEngine
@@ -22,6 +23,7 @@ from evadb.storage.native_storage_engine import NativeStorageEngine
 from evadb.storage.pdf_storage_engine import PDFStorageEngine
 from evadb.storage.sqlite_storage_engine import SQLStorageEngine
 from evadb.storage.video_storage_engine import DecordStorageEngine
+from evadb.utils.generic_utils import try_to_import_pyarrow
 
 
 class StorageEngine:
@@ -46,6 +48,11 @@ class StorageEngine:
         cls._lazy_initialize_storages(db)
         if table is None:
             raise ValueError("Expected TableCatalogEntry, got None")
+        if is_parquet_table(table):
+            try_to_import_pyarrow()
+            from evadb.storage.parquet_storage_engine import ParquetStorageEngine
+
+            return ParquetStorageEngine(db)
         if table.table_type in cls.storages:
             return cls.storages[table.table_type](db)
 
@@ -53,6 +53,19 @@ class FaissVectorStore(VectorStore):
         import faiss
 
         self._index = faiss.IndexIDMap2(faiss.IndexHNSWFlat(vector_dim, 32))
+        # the ids of the index loaded from disk are gone
+        self._existing_id_set = set([])
+
+    @property
+    def size(self) -> int:
+        """Number of vectors in the index."""
+        return self._index.ntotal if self._index is not None else 0
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the indexed vectors."""
+        assert self._index is not None, "Index does not exists."
+        return self._index.d
 
     def add(self, payload: List[FeaturePayload]):
         assert self._index is not None, "Please create an index before adding features."
@@ -82,6 +95,11 @@ class FaissVectorStore(VectorStore):
             ids.append(idx)
         return VectorIndexQueryResult(distances, ids)
 
+    def reconstruct(self, ids: List[int]) -> np.ndarray:
+        """Returns the stored embeddings of `ids`, one row per id."""
+        assert self._index is not None, "Cannot reconstruct as index does not exists."
+        return np.vstack([self._index.reconstruct(int(id)) for id in ids])
+
     def delete(self):
         index_path = Path(self._index_path)
         if index_path.exists():
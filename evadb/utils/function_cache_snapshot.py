@@ -0,0 +1,307 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import gzip
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from evadb.catalog.models.utils import FunctionCatalogEntry
+from evadb.utils.errors import CatalogError
+from evadb.utils.generic_utils import NdArraySerializer
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.logging_manager import logger
+from evadb.utils.semantic_cache import SemanticCache, get_semantic_cache_path
+
+if TYPE_CHECKING:
+    from evadb.catalog.catalog_manager import CatalogManager
+
+# version 1 snapshots were pickled, they are not loaded as unpickling a file can
+# run arbitrary code
+SNAPSHOT_VERSION = 2
+
+# `Function[row_id](` in function signatures and `table.column[row_id]` in column
+# signatures, see FunctionExpression.signature and TupleValueExpression.signature
+_FUNCTION_SIGNATURE = re.compile(r"(\w+)\[(\d+)\]\(")
+_COLUMN_SIGNATURE = re.compile(r"(\w+)\.(\w+)\[(\d+)\]")
+
+
+def export_function_cache(
+    catalog: "CatalogManager", function_obj: FunctionCatalogEntry, path: str
+) -> Dict[str, int]:
+    """Snapshot the caches of `function_obj` into the file at `path`.
+
+    The snapshot holds the content of every function cache built on the function,
+    along with the signature it is registered with in the function cache catalog,
+    and the responses and prompt embeddings of its semantic cache if it has one.
+
+    Returns:
+        Dict[str, int]: the number of exported entries per kind of cache
+    """
+    caches = []
+    for entry in catalog.get_function_cache_catalog_entries_by_function(function_obj):
+        if not Path(entry.cache_path).exists():
+            continue
+        items, _ = _encode_items(DiskKVCache(entry.cache_path).items(), entry.name)
+        caches.append({"name": entry.name, "args": list(entry.args), "items": items})
+
+    semantic_entries, embeddings = [], np.empty((0, 0), dtype="float32")
+    semantic_cache_path = get_semantic_cache_path(function_obj)
+    if semantic_cache_path is not None and semantic_cache_path.exists():
+        semantic_cache = SemanticCache(str(semantic_cache_path), embed=None)
+        semantic_entries, embeddings = semantic_cache.export_entries()
+    encoded_entries, rows = _encode_items(semantic_entries, "semantic cache")
+    embeddings = embeddings[rows] if rows else np.empty((0, 0), dtype="float32")
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "function": {"name": function_obj.name, "row_id": function_obj.row_id},
+        "caches": caches,
+        "semantic_cache": {
+            "entries": encoded_entries,
+            "embeddings": _encode(embeddings),
+        },
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+
+    return {
+        "function_cache_entries": sum(len(cache["items"]) for cache in caches),
+        "semantic_cache_entries": len(encoded_entries),
+    }
+
+
+def import_function_cache(
+    catalog: "CatalogManager", function_obj: FunctionCatalogEntry, path: str
+) -> Dict[str, int]:
+    """Warm up the caches of `function_obj` with the snapshot at `path`.
+
+    The row ids in the cache signatures of the snapshot are remapped to the
+    functions and columns of this database by name. A cache referring to a table
+    or function that does not exist is skipped, as no query could ever hit it.
+
+    Returns:
+        Dict[str, int]: the number of imported entries per kind of cache
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        raise CatalogError(
+            f"{path} is not a function cache snapshot, the snapshots exported "
+            "before version 2 have to be exported again"
+        )
+    version = snapshot.get("version")
+    if version != SNAPSHOT_VERSION:
+        raise CatalogError(
+            f"Unsupported function cache snapshot version {version} in {path}"
+        )
+
+    num_cache_entries = 0
+    for cache in snapshot["caches"]:
+        remapped = _remap_signature(catalog, snapshot["function"], function_obj, cache)
+        if remapped is None:
+            logger.warning(
+                f"Skipping cache {cache['name']} of {path}, it depends on a table or function that does not exist."
+            )
+            continue
+        name, args, function_depends, col_depends = remapped
+        entry = catalog.get_function_cache_catalog_entry_by_name(name)
+        if entry is None:
+            entry = catalog.insert_function_cache_catalog_entry_with_name(
+                name, function_obj, args, function_depends, col_depends
+            )
+        keys = [_decode(key) for key, _ in cache["items"]]
+        values = [_decode(value) for _, value in cache["items"]]
+        DiskKVCache(entry.cache_path).set_many(keys, values)
+        num_cache_entries += len(keys)
+
+    semantic_entries = [
+        (_decode(entry_id), _decode(entry))
+        for entry_id, entry in snapshot["semantic_cache"]["entries"]
+    ]
+    if semantic_entries:
+        semantic_cache_path = get_semantic_cache_path(function_obj)
+        if semantic_cache_path is None:
+            logger.warning(
+                f"Skipping the semantic cache of {path}, {function_obj.name} does not use a semantic cache."
+            )
+            semantic_entries = []
+        else:
+            semantic_cache = SemanticCache(str(semantic_cache_path), embed=None)
+            semantic_cache.import_entries(
+                semantic_entries, _decode(snapshot["semantic_cache"]["embeddings"])
+            )
+            semantic_cache.persist()
+
+    return {
+        "function_cache_entries": num_cache_entries,
+        "semantic_cache_entries": len(semantic_entries),
+    }
+
+
+def _encode_items(items, cache_name: str) -> Tuple[List[list], List[int]]:
+    """Encode the key-value pairs of a cache with `_encode`, skipping the pairs
+    holding values that cannot be encoded. Returns the encoded pairs and their
+    positions in `items`."""
+    encoded, positions = [], []
+    num_skipped = 0
+    for position, (key, value) in enumerate(items):
+        try:
+            encoded.append([_encode(key), _encode(value)])
+            positions.append(position)
+        except TypeError:
+            num_skipped += 1
+    if num_skipped:
+        logger.warning(
+            f"Skipped {num_skipped} entries of {cache_name}, their values cannot be exported."
+        )
+    return encoded, positions
+
+
+def _encode(value: Any) -> Any:
+    """Encode `value` as JSON data. The numpy arrays are stored as the raw bytes of
+    `NdArraySerializer`, and the other values that JSON cannot represent are
+    tagged, so that a snapshot is decoded without unpickling anything."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return {"scalar": _encode(np.asarray(value))}
+    if isinstance(value, np.ndarray):
+        if NdArraySerializer.is_typed(value):
+            data = NdArraySerializer().serialize(value)
+            return {"ndarray": base64.b64encode(data).decode()}
+        return {
+            "object_array": {
+                "shape": list(value.shape),
+                "cells": [_encode(cell) for cell in value.flat],
+            }
+        }
+    if isinstance(value, bytes):
+        return {"bytes": base64.b64encode(value).decode()}
+    if isinstance(value, (list, tuple)):
+        tag = "list" if isinstance(value, list) else "tuple"
+        return {tag: [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {"dict": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    raise TypeError(f"Cannot export values of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    ((tag, data),) = value.items()
+    if tag == "scalar":
+        return _decode(data)[()]
+    if tag == "ndarray":
+        data = base64.b64decode(data)
+        # deserialize falls back to pickle, which a snapshot must never reach
+        if not data.startswith(NdArraySerializer.MAGIC):
+            raise CatalogError("Invalid array in the function cache snapshot")
+        return NdArraySerializer.deserialize(data)
+    if tag == "object_array":
+        cells = np.empty(len(data["cells"]), dtype=object)
+        for idx, cell in enumerate(data["cells"]):
+            cells[idx] = _decode(cell)
+        return cells.reshape(data["shape"])
+    if tag == "bytes":
+        return base64.b64decode(data)
+    if tag == "list":
+        return [_decode(item) for item in data]
+    if tag == "tuple":
+        return tuple(_decode(item) for item in data)
+    if tag == "dict":
+        return {_decode(key): _decode(item) for key, item in data}
+    raise CatalogError(f"Invalid value {tag} in the function cache snapshot")
+
+
+def _remap_signature(
+    catalog: "CatalogManager",
+    exported_function: dict,
+    function_obj: FunctionCatalogEntry,
+    cache: dict,
+):
+    """Rewrite the row ids of the cache signature to the ones of this database.
+
+    Returns None if a referenced table, column or function cannot be resolved.
+    """
+    function_ids = {}
+    column_ids = {}
+    col_depends = []
+    unresolved = False
+
+    def remap_function(match: re.Match) -> str:
+        nonlocal unresolved
+        name, row_id = match.group(1), int(match.group(2))
+        if (name, row_id) not in function_ids:
+            if (
+                name == exported_function["name"]
+                and row_id == exported_function["row_id"]
+            ):
+                entry = function_obj
+            else:
+                entry = catalog.get_function_catalog_entry_by_name(name)
+            if entry is None:
+                unresolved = True
+                return match.group(0)
+            function_ids[(name, row_id)] = entry
+        entry = function_ids[(name, row_id)]
+        return f"{entry.name}[{entry.row_id}]("
+
+    def remap_column(match: re.Match) -> str:
+        nonlocal unresolved
+        owner, col_name = match.group(1), match.group(2)
+        key = (owner, col_name, int(match.group(3)))
+        if key not in column_ids:
+            column_ids[key] = _resolve_column(catalog, owner, col_name, col_depends)
+        if column_ids[key] is None:
+            unresolved = True
+            return match.group(0)
+        return f"{owner}.{col_name}[{column_ids[key]}]"
+
+    def remap(signature: str) -> str:
+        signature = _FUNCTION_SIGNATURE.sub(remap_function, signature)
+        return _COLUMN_SIGNATURE.sub(remap_column, signature)
+
+    name = remap(cache["name"])
+    args = tuple(remap(arg) for arg in cache["args"])
+    if unresolved:
+        return None
+    function_depends = [entry.row_id for entry in function_ids.values()]
+    return name, args, function_depends, col_depends
+
+
+def _resolve_column(
+    catalog: "CatalogManager", owner: str, col_name: str, col_depends: List[int]
+) -> Optional[int]:
+    # `owner` is either a table or a function whose output is consumed
+    if catalog.check_table_exists(owner):
+        table_obj = catalog.get_table_catalog_entry(owner)
+        col_obj = catalog.get_column_catalog_entry(table_obj, col_name)
+        if col_obj is None or col_obj.row_id is None:
+            return None
+        col_depends.append(col_obj.row_id)
+        return col_obj.row_id
+    function_obj = catalog.get_function_catalog_entry_by_name(owner)
+    if function_obj is None:
+        return None
+    for io_obj in function_obj.args + function_obj.outputs:
+        if io_obj.name == col_name:
+            return io_obj.row_id
+    return None
@@ -18,16 +18,19 @@ import inspect
 import os
 import pickle
 import shutil
+import struct
 import sys
 import uuid
 from pathlib import Path
 from typing import Iterator, List
 from urllib.parse import urlparse
 
+import numpy as np
 from aenum import AutoEnum, unique
 
 from evadb.configuration.constants import EvaDB_INSTALLATION_DIR
 from evadb.utils.logging_manager import logger
+from evadb.utils.stats import batch_size_limit
 
 
 def validate_kwargs(
@@ -184,24 +187,40 @@ def get_size(obj, seen=None):
     return size
 
 
+def get_nbytes(obj) -> int:
+    """Bytes held by `obj`: the buffer of numpy arrays, the size of strings and
+    other objects, plus the elements of lists, tuples, sets and dicts"""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return obj.nbytes + sum(get_nbytes(value) for value in obj.flat)
+        return obj.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(get_nbytes(k) + get_nbytes(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(get_nbytes(value) for value in obj)
+    return size
+
+
 def rebatch(it: Iterator, batch_mem_size: int = 30000000) -> Iterator:
     """
     Utility function to rebatch the rows
     Args:
         it (Iterator): an iterator for rows, every row is a dictionary
-        batch_mem_size (int): the maximum batch memory size
+        batch_mem_size (int or AdaptiveBatchSizer): the maximum batch memory size
     Yields:
         data_batch (List): a list of rows, every row is a dictionary
     """
     data_batch = []
-    row_size = None
+    batch_size = 0
     for row in it:
         data_batch.append(row)
-        if row_size is None:
-            row_size = get_size(data_batch)
-        if len(data_batch) * row_size >= batch_mem_size:
+        batch_size += get_nbytes(row)
+        # an adaptive batch size can change between two batches
+        if batch_size >= batch_size_limit(batch_mem_size):
             yield data_batch
             data_batch = []
+            batch_size = 0
     if data_batch:
         yield data_batch
 
@@ -250,14 +269,212 @@ def is_postgres_uri(db_uri):
 
 
 class PickleSerializer(object):
+    # Binary format of `serialize_to_buffers`: magic, number of out-of-band
+    # buffers, header size, buffer sizes, pickled header, then the buffers, each
+    # padded to `BUFFER_ALIGNMENT` bytes so numpy arrays on them stay aligned.
+    MAGIC = b"EVAOOB01"
+    BUFFER_ALIGNMENT = 64
+
     @classmethod
     def serialize(cls, data):
         return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def deserialize(cls, data):
+        if bytes(data[: len(cls.MAGIC)]) == cls.MAGIC:
+            return cls.deserialize_from_buffer(data)
         return pickle.loads(data)
 
+    @classmethod
+    def serialize_to_buffers(cls, data) -> List[memoryview]:
+        """Serialize `data` with pickle protocol 5, keeping the contiguous
+        buffers (numpy arrays, pandas blocks, ...) out of band.
+
+        The buffers are returned as memoryviews on the original memory, so the
+        result can be written to a socket without copying them. The
+        concatenation of the returned buffers is accepted by `deserialize`.
+        """
+        buffers = []
+        header = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        buffers = [buffer.raw() for buffer in buffers]
+        sizes = [buffer.nbytes for buffer in buffers]
+        prefix = cls.MAGIC + struct.pack(
+            f"<{2 + len(sizes)}Q", len(buffers), len(header), *sizes
+        )
+
+        parts = [memoryview(prefix), memoryview(header)]
+        offset = len(prefix) + len(header)
+        for buffer in buffers:
+            padding = -offset % cls.BUFFER_ALIGNMENT
+            parts.append(memoryview(bytes(padding)))
+            parts.append(buffer)
+            offset += padding + buffer.nbytes
+        return parts
+
+    @classmethod
+    def deserialize_from_buffer(cls, data):
+        """Deserialize the output of `serialize_to_buffers`. The arrays are
+        views on `data` if it is writable (e.g., a bytearray), otherwise `data`
+        is copied once so that they stay writable."""
+        view = memoryview(data)
+        if view.readonly:
+            view = memoryview(bytearray(view))
+        offset = len(cls.MAGIC)
+        num_buffers, header_size = struct.unpack_from("<2Q", view, offset)
+        offset += 16
+        sizes = struct.unpack_from(f"<{num_buffers}Q", view, offset)
+        offset += 8 * num_buffers
+
+        header = view[offset : offset + header_size]
+        offset += header_size
+        buffers = []
+        for size in sizes:
+            offset += -offset % cls.BUFFER_ALIGNMENT
+            buffers.append(view[offset : offset + size])
+            offset += size
+        return pickle.loads(header, buffers=buffers)
+
+
+class NdArraySerializer(object):
+    """Serialize numpy arrays as a dtype and shape header followed by their raw
+    bytes, optionally compressed with zstd or lz4. Object arrays whose cells are
+    all such arrays, e.g., a row of function outputs, are stored the same way.
+    The other values are pickled, and `deserialize` also reads pickled values, so
+    existing pickled rows stay readable.
+
+    Args:
+        compression (str): None, "zstd" or "lz4"
+    """
+
+    # Binary format: magic, codec, layout, the shape of the object array for the
+    # object layout, then the (compressed) arrays, each with its dtype and shape.
+    MAGIC = b"EVANDA01"
+    CODECS = {None: 0, "zstd": 1, "lz4": 2}
+    # booleans, numbers, datetimes and fixed size strings
+    DTYPE_KINDS = "biufcmMSU"
+    LAYOUT_ARRAY = 0
+    LAYOUT_OBJECT_ARRAY = 1
+
+    def __init__(self, compression: str = None):
+        if compression not in self.CODECS:
+            raise ValueError(f"Unsupported ndarray compression {compression}")
+        if compression == "zstd":
+            try_to_import_zstandard()
+        elif compression == "lz4":
+            try_to_import_lz4()
+        self._compression = compression
+
+    @classmethod
+    def _is_typed_array(cls, data) -> bool:
+        return isinstance(data, np.ndarray) and data.dtype.kind in cls.DTYPE_KINDS
+
+    @classmethod
+    def is_typed(cls, data) -> bool:
+        """True if `data` is stored as raw bytes, the other values are pickled"""
+        return cls._is_typed_array(data) or (
+            isinstance(data, np.ndarray)
+            and data.dtype == object
+            and data.size > 0
+            and all(cls._is_typed_array(cell) for cell in data.flat)
+        )
+
+    def serialize(self, data) -> bytes:
+        if not self.is_typed(data):
+            return PickleSerializer.serialize(data)
+        if data.dtype != object:
+            layout, arrays, header = self.LAYOUT_ARRAY, [data], b""
+        else:
+            layout, arrays = self.LAYOUT_OBJECT_ARRAY, list(data.flat)
+            header = struct.pack(f"<B{data.ndim}Q", data.ndim, *data.shape)
+
+        parts = []
+        for array in arrays:
+            dtype = array.dtype.str.encode()
+            parts.append(struct.pack("<B", len(dtype)) + dtype)
+            parts.append(struct.pack(f"<B{array.ndim}Q", array.ndim, *array.shape))
+            parts.append(array.tobytes())
+        payload = _compress(b"".join(parts), self._compression)
+        codec = self.CODECS[self._compression]
+        return self.MAGIC + struct.pack("<BB", codec, layout) + header + payload
+
+    @classmethod
+    def deserialize(cls, data):
+        if bytes(data[: len(cls.MAGIC)]) != cls.MAGIC:
+            return PickleSerializer.deserialize(data)
+        offset = len(cls.MAGIC)
+        codec, layout = struct.unpack_from("<BB", data, offset)
+        offset += 2
+        shape = None
+        if layout == cls.LAYOUT_OBJECT_ARRAY:
+            shape, offset = _unpack_shape(data, offset)
+
+        compression = next(name for name, code in cls.CODECS.items() if code == codec)
+        # the arrays are writable views on one buffer, as unpickled arrays are
+        payload = bytearray(_decompress(data[offset:], compression))
+        arrays = []
+        offset = 0
+        while offset < len(payload):
+            (dtype_size,) = struct.unpack_from("<B", payload, offset)
+            offset += 1
+            dtype = np.dtype(bytes(payload[offset : offset + dtype_size]).decode())
+            offset += dtype_size
+            array_shape, offset = _unpack_shape(payload, offset)
+            count = int(np.prod(array_shape))
+            array = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+            arrays.append(array.reshape(array_shape))
+            offset += count * dtype.itemsize
+
+        if layout == cls.LAYOUT_ARRAY:
+            return arrays[0]
+        # assigned one by one, numpy would broadcast arrays of the same shape
+        cells = np.empty(len(arrays), dtype=object)
+        for idx, array in enumerate(arrays):
+            cells[idx] = array
+        return cells.reshape(shape)
+
+
+def _unpack_shape(data, offset: int):
+    (ndim,) = struct.unpack_from("<B", data, offset)
+    shape = struct.unpack_from(f"<{ndim}Q", data, offset + 1)
+    return shape, offset + 1 + 8 * ndim
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    return data
+
+
+def _decompress(data, compression: str):
+    if compression == "zstd":
+        try_to_import_zstandard()
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(bytes(data))
+    if compression == "lz4":
+        try_to_import_lz4()
+        import lz4.frame
+
+        return lz4.frame.decompress(bytes(data))
+    return data
+
+
+def get_ndarray_serializer(serialization: str = "raw"):
+    """Serializer of NDARRAY values, `serialization` is "pickle", "raw" (the
+    header and raw bytes of `NdArraySerializer`), "zstd" or "lz4" (the raw bytes
+    compressed)"""
+    if serialization == "pickle":
+        return PickleSerializer
+    if serialization == "raw":
+        return NdArraySerializer()
+    return NdArraySerializer(compression=serialization)
+
 
 @unique
 class EvaDBEnum(AutoEnum):
@@ -393,6 +610,44 @@ def is_flaml_automl_available() -> bool:
 ##############################
 
 
+def try_to_import_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import pyarrow python package.
+                Please install it with `pip install pyarrow`."""
+        )
+
+
+def is_pyarrow_available() -> bool:
+    try:
+        try_to_import_pyarrow()
+        return True
+    except ValueError:  # noqa: E722
+        return False
+
+
+def try_to_import_zstandard():
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import zstandard python package.
+                Please install it with `pip install zstandard`."""
+        )
+
+
+def try_to_import_lz4():
+    try:
+        import lz4.frame  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            """Could not import lz4 python package.
+                Please install it with `pip install lz4`."""
+        )
+
+
 def try_to_import_pillow():
     try:
         import PIL  # noqa: F401
@@ -517,6 +772,15 @@ def try_to_import_openai():
                 Please install them with `pip install openai`."""
         )
 
+
+def is_openai_available() -> bool:
+    try:
+        try_to_import_openai()
+        return True
+    except ValueError:  # noqa: E722
+        return False
+
+
 def try_to_import_langchain_openai():
     try:
         import langchain_openai  # noqa: F401
@@ -12,10 +12,226 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import pickle
-from typing import Any
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from diskcache import FanoutCache
+import numpy as np
+import pandas as pd
+from diskcache import Disk, FanoutCache, Timeout
+
+from evadb.utils.generic_utils import NdArraySerializer, get_nbytes
+
+# seeds of the two 64-bit lanes of the row hash of the fixed-width columns
+_ROW_HASH_SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F)
+
+
+def _mix64(hashes: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer, a bijection of uint64 applied to every row
+    hashes = hashes ^ (hashes >> np.uint64(30))
+    hashes = hashes * np.uint64(0xBF58476D1CE4E5B9)
+    hashes = hashes ^ (hashes >> np.uint64(27))
+    hashes = hashes * np.uint64(0x94D049BB133111EB)
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+def _hash_fixed_width_rows(columns: List[np.ndarray], num_rows: int) -> np.ndarray:
+    """Hash the bytes of every row of the fixed-width columns into two 64-bit
+    lanes. The rows are laid out as one uint8 record matrix, which is hashed one
+    8-byte word at a time across all the rows."""
+    records = np.hstack(
+        [
+            np.ascontiguousarray(values).view(np.uint8).reshape(num_rows, -1)
+            for values in columns
+        ]
+    )
+    records = np.pad(records, ((0, 0), (0, -records.shape[1] % 8)))
+    words = np.ascontiguousarray(records).view("<u8")
+    lanes = np.empty((num_rows, 2), dtype=np.uint64)
+    for lane, seed in enumerate(_ROW_HASH_SEEDS):
+        hashes = np.full(num_rows, seed, dtype=np.uint64)
+        for word in words.T:
+            hashes = _mix64(hashes ^ word)
+        lanes[:, lane] = hashes
+    return lanes
+
+
+def build_cache_keys(frames: pd.DataFrame) -> List[bytes]:
+    """Compute one fixed-size cache key per row of `frames`.
+
+    Fixed-width columns (ints, floats, bools, ...) are hashed row-wise from their
+    column buffers with numpy, without a Python loop over the rows. Object columns
+    are then hashed cell by cell into a digest seeded with that row hash; numpy
+    arrays are hashed from their raw bytes together with dtype and shape, which
+    avoids pickling large frames.
+
+    Args:
+        frames (pd.DataFrame): the key columns, one cache key per row
+
+    Returns:
+        List[bytes]: 16-byte keys in the same order as the rows
+    """
+    num_rows = len(frames)
+    if num_rows == 0:
+        return []
+    fixed_width, variable_width = [], []
+    for _, column in frames.items():
+        values = column.to_numpy()
+        if values.dtype != object:
+            fixed_width.append(values)
+        else:
+            variable_width.append(values)
+
+    if fixed_width:
+        row_hashes = _hash_fixed_width_rows(fixed_width, num_rows).tobytes()
+    else:
+        row_hashes = bytes(16 * num_rows)
+    keys = [row_hashes[idx * 16 : (idx + 1) * 16] for idx in range(num_rows)]
+    if not variable_width:
+        return keys
+
+    digests = [hashlib.blake2b(key, digest_size=16) for key in keys]
+    for values in variable_width:
+        for value, digest in zip(values, digests):
+            if isinstance(value, np.ndarray):
+                value = np.ascontiguousarray(value)
+                cell = b"%s%r" % (value.dtype.str.encode(), value.shape)
+                cell += value.tobytes()
+            elif isinstance(value, str):
+                cell = value.encode()
+            else:
+                cell = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            # length prefix keeps variable sized cells from running together
+            digest.update(len(cell).to_bytes(8, "little"))
+            digest.update(cell)
+    return [digest.digest() for digest in digests]
+
+
+@dataclass
+class MemoryCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class DiskCacheStats:
+    """Entries removed from the disk cache, either because they outlived the ttl
+    (`expirations`) or to keep the cache within its size limit (`evictions`)."""
+
+    evictions: int = 0
+    expirations: int = 0
+
+
+class LRUMemoryCache:
+    """In-memory key value cache bounded by the total size of the stored values.
+
+    The least recently used entries are evicted once `max_size` bytes are
+    exceeded. Values larger than `max_size` are never admitted. An entry set with
+    `expire_at` is dropped on the first lookup after that time.
+
+    The cache is shared by the queries of all the connections, so every
+    operation holds a lock.
+
+    Args:
+        `max_size` (int): maximum number of bytes held by the cache
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = MemoryCacheStats()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.time():
+                self._size -= self._entries.pop(key)[1]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, expire_at: Optional[float] = None):
+        nbytes = get_nbytes(value)
+        if nbytes > self._max_size:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes, expire_at)
+            self._size += nbytes
+            while self._size > self._max_size:
+                _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+                self._size -= evicted_bytes
+                self.stats.evictions += 1
+                self.stats.evicted_bytes += evicted_bytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# The memory tier has to outlive a single query, while a DiskKVCache object is
+# created every time the optimizer enables the cache. Keep one tier per cache path.
+_memory_tiers: Dict[str, LRUMemoryCache] = {}
+_memory_tiers_lock = threading.Lock()
+
+
+def drop_memory_tier(path: str):
+    """Release the in-memory tier associated with the cache at `path`."""
+    with _memory_tiers_lock:
+        _memory_tiers.pop(str(path), None)
+
+
+class NdArrayDisk(Disk):
+    """diskcache `Disk` storing numpy values with `NdArraySerializer` instead of
+    pickle. The values pickled by the default `Disk` are still read.
+
+    Args:
+        `compression` (str, optional): None, "zstd" or "lz4"
+    """
+
+    def __init__(self, directory, compression: str = None, **kwargs):
+        super().__init__(directory, **kwargs)
+        self._serializer = NdArraySerializer(compression)
+
+    def store(self, value, read, **kwargs):
+        if not read and NdArraySerializer.is_typed(value):
+            value = self._serializer.serialize(value)
+        return super().store(value, read, **kwargs)
+
+    def fetch(self, mode, filename, value, read):
+        value = super().fetch(mode, filename, value, read)
+        if isinstance(value, bytes) and value.startswith(NdArraySerializer.MAGIC):
+            return NdArraySerializer.deserialize(value)
+        return value
+
+
+# seconds between two removals of the expired and exceeding entries of a cache
+CULL_INTERVAL = 1.0
 
 
 class DiskKVCache:
@@ -29,21 +245,168 @@ class DiskKVCache:
             This can improve concurrent writes. The default value is 3. size limit of
             individual cache shards is the `max_cache_size` divided by the number of
             shards.
+        `memory_cache_size` (int, optional): size in bytes of the in-memory LRU tier
+            placed in front of the disk cache. The tier is shared by all the
+            `DiskKVCache` objects opened on the same `path`. The default value is 0,
+            which disables the memory tier.
+        `ttl` (float, optional): number of seconds after which a stored value
+            expires. The default value is None, values never expire.
+        `compression` (str, optional): compression of the numpy values, None, "zstd"
+            or "lz4", see `NdArrayDisk`. The default value is None.
+
+    Expired entries and the entries exceeding `max_cache_size` are removed by the
+    first write, then at most once every `CULL_INTERVAL` seconds, and counted in
+    `disk_stats`. Both go through every shard, so the cache may exceed
+    `max_cache_size` by the writes of that interval.
     """
 
-    def __init__(self, path: str, max_cache_size: int = 2**30, shards: int = 3):
+    def __init__(
+        self,
+        path: str,
+        max_cache_size: int = 2**30,
+        shards: int = 3,
+        memory_cache_size: int = 0,
+        ttl: float = None,
+        compression: str = None,
+    ):
         # For details, see: http://www.grantjenks.com/docs/diskcache/tutorial.html#settings
         default_settings = {
             "size_limit": max_cache_size,
             "eviction_policy": "least-recently-stored",
             "disk_pickle_protocol": pickle.HIGHEST_PROTOCOL,
+            "disk_compression": compression,
+            # culled explicitly after the writes so that the removals are counted
+            "cull_limit": 0,
         }
         self._path = path
-        self._cache = FanoutCache(path, shards=shards, **default_settings)
+        # a ttl of 0 disables the expiry, as in the function_cache_ttl config
+        self._ttl = float(ttl) if ttl is not None and float(ttl) > 0 else None
+        self.disk_stats = DiskCacheStats()
+        self._next_cull = 0.0
+        self._cache = FanoutCache(
+            path, shards=shards, disk=NdArrayDisk, **default_settings
+        )
+        self._memory = None
+        if memory_cache_size > 0:
+            with _memory_tiers_lock:
+                if str(path) not in _memory_tiers:
+                    _memory_tiers[str(path)] = LRUMemoryCache(memory_cache_size)
+                self._memory = _memory_tiers[str(path)]
+
+    @property
+    def memory_stats(self) -> MemoryCacheStats:
+        return self._memory.stats if self._memory is not None else None
 
     def get(self, key: Any):
-        value = self._cache.get(key, default=None)
+        if self._use_memory(key):
+            value = self._memory.get(key)
+            if value is not None:
+                return value
+        entry = self._cache.get(key, default=None, expire_time=True)
+        # a busy shard returns the default instead of a (value, expire_at) pair
+        if entry is None:
+            return None
+        value, expire_at = entry
+        if value is not None and self._use_memory(key):
+            self._memory.set(key, value, expire_at)
         return value
 
     def set(self, key: Any, value: Any):
-        self._cache.set(key, value)
+        self._cache.set(key, value, expire=self._ttl)
+        if self._use_memory(key):
+            self._memory.set(key, value, self._expire_at())
+        self._cull()
+
+    def get_many(self, keys: List[Any]) -> List[Any]:
+        """Look up a list of keys, returning `None` for every missing key.
+
+        Keys are first looked up in the memory tier. The remaining keys are grouped
+        by shard and each shard is probed inside a single transaction instead of
+        one SQLite round-trip per key.
+        """
+        values = [None] * len(keys)
+        disk_positions = list(range(len(keys)))
+        if self._memory is not None:
+            for pos, key in enumerate(keys):
+                if self._use_memory(key):
+                    values[pos] = self._memory.get(key)
+            disk_positions = [pos for pos in disk_positions if values[pos] is None]
+
+        disk_keys = [keys[pos] for pos in disk_positions]
+        expire_at = [None] * len(keys)
+        for shard, positions in self._group_by_shard(disk_keys).items():
+            try:
+                with shard.transact(retry=True):
+                    for pos in positions:
+                        key_pos = disk_positions[pos]
+                        values[key_pos], expire_at[key_pos] = shard.get(
+                            disk_keys[pos], default=None, expire_time=True
+                        )
+            except (Timeout, sqlite3.OperationalError):
+                # same as FanoutCache.get, a busy shard is reported as misses
+                continue
+
+        # promote the disk hits so that the next lookup is served from memory
+        if self._memory is not None:
+            for pos in disk_positions:
+                if values[pos] is not None and self._use_memory(keys[pos]):
+                    self._memory.set(keys[pos], values[pos], expire_at[pos])
+        return values
+
+    def set_many(self, keys: List[Any], values: List[Any]):
+        """Store key-value pairs, committing once per shard."""
+        assert len(keys) == len(values), "Number of keys and values do not match"
+        written = []
+        for shard, positions in self._group_by_shard(keys).items():
+            try:
+                with shard.transact(retry=True):
+                    for pos in positions:
+                        shard.set(keys[pos], values[pos], expire=self._ttl)
+            except (Timeout, sqlite3.OperationalError):
+                continue
+            written.extend(positions)
+        # the keys of a busy shard are not stored in either tier
+        if self._memory is not None:
+            expire_at = self._expire_at()
+            for pos in written:
+                if self._use_memory(keys[pos]):
+                    self._memory.set(keys[pos], values[pos], expire_at)
+        self._cull()
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate over the key-value pairs stored on disk, shard by shard."""
+        for shard in self._cache._shards:
+            for key in shard:
+                value = shard.get(key, default=None)
+                # skip the keys evicted while iterating
+                if value is not None:
+                    yield key, value
+
+    def _expire_at(self) -> Optional[float]:
+        return time.time() + self._ttl if self._ttl else None
+
+    def _cull(self):
+        now = time.monotonic()
+        if now < self._next_cull:
+            return
+        self._next_cull = now + CULL_INTERVAL
+        try:
+            if self._ttl:
+                self.disk_stats.expirations += self._cache.expire(retry=True)
+            self.disk_stats.evictions += self._cache.cull(retry=True)
+        except (Timeout, sqlite3.OperationalError):
+            # a busy shard is culled by the next write
+            pass
+
+    def _use_memory(self, key: Any) -> bool:
+        # unhashable keys (e.g. numpy arrays) are only stored on disk
+        return self._memory is not None and isinstance(key, Hashable)
+
+    def _group_by_shard(self, keys: List[Any]) -> Dict[Any, List[int]]:
+        # mirror the routing of FanoutCache so get/set and get_many/set_many agree
+        shards = self._cache._shards
+        key_hash = self._cache._hash
+        groups = defaultdict(list)
+        for pos, key in enumerate(keys):
+            groups[shards[key_hash(key) % len(shards)]].append(pos)
+        return groups
@@ -0,0 +1,182 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+from evadb.utils.logging_manager import logger
+
+HTTP_TOO_MANY_REQUESTS = 429
+# client errors that may succeed when the request is sent again
+HTTP_RETRYABLE_CLIENT_ERRORS = (408, 409, HTTP_TOO_MANY_REQUESTS)
+
+
+class TokenBucket:
+    """Thread safe token bucket rate limiter.
+
+    The bucket refills at `rate` tokens per second up to `capacity` tokens. The
+    rate is lowered multiplicatively by `slow_down` (e.g. on rate limit errors) and
+    recovers additively with every successful request through `speed_up`.
+
+    Args:
+        rate (float): tokens added per second
+        capacity (float, optional): maximum burst size. Defaults to `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self._max_rate = rate
+        self._rate = rate
+        self._capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def acquire(self):
+        """Block until a token is available and consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
+
+    def slow_down(self, factor: float = 0.5):
+        with self._lock:
+            self._rate = max(self._max_rate / 100, self._rate * factor)
+
+    def speed_up(self):
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._max_rate / 100)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    # openai.RateLimitError and most http clients expose the status code
+    return getattr(error, "status_code", None) == HTTP_TOO_MANY_REQUESTS
+
+
+def is_retryable_error(error: Exception) -> bool:
+    # a bad request or a rejected api key fails the same way on every retry
+    status_code = getattr(error, "status_code", None)
+    if not isinstance(status_code, int) or not 400 <= status_code < 500:
+        return True
+    return status_code in HTTP_RETRYABLE_CLIENT_ERRORS
+
+
+def _retry_after(error: Exception) -> float:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ConcurrentRequestExecutor:
+    """Issues blocking requests (e.g. LLM completions) from a bounded thread pool.
+
+    `map` preserves the order of the inputs. Failed requests are retried with
+    exponential backoff, except client errors (HTTP 4xx) that cannot succeed on a
+    retry, such as an invalid api key. A rate limit error (HTTP 429) pauses all the workers for
+    the `Retry-After` period (or the current backoff) and lowers the request rate of
+    the token bucket, which then recovers as requests succeed again.
+
+    Args:
+        max_concurrency (int): maximum number of in-flight requests
+        requests_per_minute (float, optional): rate limit enforced with a token
+            bucket. 0 disables rate limiting.
+        max_retries (int, optional): number of retries before the error is raised
+        initial_backoff (float, optional): delay in seconds before the first retry
+        max_backoff (float, optional): upper bound of the delay between retries
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: float = 0,
+        max_retries: int = 5,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._bucket = None
+        if requests_per_minute:
+            self._bucket = TokenBucket(float(requests_per_minute) / 60)
+        self._max_retries = int(max_retries)
+        self._initial_backoff = float(initial_backoff)
+        self._max_backoff = float(max_backoff)
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        items = list(items)
+        if len(items) <= 1 or self._max_concurrency == 1:
+            return [self._call_with_backoff(func, item) for item in items]
+        num_workers = min(self._max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            return list(
+                pool.map(lambda item: self._call_with_backoff(func, item), items)
+            )
+
+    def _call_with_backoff(self, func: Callable[[Any], Any], item: Any) -> Any:
+        backoff = self._initial_backoff
+        for attempt in range(self._max_retries + 1):
+            self._wait_for_turn()
+            try:
+                result = func(item)
+            except Exception as e:
+                if attempt == self._max_retries or not is_retryable_error(e):
+                    raise
+                delay = min(backoff, self._max_backoff)
+                if is_rate_limit_error(e):
+                    delay = _retry_after(e) or delay
+                    self._pause(delay)
+                    if self._bucket is not None:
+                        self._bucket.slow_down()
+                    logger.warning(f"Rate limited, retrying in {delay:.2f} seconds")
+                else:
+                    logger.warning(f"Request failed with {e}, retrying in {delay:.2f}")
+                    time.sleep(delay * random.uniform(1, 1.25))
+                backoff *= 2
+            else:
+                if self._bucket is not None:
+                    self._bucket.speed_up()
+                return result
+
+    def _pause(self, delay: float):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def _wait_for_turn(self):
+        while True:
+            with self._lock:
+                wait_time = self._resume_at - time.monotonic()
+            if wait_time <= 0:
+                break
+            time.sleep(wait_time)
+        if self._bucket is not None:
+            self._bucket.acquire()
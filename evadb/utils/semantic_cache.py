@@ -0,0 +1,324 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from evadb.catalog.catalog_type import VectorStoreType
+from evadb.catalog.catalog_utils import get_metadata_entry_or_val
+from evadb.catalog.models.utils import FunctionCatalogEntry
+from evadb.third_party.vector_stores.types import FeaturePayload, VectorIndexQuery
+from evadb.third_party.vector_stores.utils import VectorStoreFactory
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.stats import SemanticCacheStats
+
+# number of neighbours inspected per lookup, the nearest ones might have been
+# evicted from the response store or belong to another namespace
+_SEARCH_TOP_K = 4
+
+# the index is rebuilt once this fraction of its vectors belong to responses
+# evicted or expired from the response store
+_STALE_INDEX_RATIO = 0.25
+
+
+def default_semantic_cache_path(cache_dir: str, function_name: str) -> Path:
+    """Default location of the semantic cache of the function `function_name`, in
+    the `cache_dir` of the database."""
+    return Path(cache_dir) / f"semantic_{function_name}"
+
+
+def uses_semantic_cache(function_class: type) -> bool:
+    # the functions backed by a SemanticCache expose its stats
+    return isinstance(function_class, type) and hasattr(
+        function_class, "semantic_cache_stats"
+    )
+
+
+def get_semantic_cache_path(function_obj: FunctionCatalogEntry) -> Optional[Path]:
+    """Location of the semantic cache used by the function, None if it does not
+    use one. It is recorded in the `semantic_cache_path` metadata of the function
+    when the function is created."""
+    semantic_cache_path = get_metadata_entry_or_val(function_obj, "semantic_cache_path")
+    if semantic_cache_path is None:
+        return None
+    return Path(semantic_cache_path)
+
+
+class SemanticCache:
+    """Semantic cache for LLM responses
+
+    The responses are stored in a `DiskKVCache` and the embeddings of the cached
+    prompts are indexed in a `FaissVectorStore`, both under `path`, so the cache
+    survives restarts without any external service. A lookup returns the response
+    of the same prompt if it is cached, otherwise the response of the nearest cached
+    prompt whose cosine distance is within `score_threshold`.
+
+    Args:
+        `path` (str): the path on disk where the cache will be stored
+        `embed` (Callable[[List[str]], np.ndarray]): embeds a list of prompts into a
+            2D array with one row per prompt
+        `score_threshold` (float, optional): maximum cosine distance between the
+            prompt and a cached prompt to be considered a hit. The default value is
+            0.05.
+        `max_cache_size` (int, optional): maximum size of the response store.
+            Responses are evicted in the least-recently-stored order once it is
+            exceeded. Their embeddings are ignored by subsequent lookups and
+            dropped from the index once they make up `_STALE_INDEX_RATIO` of it.
+            The default value is 2**30.
+        `ttl` (float, optional): number of seconds after which a cached response
+            expires. The default value is None, responses never expire.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        embed: Callable[[List[str]], np.ndarray],
+        score_threshold: float = 0.05,
+        max_cache_size: int = 2**30,
+        ttl: float = None,
+    ):
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._embed = embed
+        self._score_threshold = float(score_threshold)
+        self._store = DiskKVCache(
+            str(self._path / "responses"), max_cache_size=int(max_cache_size), ttl=ttl
+        )
+        index_path = self._path / "index.faiss"
+        self._index_exists = index_path.exists()
+        self._index = VectorStoreFactory.init_vector_store(
+            VectorStoreType.FAISS, "semantic_cache", index_path=str(index_path)
+        )
+        self._dirty = False
+        # responses evicted or expired from the store since the index was rebuilt
+        self._num_removed = 0
+        # embeddings of the lookup misses, consumed when the responses are cached
+        self._pending_embeddings: Dict[int, np.ndarray] = {}
+        self.stats = SemanticCacheStats()
+
+    @property
+    def hits(self) -> int:
+        return self.stats.hits
+
+    @property
+    def misses(self) -> int:
+        return self.stats.misses
+
+    def lookup(self, prompt: str, namespace: str = "", expected: Any = None) -> Any:
+        """Return the cached response for `prompt` or None on a miss.
+
+        `namespace` separates the responses of different models or model settings.
+        If the `expected` response is known, a hit returning another response is
+        recorded as a false positive.
+        """
+        return self.lookup_many([prompt], namespace, [expected])[0]
+
+    def lookup_many(
+        self, prompts: List[str], namespace: str = "", expected: List[Any] = None
+    ) -> List[Any]:
+        """Batched `lookup`, returning None for every miss.
+
+        The prompts without an exact match are embedded with a single call to
+        `embed`. The embeddings of the misses are kept until they are inserted
+        by `update_many`, so the prompts are not embedded again.
+        """
+        if expected is None:
+            expected = [None] * len(prompts)
+        entry_ids = [self._entry_id(prompt, namespace) for prompt in prompts]
+        with self.stats.lookup_timer:
+            entries = self._store.get_many(entry_ids)
+
+        responses = [None] * len(prompts)
+        pending = []
+        for idx, (prompt, entry) in enumerate(zip(prompts, entries)):
+            if entry is not None and entry[:2] == (namespace, prompt):
+                responses[idx] = self._record_hit(entry, expected[idx])
+            else:
+                pending.append(idx)
+
+        if pending:
+            embeddings = self._embed_prompts([prompts[idx] for idx in pending])
+            for idx, embedding in zip(pending, embeddings):
+                entry = None
+                if self._index_exists:
+                    with self.stats.lookup_timer:
+                        entry = self._search(embedding, namespace)
+                if entry is not None:
+                    self.stats.semantic_hits += 1
+                    responses[idx] = self._record_hit(entry, expected[idx])
+                else:
+                    self.stats.misses += 1
+                    self._pending_embeddings[entry_ids[idx]] = embedding
+        return responses
+
+    def update(self, prompt: str, response: Any, namespace: str = "", tokens: int = 0):
+        """Cache the `response` of `prompt`. Call `persist` to flush the index.
+
+        `tokens` is the number of tokens spent on the model call, counted as saved
+        by every later hit of this response.
+        """
+        self.update_many([prompt], [response], namespace, [tokens])
+
+    def update_many(
+        self,
+        prompts: List[str],
+        responses: List[Any],
+        namespace: str = "",
+        tokens: List[int] = None,
+    ):
+        """Batched `update`. Prompts missed by `lookup_many` reuse the embedding
+        computed by the lookup, the others are embedded with a single call."""
+        if tokens is None:
+            tokens = [0] * len(prompts)
+        entries = {}
+        for prompt, response, num_tokens in zip(prompts, responses, tokens):
+            entry_id = self._entry_id(prompt, namespace)
+            entries[entry_id] = (namespace, prompt, response, int(num_tokens))
+        self._store.set_many(list(entries.keys()), list(entries.values()))
+
+        embeddings = {
+            entry_id: self._pending_embeddings.pop(entry_id)
+            for entry_id in entries
+            if entry_id in self._pending_embeddings
+        }
+        missing = [entry_id for entry_id in entries if entry_id not in embeddings]
+        if missing:
+            computed = self._embed_prompts(
+                [entries[entry_id][1] for entry_id in missing]
+            )
+            embeddings.update(zip(missing, computed))
+
+        if not self._index_exists:
+            self._index.create(len(next(iter(embeddings.values()))))
+            self._index_exists = True
+        self._index.add(
+            [
+                FeaturePayload(id=entry_id, embedding=embedding)
+                for entry_id, embedding in embeddings.items()
+            ]
+        )
+        self._dirty = True
+        self._drop_removed_entries()
+
+    def export_entries(self) -> Tuple[List[Tuple[int, tuple]], np.ndarray]:
+        """Return the cached `(entry_id, entry)` pairs and the embeddings of their
+        prompts, one row per entry. `import_entries` loads them into another cache.
+        """
+        if not self._index_exists:
+            return [], np.empty((0, 0), dtype="float32")
+        entries, embeddings = [], []
+        for entry_id, entry in self._store.items():
+            try:
+                embeddings.append(self._index.reconstruct([entry_id]))
+            except RuntimeError:
+                # the entry was stored but the index was not persisted after it
+                continue
+            entries.append((entry_id, entry))
+        if not entries:
+            return [], np.empty((0, 0), dtype="float32")
+        return entries, np.vstack(embeddings)
+
+    def import_entries(self, entries: List[Tuple[int, tuple]], embeddings: np.ndarray):
+        """Bulk load the entries returned by `export_entries`. The embeddings are
+        inserted as is, so the prompts are not embedded again. Call `persist` to
+        flush the index."""
+        if not entries:
+            return
+        self._store.set_many(
+            [entry_id for entry_id, _ in entries], [entry for _, entry in entries]
+        )
+        if not self._index_exists:
+            self._index.create(embeddings.shape[1])
+            self._index_exists = True
+        self._index.add(
+            [
+                FeaturePayload(id=int(entry_id), embedding=embedding)
+                for (entry_id, _), embedding in zip(entries, embeddings)
+            ]
+        )
+        self._dirty = True
+        self._drop_removed_entries()
+
+    def persist(self):
+        """Write the vector index to disk if it changed since the last call."""
+        self._pending_embeddings.clear()
+        if self._dirty:
+            self._index.persist()
+            self._dirty = False
+
+    def _drop_removed_entries(self):
+        """Rebuild the index without the embeddings of the responses removed from
+        the store, once they make up `_STALE_INDEX_RATIO` of the index. The HNSW
+        index does not support removals, and rebuilding it only after a fraction
+        of its size was removed keeps the cost per cached response constant."""
+        disk_stats = self._store.disk_stats
+        num_removed = disk_stats.evictions + disk_stats.expirations
+        num_stale = num_removed - self._num_removed
+        if num_stale == 0 or num_stale < _STALE_INDEX_RATIO * self._index.size:
+            return
+        self._num_removed = num_removed
+        entry_ids, embeddings = [], []
+        for entry_id, _ in self._store.items():
+            try:
+                embeddings.append(self._index.reconstruct([entry_id]))
+            except RuntimeError:
+                continue
+            entry_ids.append(entry_id)
+        self._index.create(self._index.dimension)
+        self._index.add(
+            [
+                FeaturePayload(id=entry_id, embedding=embedding)
+                for entry_id, embedding in zip(entry_ids, embeddings)
+            ]
+        )
+        self._dirty = True
+
+    def _search(self, embedding: np.ndarray, namespace: str):
+        result = self._index.query(
+            VectorIndexQuery(embedding=embedding, top_k=_SEARCH_TOP_K)
+        )
+        for distance, entry_id in zip(result.similarities, result.ids):
+            # the embeddings are normalized so squared l2 distance / 2 is the
+            # cosine distance; faiss returns -1 for missing neighbours
+            if entry_id < 0 or distance / 2 > self._score_threshold:
+                break
+            entry = self._store.get(int(entry_id))
+            if entry is not None and entry[0] == namespace:
+                return entry
+        return None
+
+    def _record_hit(self, entry: tuple, expected: Any) -> Any:
+        response = entry[2]
+        self.stats.hits += 1
+        self.stats.tokens_saved += entry[3] if len(entry) > 3 else 0
+        if expected is not None:
+            self.stats.labeled_hits += 1
+            if response != expected:
+                self.stats.false_positives += 1
+        return response
+
+    def _embed_prompts(self, prompts: List[str]) -> np.ndarray:
+        with self.stats.embedding_timer:
+            embeddings = np.asarray(self._embed(prompts), dtype="float32")
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, np.finfo("float32").eps)
+
+    @staticmethod
+    def _entry_id(prompt: str, namespace: str) -> int:
+        # faiss ids are signed 64 bit integers
+        digest = hashlib.blake2b(f"{namespace}\0{prompt}".encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "little") >> 1
@@ -15,6 +15,7 @@
 
 import time
 from dataclasses import dataclass
+from typing import Dict, Optional
 
 from evadb.utils.logging_manager import logger
 
@@ -46,6 +47,37 @@ class Timer:
         logger.info("{:s}: {:0.4f} sec".format(context, self.total_elapsed_time))
 
 
+@dataclass
+class SemanticCacheStats:
+    """Metrics of a semantic cache and of the model calls it saves.
+
+    `semantic_hits` are the hits answered by a different but similar prompt. When
+    the expected response is known, hits are labeled and the ones returning another
+    response are counted as `false_positives`."""
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.semantic_hits: int = 0
+        self.labeled_hits: int = 0
+        self.false_positives: int = 0
+        self.tokens_saved: int = 0
+        self.embedding_timer: Timer = Timer()
+        self.lookup_timer: Timer = Timer()
+        self.model_timer: Timer = Timer()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def false_positive_rate(self) -> Optional[float]:
+        if self.labeled_hits == 0:
+            return None
+        return self.false_positives / self.labeled_hits
+
+
 @dataclass
 class FunctionStats:
     def __init__(self) -> None:
@@ -53,3 +85,109 @@ class FunctionStats:
         self.timer: Timer = Timer()
         self.prev_cost: float = 0.0
         self.cache_misses: int = 0
+        self.cache_evictions: int = 0
+        self.cache_expirations: int = 0
+        self.dedup_hits: int = 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of the evaluated rows answered by an earlier row of the query
+        with the same arguments instead of a function call."""
+        if self.num_calls == 0:
+            return 0.0
+        return self.dedup_hits / self.num_calls
+
+    def counters(self, semantic_cache: SemanticCacheStats = None) -> Dict[str, float]:
+        """Cumulative counters persisted in the `FunctionStatsCatalog`."""
+        counters = {
+            "num_calls": self.num_calls,
+            "elapsed_time": self.timer.total_elapsed_time,
+            "cache_misses": int(self.cache_misses),
+            "cache_evictions": self.cache_evictions,
+            "cache_expirations": self.cache_expirations,
+            "dedup_hits": self.dedup_hits,
+        }
+        if semantic_cache is not None:
+            counters.update(
+                {
+                    "semantic_cache_hits": semantic_cache.hits,
+                    "semantic_cache_misses": semantic_cache.misses,
+                    "semantic_hits": semantic_cache.semantic_hits,
+                    "labeled_hits": semantic_cache.labeled_hits,
+                    "false_positives": semantic_cache.false_positives,
+                    "tokens_saved": semantic_cache.tokens_saved,
+                    "embedding_time": semantic_cache.embedding_timer.total_elapsed_time,
+                    "lookup_time": semantic_cache.lookup_timer.total_elapsed_time,
+                    "model_time": semantic_cache.model_timer.total_elapsed_time,
+                }
+            )
+        return counters
+
+
+class AdaptiveBatchSizer:
+    """Hill-climbing controller of the size of the batches an operator emits.
+
+    The operator reports the rows it processed and the time they took through
+    `observe`. The size is scaled by `factor` in the current direction, which is
+    reversed whenever the throughput (rows per second) drops by more than
+    `tolerance` relative to the previous observation. The size stays within
+    [`minimum`, `maximum`], the maximum being the memory cap of the batches.
+
+    Arguments:
+        initial (int): size of the first batch
+        minimum (int): smallest size
+        maximum (int): largest size
+        factor (float): scaling applied to the size after every observation
+        tolerance (float): relative throughput drop reversing the direction
+
+    This is not thread safe"""
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        factor: float = 2.0,
+        tolerance: float = 0.1,
+    ):
+        assert 0 < minimum <= maximum, "expected 0 < minimum <= maximum"
+        self.minimum = int(minimum)
+        self.maximum = int(maximum)
+        self.factor = factor
+        self.tolerance = tolerance
+        self._size = self._clamp(initial)
+        self._direction = 1
+        self._last_throughput = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Rows per second of the last observation"""
+        return self._last_throughput
+
+    def observe(self, num_rows: int, elapsed_time: float) -> int:
+        """Record the processing of `num_rows` rows in `elapsed_time` seconds and
+        return the size of the next batch"""
+        if num_rows <= 0 or elapsed_time <= 0:
+            return self._size
+        throughput = num_rows / elapsed_time
+        if self._last_throughput is not None and throughput < self._last_throughput * (
+            1 - self.tolerance
+        ):
+            self._direction = -self._direction
+        self._last_throughput = throughput
+        self._size = self._clamp(self._size * self.factor**self._direction)
+        return self._size
+
+    def _clamp(self, size: float) -> int:
+        return max(self.minimum, min(self.maximum, int(size)))
+
+
+def batch_size_limit(batch_size) -> int:
+    """Current value of a static batch size or of an `AdaptiveBatchSizer`"""
+    if isinstance(batch_size, AdaptiveBatchSizer):
+        return batch_size.size
+    return batch_size
@@ -84,7 +84,6 @@ document_libs = [
     "langchain-openai", # CHATGPT through Langchain
     "gpt4all",  # PRIVATE GPT
     "sentencepiece",  # TRANSFORMERS
-    # "git+https://github.com/zilliztech/GPTCache.git@dev" # CHATGPT_WITH_CACHE
 ]
 
 function_libs = [
@@ -151,6 +150,10 @@ reddit_libs = [
     "praw"
 ]
 
+arrow_libs = ["pyarrow>=12.0.0"]  # fixed shape tensor extension type
+
+compression_libs = ["zstandard", "lz4"]  # compressed ndarray serialization
+
 ### NEEDED FOR DEVELOPER TESTING ONLY
 
 dev_libs = [
@@ -197,8 +200,10 @@ EXTRA_REQUIRES = {
     "forecasting": forecasting_libs,
     "hackernews": hackernews_libs,
     "reddit": reddit_libs,
+    "arrow": arrow_libs,
+    "compression": compression_libs,
     # everything except ray, qdrant, ludwig and postgres. The first three fail on pyhton 3.11.
-    "dev": dev_libs + vision_libs + document_libs + function_libs + notebook_libs + forecasting_libs + sklearn_libs + imagegen_libs + xgboost_libs + langchain_gpt_libs + reddit_libs
+    "dev": dev_libs + vision_libs + document_libs + function_libs + notebook_libs + forecasting_libs + sklearn_libs + imagegen_libs + xgboost_libs + langchain_gpt_libs + reddit_libs + arrow_libs
 }
 
 setup(
@@ -0,0 +1,81 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from test.markers import arrow_skip_marker
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.models.storage.batch import Batch
+
+
+def create_batches(num_batches=20, num_rows=500):
+    return [
+        Batch(
+            pd.DataFrame(
+                {
+                    "id": np.arange(num_rows),
+                    "label": [f"label_{i % 7}" for i in range(num_rows)],
+                    "data": [
+                        np.full((8, 8, 3), i % 255, dtype=np.uint8)
+                        for i in range(num_rows)
+                    ],
+                }
+            )
+        )
+        for _ in range(num_batches)
+    ]
+
+
+def scan_filter_project(batches):
+    # scan -> WHERE id % 2 = 0 -> SELECT id, data
+    outputs = []
+    for batch in batches:
+        outcomes = Batch(
+            pd.DataFrame({"outcome": batch.column_as_numpy_array("id") % 2 == 0})
+        )
+        batch = batch[:]
+        batch.drop_zero(outcomes)
+        batch.reset_index()
+        outputs.append(batch.project(["id", "data"]))
+    return Batch.concat(outputs, copy=False)
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_scan_filter_project_pandas(benchmark):
+    batches = create_batches()
+    output = benchmark(scan_filter_project, batches)
+    assert len(output) == 20 * 250
+
+
+@arrow_skip_marker
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_scan_filter_project_arrow(benchmark):
+    from evadb.models.storage.arrow_batch import ArrowBatch
+
+    batches = [ArrowBatch.from_batch(batch) for batch in create_batches()]
+    output = benchmark(scan_filter_project, batches)
+    assert output.is_arrow()
+    assert len(output) == 20 * 250
@@ -0,0 +1,32 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from benchmark.batch_kernels.runner import KERNELS, create_operands
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+@pytest.mark.parametrize("name", list(KERNELS))
+def test_should_run_benchmark_batch_kernels(benchmark, name):
+    left, right = create_operands(10_000)[name]
+    legacy, vectorized = KERNELS[name]
+    outcomes = benchmark(vectorized, left, right)
+    expected = legacy(left, right).frames.iloc[:, 0]
+    assert outcomes.frames[0].tolist() == expected.tolist()
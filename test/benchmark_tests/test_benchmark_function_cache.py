@@ -0,0 +1,70 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.utils.kv_cache import DiskKVCache, build_cache_keys
+
+NUM_FRAMES = 10000
+
+
+@pytest.fixture
+def warm_cache():
+    # cache keyed on (video name, frame id) as generated by optimize_cache_key
+    frames = pd.DataFrame(
+        {"name": ["video.mp4"] * NUM_FRAMES, "id": np.arange(NUM_FRAMES)}
+    )
+    values = [np.array([["car"], [[0.1, 0.2, 0.3, 0.4]]], dtype=object)] * NUM_FRAMES
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = DiskKVCache(tmp_dir)
+        cache.set_many(build_cache_keys(frames), values)
+        yield cache, frames
+
+
+def rowwise_lookup(cache, frames):
+    # per-row path used by FunctionExpression before the bulk cache API
+    return [cache.get(key.to_numpy()) for _, key in frames.iterrows()]
+
+
+def bulk_lookup(cache, frames):
+    return cache.get_many(build_cache_keys(frames))
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_rowwise_cache_lookup(benchmark, warm_cache):
+    cache, frames = warm_cache
+    cache.set_many([key.to_numpy() for _, key in frames.iterrows()], [1] * NUM_FRAMES)
+    results = benchmark(rowwise_lookup, cache, frames)
+    assert all(result is not None for result in results)
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_bulk_cache_lookup(benchmark, warm_cache):
+    cache, frames = warm_cache
+    results = benchmark(bulk_lookup, cache, frames)
+    assert all(result is not None for result in results)
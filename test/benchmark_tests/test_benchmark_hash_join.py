@@ -0,0 +1,40 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from benchmark.batch_kernels.join import create_tables, legacy_reassign_indices_to_hash
+from evadb.models.storage.batch import Batch
+
+
+def hash_join(build, probe, hash_fn=Batch.reassign_indices_to_hash):
+    build_batch, probe_batch = Batch(build.copy()), Batch(probe.copy())
+    hash_fn(build_batch, ["video_id", "label"])
+    hash_fn(probe_batch, ["vid", "object"])
+    return Batch.join(probe_batch, build_batch)
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_hash_join(benchmark):
+    build, probe = create_tables(10_000, 100_000)
+    output = benchmark(hash_join, build, probe)
+    # every probe row references exactly one build row
+    assert len(output) == len(probe)
+    expected = hash_join(build, probe, legacy_reassign_indices_to_hash)
+    assert len(output) == len(expected)
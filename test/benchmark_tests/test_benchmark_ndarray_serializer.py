@@ -0,0 +1,55 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from evadb.utils.generic_utils import NdArraySerializer, PickleSerializer
+
+NUM_EMBEDDINGS = 20000
+
+
+def round_trip(serializer, embeddings):
+    return [
+        serializer.deserialize(serializer.serialize(embedding))
+        for embedding in embeddings
+    ]
+
+
+@pytest.fixture
+def embeddings():
+    return list(np.random.rand(NUM_EMBEDDINGS, 384).astype(np.float32))
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_pickle_serializer(benchmark, embeddings):
+    values = benchmark(round_trip, PickleSerializer, embeddings)
+    assert len(values) == NUM_EMBEDDINGS
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_ndarray_serializer(benchmark, embeddings):
+    values = benchmark(round_trip, NdArraySerializer(), embeddings)
+    assert len(values) == NUM_EMBEDDINGS
+    np.testing.assert_array_equal(values[0], embeddings[0])
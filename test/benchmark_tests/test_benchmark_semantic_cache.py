@@ -0,0 +1,38 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from benchmark.semantic_cache.runner import sweep
+from benchmark.semantic_cache.workload import load_workload
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_run_benchmark_semantic_cache(benchmark):
+    workload = load_workload(repeat=2, seed=0)
+    results = benchmark(
+        sweep, workload, ["HASHING"], [0.0, 0.1], llm_latency=0.001
+    ).set_index("score_threshold")
+
+    # exact repeats always hit, paraphrases only with a looser threshold
+    assert results.loc[0.0, "hit_rate"] > 0
+    assert results.loc[0.0, "semantic_hit_rate"] == 0
+    assert results.loc[0.1, "hit_rate"] > results.loc[0.0, "hit_rate"]
+    assert (results["accuracy"] == 1).all()
+    assert (results["llm_calls"] < len(workload)).all()
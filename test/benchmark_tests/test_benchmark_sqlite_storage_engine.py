@@ -0,0 +1,119 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tracemalloc
+from test.util import get_evadb_for_testing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.catalog.catalog_type import ColumnType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.models.storage.batch import Batch
+from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+
+NUM_ROWS = 200000
+
+
+def create_table(name):
+    table = TableCatalogEntry(name, name, table_type=TableType.STRUCTURED_DATA)
+    table.columns = [
+        ColumnCatalogEntry(IDENTIFIER_COLUMN, ColumnType.INTEGER, is_nullable=False),
+        ColumnCatalogEntry("id", ColumnType.INTEGER),
+        ColumnCatalogEntry("label", ColumnType.TEXT),
+    ]
+    return table
+
+
+def create_rows():
+    return Batch(
+        pd.DataFrame(
+            {
+                "id": np.arange(NUM_ROWS),
+                "label": [f"a long label of object {i}" for i in range(NUM_ROWS)],
+            }
+        )
+    )
+
+
+@pytest.fixture
+def large_table():
+    engine = SQLStorageEngine(get_evadb_for_testing())
+    table = create_table("benchmark_sql_read")
+    engine.create(table)
+    engine.write(table, create_rows())
+    yield engine, table
+    engine.drop(table)
+
+
+def peak_memory_of_first_batch(engine, table):
+    # SELECT * FROM table LIMIT n only consumes the first batch of the scan
+    tracemalloc.start()
+    reader = engine.read(table, batch_mem_size=100000)
+    batch = next(reader)
+    reader.close()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(batch), peak
+
+
+def peak_memory_of_fetchall(engine, table):
+    # the read path before streaming cursors fetched the whole table
+    tracemalloc.start()
+    table_to_read = engine._try_loading_table_via_reflection(table.name)
+    rows = engine._sql_session.execute(table_to_read.select()).fetchall()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(rows), peak
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_stream_rows_from_sql_storage(benchmark, large_table):
+    engine, table = large_table
+    num_rows, first_batch_peak = benchmark(peak_memory_of_first_batch, engine, table)
+    assert 0 < num_rows < NUM_ROWS
+
+    num_rows, fetchall_peak = peak_memory_of_fetchall(engine, table)
+    assert num_rows == NUM_ROWS
+    # the first batch must not pay for materializing the whole table
+    assert first_batch_peak * 5 < fetchall_peak
+
+    num_rows = sum(len(batch) for batch in engine.read(table, batch_mem_size=100000))
+    assert num_rows == NUM_ROWS
+
+
+@pytest.mark.benchmark(
+    warmup=False,
+    warmup_iterations=1,
+    min_rounds=1,
+)
+@pytest.mark.notparallel
+def test_should_write_rows_to_sql_storage(benchmark):
+    engine = SQLStorageEngine(get_evadb_for_testing())
+    table = create_table("benchmark_sql_write")
+    engine.create(table)
+    rows = create_rows()
+    benchmark(engine.write, table, rows)
+
+    num_rows = sum(len(batch) for batch in engine.read(table))
+    assert num_rows >= NUM_ROWS
+    engine.drop(table)
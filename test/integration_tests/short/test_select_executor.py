@@ -33,6 +33,7 @@ from evadb.binder.binder_utils import BinderError
 from evadb.models.storage.batch import Batch
 from evadb.optimizer.operators import LogicalFilter
 from evadb.server.command_handler import execute_query_fetch_all
+from evadb.storage.storage_engine import StorageEngine
 
 NUM_FRAMES = 10
 
@@ -157,6 +158,26 @@ class SelectExecutorTest(unittest.TestCase):
         self.assertEqual(len(actual_batch), len(expected_batch[0]))
         self.assertEqual(actual_batch, expected_batch[0])
 
+    def test_select_with_filters_on_null_values(self):
+        execute_query_fetch_all(self.evadb, "DROP TABLE IF EXISTS nulls;")
+        execute_query_fetch_all(
+            self.evadb, "CREATE TABLE nulls (a INTEGER, b INTEGER);"
+        )
+        table = self.evadb.catalog().get_table_catalog_entry("nulls")
+        StorageEngine.factory(self.evadb, table).write(
+            table, Batch(pd.DataFrame({"a": [1, None, 5], "b": [1, 2, 3]}))
+        )
+
+        # the comparisons pushed into the storage engine agree with the filter
+        select_query = "SELECT b FROM nulls WHERE a != 5;"
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        self.assertEqual(sorted(actual_batch.frames["nulls.b"]), [1, 2])
+
+        select_query = "SELECT b FROM nulls WHERE a < 5 OR b = 3;"
+        actual_batch = execute_query_fetch_all(self.evadb, select_query)
+        self.assertEqual(sorted(actual_batch.frames["nulls.b"]), [1, 3])
+        execute_query_fetch_all(self.evadb, "DROP TABLE nulls;")
+
     def test_select_and_aggregate(self):
         simple_aggregate_query = "SELECT COUNT(*), AVG(id) FROM MyVideo;"
         actual_batch = execute_query_fetch_all(self.evadb, simple_aggregate_query)
@@ -95,6 +95,16 @@ class ShowExecutorTest(unittest.TestCase):
         self.assertTrue(all(expected_df.name == result.frames.name))
         self.assertTrue(all(expected_df.type == result.frames.type))
 
+    def test_show_function_stats(self):
+        execute_query_fetch_all(
+            self.evadb, "SELECT ArrayCount(data, 1) FROM MNIST WHERE id < 2;"
+        )
+        result = execute_query_fetch_all(self.evadb, "SHOW FUNCTION STATS;")
+        stats = result.frames.set_index("name")
+        self.assertGreater(stats.loc["ArrayCount", "num_calls"], 0)
+        self.assertIn("hit_rate", stats.columns)
+        self.assertIn("false_positive_rate", stats.columns)
+
     @windows_skip_marker
     def test_show_tables(self):
         # Note this test can causes sqlalchemy issues if the evadb_server is not stopped
@@ -25,7 +25,9 @@ from evadb.utils.generic_utils import (
     is_gpu_available,
     is_ludwig_available,
     is_milvus_available,
+    is_openai_available,
     is_pinecone_available,
+    is_pyarrow_available,
     is_qdrant_available,
     is_replicate_available,
     is_weaviate_available,
@@ -50,6 +52,11 @@ chromadb_skip_marker = pytest.mark.skipif(
     reason="Skipping since chromadb is not installed",
 )
 
+arrow_skip_marker = pytest.mark.skipif(
+    is_pyarrow_available() is False,
+    reason="Skipping since pyarrow is not installed",
+)
+
 milvus_skip_marker = pytest.mark.skipif(
     is_milvus_available() is False,
     reason="Skipping since pymilvus is not installed",
@@ -109,6 +116,10 @@ chatgpt_skip_marker = pytest.mark.skip(
     reason="requires chatgpt",
 )
 
+openai_skip_marker = pytest.mark.skipif(
+    is_openai_available() is False, reason="Run only if openai is available"
+)
+
 forecast_skip_marker = pytest.mark.skipif(
     is_forecast_available() is False,
     reason="Run only if forecasting packages available",
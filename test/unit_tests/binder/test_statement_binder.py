@@ -250,6 +250,13 @@ class StatementBinderTests(unittest.TestCase):
             ),
         )
         self.assertEqual(func_expr.function(), "load_function_class_from_file")
+        func_expr.enable_deduplication.assert_not_called()
+
+        # Case 3 the function is deduplicated within the query
+        mock_load_function_class_from_file.return_value.deduplicated = True
+        binder = StatementBinder(StatementBinderContext(mock_catalog))
+        binder._bind_func_expr(func_expr)
+        func_expr.enable_deduplication.assert_called_once_with()
 
         # Raise error if the class object cannot be created
         mock_load_function_class_from_file.reset_mock()
@@ -17,8 +17,11 @@ import unittest
 from mock import MagicMock, patch
 
 from evadb.catalog.catalog_type import NdArrayType
+from evadb.catalog.catalog_utils import get_metadata_entry_or_val
+from evadb.catalog.models.function_metadata_catalog import FunctionMetadataCatalogEntry
 from evadb.executor.create_function_executor import CreateFunctionExecutor
 from evadb.functions.decorators.io_descriptors.data_types import PandasDataframe
+from evadb.utils.semantic_cache import default_semantic_cache_path
 
 
 class CreateFunctionExecutorTest(unittest.TestCase):
@@ -189,6 +192,55 @@ class CreateFunctionExecutorTest(unittest.TestCase):
             "Function function overwritten.",
         )
 
+    @patch("evadb.executor.create_function_executor.load_function_class_from_file")
+    def test_should_record_semantic_cache_path(
+        self, load_function_class_from_file_mock
+    ):
+        catalog_instance = MagicMock()
+        catalog_instance().get_function_catalog_entry_by_name.return_value = None
+        catalog_instance().get_configuration_catalog_value.return_value = "cache_dir"
+        impl_path = MagicMock()
+        impl_path.absolute.return_value.as_posix.return_value = "test.py"
+        init_mock = MagicMock(return_value=None)
+        function_class = type(
+            "LLM", (), {"semantic_cache_stats": None, "__init__": init_mock}
+        )
+        load_function_class_from_file_mock.return_value = function_class
+        plan = type(
+            "CreateFunctionPlan",
+            (),
+            {
+                "name": "function",
+                "if_not_exists": False,
+                "inputs": ["inp"],
+                "outputs": ["out"],
+                "impl_path": impl_path,
+                "function_type": "chat-completion",
+                "metadata": [],
+            },
+        )
+        evadb = MagicMock()
+        evadb.catalog = catalog_instance
+        create_function_executor = CreateFunctionExecutor(evadb, plan)
+        next(create_function_executor.exec())
+
+        # the path is recorded so that DROP FUNCTION removes exactly that cache
+        semantic_cache_path = get_metadata_entry_or_val(plan, "semantic_cache_path")
+        catalog_instance().get_configuration_catalog_value.assert_called_with(
+            "cache_dir"
+        )
+        self.assertEqual(
+            semantic_cache_path,
+            str(default_semantic_cache_path("cache_dir", "function")),
+        )
+        init_mock.assert_called_with(semantic_cache_path=semantic_cache_path)
+
+        # a path given by the user is kept
+        plan.metadata = [FunctionMetadataCatalogEntry("semantic_cache_path", "/a")]
+        next(CreateFunctionExecutor(evadb, plan).exec())
+        self.assertEqual(len(plan.metadata), 1)
+        init_mock.assert_called_with(semantic_cache_path="/a")
+
     @patch("evadb.executor.create_function_executor.load_function_class_from_file")
     def test_should_raise_error_on_incorrect_io_definition(
         self, load_function_class_from_file_mock
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 from mock import MagicMock
 
+from evadb.executor.executor_utils import ExecutorError, QueryMemoryBudget
 from evadb.executor.orderby_executor import OrderByExecutor
 from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.models.storage.batch import Batch
@@ -87,3 +88,31 @@ class OrderByExecutorTest(unittest.TestCase):
         self.assertEqual(expected_batches[0], sorted_batches[0])
         self.assertEqual(expected_batches[1], sorted_batches[1])
         self.assertEqual(expected_batches[2], sorted_batches[2])
+
+    def test_should_fail_fast_over_the_query_memory_limit(self):
+        batches = [
+            Batch(pd.DataFrame({"A": np.arange(100), "B": np.arange(100)}))
+            for _ in range(3)
+        ]
+        plan = OrderByPlan(
+            [(TupleValueExpression(col_alias="A"), ParserOrderBySortType.ASC)]
+        )
+
+        orderby_executor = OrderByExecutor(MagicMock(), plan)
+        orderby_executor.append_child(DummyExecutor(batches))
+        budget = QueryMemoryBudget(limit=2 * batches[0].nbytes)
+        orderby_executor.memory_budget = budget
+
+        with self.assertRaises(ExecutorError):
+            list(orderby_executor.exec())
+        # the reserved bytes are released
+        self.assertEqual(budget.used, 0)
+
+        budget.limit = 3 * batches[0].nbytes
+        orderby_executor = OrderByExecutor(MagicMock(), plan)
+        orderby_executor.append_child(DummyExecutor(batches))
+        orderby_executor.memory_budget = budget
+        sorted_batches = list(orderby_executor.exec())
+        self.assertEqual(sum(len(batch) for batch in sorted_batches), 300)
+        self.assertEqual(budget.peak, 3 * batches[0].nbytes)
+        self.assertEqual(budget.used, 0)
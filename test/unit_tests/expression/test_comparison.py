@@ -15,11 +15,14 @@
 import unittest
 
 import pandas as pd
+from mock import patch
 
 from evadb.catalog.catalog_type import ColumnType
 from evadb.expression.abstract_expression import ExpressionType
 from evadb.expression.comparison_expression import ComparisonExpression
 from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage import batch_kernels
 from evadb.models.storage.batch import Batch
 
 
@@ -142,3 +145,74 @@ class ComparisonExpressionsTest(unittest.TestCase):
 
         self.assertEqual([False], cmpr_exp2.evaluate(self.batch).frames[0].tolist())
         self.assertNotEqual(str(cmpr_exp1), None)
+
+    def test_comparison_compare_contains_on_list_columns(self):
+        frames = pd.DataFrame(
+            {
+                "labels": [["car", "person"], [], ["dog"], ["person", "person"]],
+                "query": [["person"], [], ["person"], ["person"]],
+            }
+        )
+        left = Batch(frames[["labels"]])
+        right = Batch(frames[["query"]])
+
+        self.assertEqual(
+            [True, True, False, True],
+            Batch.compare_contains(left, right).frames[0].tolist(),
+        )
+        self.assertEqual(
+            [False, True, False, True],
+            Batch.compare_is_contained(left, right).frames[0].tolist(),
+        )
+
+    def test_comparison_compare_like(self):
+        batch = Batch(pd.DataFrame({"name": ["person", "car", "Person", "per\n"]}))
+
+        for pattern, expected in [
+            ("per", [True, False, False, True]),
+            ("(?i)per", [True, False, True, True]),
+            ("per$", [False, False, False, True]),
+            (r"(p)e\w*", [True, False, False, True]),
+        ]:
+            cmpr_exp = ComparisonExpression(
+                ExpressionType.COMPARE_LIKE,
+                TupleValueExpression(name="name", col_alias="name"),
+                ConstantValueExpression(pattern),
+            )
+            self.assertEqual(expected, cmpr_exp.evaluate(batch).frames[0].tolist())
+
+    def test_comparison_on_dictionary_encoded_columns(self):
+        labels = ["car", "person", "car", "dog", "car", "person"]
+        encoded = Batch(pd.DataFrame({"label": labels}))
+        encoded.dictionary_encode()
+        self.assertIsInstance(encoded.frames["label"].dtype, pd.CategoricalDtype)
+
+        for etype, constant in [
+            (ExpressionType.COMPARE_EQUAL, "car"),
+            (ExpressionType.COMPARE_EQUAL, "bus"),
+            (ExpressionType.COMPARE_NEQ, "person"),
+            (ExpressionType.COMPARE_GREATER, "cat"),
+            (ExpressionType.COMPARE_LIKE, "(car|dog)"),
+        ]:
+            cmpr_exp = ComparisonExpression(
+                etype,
+                TupleValueExpression(name="label", col_alias="label"),
+                ConstantValueExpression(constant, ColumnType.TEXT),
+            )
+            expected = cmpr_exp.evaluate(Batch(pd.DataFrame({"label": labels})))
+            self.assertEqual(expected, cmpr_exp.evaluate(encoded))
+
+        # the constant is encoded with the dictionary of the column
+        with patch(
+            "evadb.models.storage.batch_kernels._dense", wraps=batch_kernels._dense
+        ) as dense:
+            cmpr_exp = ComparisonExpression(
+                ExpressionType.COMPARE_EQUAL,
+                TupleValueExpression(name="label", col_alias="label"),
+                ConstantValueExpression("car", ColumnType.TEXT),
+            )
+            outcome = cmpr_exp.evaluate(encoded)
+            dense.assert_not_called()
+        self.assertEqual(
+            outcome.frames[0].tolist(), [label == "car" for label in labels]
+        )
@@ -33,3 +33,10 @@ class ConstantExpressionsTest(unittest.TestCase):
             .frames[0]
             .tolist(),
         )
+
+    def test_string_constant_should_evaluate_to_object_column(self):
+        # e.g., the prompts passed to functions
+        const_expr = ConstantValueExpression("prompt")
+        frames = const_expr.evaluate(Batch(pd.DataFrame([0] * 3))).frames
+        self.assertEqual(frames[0].dtype, object)
+        self.assertEqual(frames[0].tolist(), ["prompt"] * 3)
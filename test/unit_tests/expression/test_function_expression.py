@@ -12,16 +12,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import tempfile
 import unittest
 
 import pandas as pd
 from mock import MagicMock, Mock, patch
 
 from evadb.constants import NO_GPU
-from evadb.expression.function_expression import FunctionExpression
+from evadb.expression.function_expression import (
+    FunctionExpression,
+    FunctionExpressionCache,
+)
 from evadb.functions.gpu_compatible import GPUCompatible
 from evadb.models.storage.batch import Batch
 from evadb.parser.alias import Alias
+from evadb.utils.kv_cache import DiskKVCache
+from evadb.utils.stats import SemanticCacheStats
 
 
 class FunctionExpressionTest(unittest.TestCase):
@@ -43,6 +49,31 @@ class FunctionExpressionTest(unittest.TestCase):
         mock_function.to_device.assert_called_with(gpu_device_id)
         gpu_mock_function.assert_called()
 
+    @patch("evadb.expression.function_expression.Context")
+    def test_should_set_the_gpu_batch_size_of_torch_functions(self, context):
+        context_instance = context.return_value
+        context_instance.gpu_device.return_value = NO_GPU
+        context_instance.gpu_batch_size = 8
+        context_instance.adaptive_batch_size = True
+
+        class TorchFunction(GPUCompatible):
+            gpu_batch_size = 1
+            adaptive_batch_size = False
+
+            def to_device(self, device):
+                return self
+
+            def __call__(self, frames):
+                return pd.DataFrame()
+
+        function = TorchFunction()
+        expression = FunctionExpression(
+            lambda: function, name="test", alias=Alias("func_expr")
+        )
+        expression.evaluate(Batch(frames=pd.DataFrame()))
+        self.assertEqual(function.gpu_batch_size, 8)
+        self.assertTrue(function.adaptive_batch_size)
+
     def test_should_use_the_same_function_if_not_gpu_compatible(self):
         mock_function = MagicMock(return_value=pd.DataFrame())
 
@@ -67,3 +98,141 @@ class FunctionExpressionTest(unittest.TestCase):
         input_batch = Batch(frames=pd.DataFrame())
         expression.evaluate(input_batch)
         mock_function.assert_called()
+
+    def test_should_only_call_function_for_cache_misses(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        mock_function = MagicMock(
+            side_effect=lambda frames: pd.DataFrame({"out": frames["a"] * 2})
+        )
+        child = MagicMock()
+        child.evaluate.side_effect = lambda batch, **kwargs: batch.project(["a"])
+
+        expression = FunctionExpression(
+            lambda: mock_function, name="test", alias=Alias("func_expr")
+        )
+        expression.append_child(child)
+        expression.function_obj = MagicMock(outputs=[MagicMock()])
+        expression.function_obj.outputs[0].name = "out"
+        expression.projection_columns = ["out"]
+        expression.enable_cache(
+            FunctionExpressionCache(key=(), store=DiskKVCache(tmp_dir.name))
+        )
+
+        expression.evaluate(Batch(pd.DataFrame({"a": [1, 2]})))
+        self.assertEqual(expression._stats.cache_misses, 2)
+
+        output = expression.evaluate(Batch(pd.DataFrame({"a": [2, 3, 1]})))
+        self.assertEqual(expression._stats.cache_misses, 3)
+        self.assertEqual(list(output.frames["func_expr.out"]), [4, 6, 2])
+        # only the new key should reach the function
+        self.assertEqual(list(mock_function.call_args[0][0]["a"]), [3])
+        tmp_dir.cleanup()
+
+    def test_should_report_cache_evictions(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        mock_function = MagicMock(
+            side_effect=lambda frames: pd.DataFrame({"out": frames["a"] * 2})
+        )
+        child = MagicMock()
+        child.evaluate.side_effect = lambda batch, **kwargs: batch.project(["a"])
+
+        expression = FunctionExpression(
+            lambda: mock_function, name="test", alias=Alias("func_expr")
+        )
+        expression.append_child(child)
+        expression.function_obj = MagicMock(outputs=[MagicMock()])
+        expression.function_obj.outputs[0].name = "out"
+        expression.projection_columns = ["out"]
+        # too small to hold the sqlite database, every entry is evicted
+        store = DiskKVCache(tmp_dir.name, max_cache_size=1, shards=1)
+        expression.enable_cache(FunctionExpressionCache(key=(), store=store))
+
+        expression.evaluate(Batch(pd.DataFrame({"a": [1, 2]})))
+        self.assertEqual(expression._stats.cache_evictions, 2)
+        self.assertEqual(expression.stats_delta()["cache_evictions"], 2)
+        tmp_dir.cleanup()
+
+    def test_should_call_deduplicated_function_once_per_distinct_arguments(self):
+        mock_function = MagicMock(
+            side_effect=lambda frames: pd.DataFrame({"out": frames["a"] * 2})
+        )
+        child = MagicMock()
+        child.evaluate.side_effect = lambda batch, **kwargs: batch.project(["a"])
+
+        expression = FunctionExpression(
+            lambda: mock_function, name="test", alias=Alias("func_expr")
+        )
+        expression.append_child(child)
+        expression.function_obj = MagicMock(outputs=[MagicMock()])
+        expression.function_obj.outputs[0].name = "out"
+        expression.projection_columns = ["out"]
+        expression.enable_deduplication()
+
+        output = expression.evaluate(Batch(pd.DataFrame({"a": [1, 2, 1, 1]})))
+        self.assertEqual(list(output.frames["func_expr.out"]), [2, 4, 2, 2])
+        self.assertEqual(list(mock_function.call_args[0][0]["a"]), [1, 2])
+
+        # duplicates across the batches of the query are collapsed too
+        output = expression.evaluate(Batch(pd.DataFrame({"a": [2, 3, 3]})))
+        self.assertEqual(list(output.frames["func_expr.out"]), [4, 6, 6])
+        self.assertEqual(list(mock_function.call_args[0][0]["a"]), [3])
+        self.assertEqual(mock_function.call_count, 2)
+
+        self.assertEqual(expression._stats.dedup_hits, 4)
+        self.assertAlmostEqual(expression._stats.dedup_ratio, 4 / 7)
+
+    @patch("evadb.expression.function_expression.DEDUPLICATION_MEMORY_SIZE", 256)
+    def test_should_bound_the_deduplicated_results(self):
+        mock_function = MagicMock(
+            side_effect=lambda frames: pd.DataFrame({"out": frames["a"] * 2})
+        )
+        child = MagicMock()
+        child.evaluate.side_effect = lambda batch, **kwargs: batch.project(["a"])
+
+        expression = FunctionExpression(
+            lambda: mock_function, name="test", alias=Alias("func_expr")
+        )
+        self.assertFalse(expression.is_deduplicated())
+        expression.append_child(child)
+        expression.function_obj = MagicMock(outputs=[MagicMock()])
+        expression.function_obj.outputs[0].name = "out"
+        expression.projection_columns = ["out"]
+        expression.enable_deduplication()
+
+        values = list(range(100)) * 2
+        output = expression.evaluate(Batch(pd.DataFrame({"a": values})))
+        self.assertEqual(list(output.frames["func_expr.out"]), [v * 2 for v in values])
+        self.assertEqual(len(mock_function.call_args[0][0]), 100)
+        self.assertLessEqual(expression._dedup_results.size, 256)
+        self.assertLess(len(expression._dedup_results), 100)
+
+        # the evicted results are computed again
+        output = expression.evaluate(Batch(pd.DataFrame({"a": [0]})))
+        self.assertEqual(list(output.frames["func_expr.out"]), [0])
+        self.assertEqual(mock_function.call_count, 2)
+
+    def test_chatgpt_should_be_deduplicated(self):
+        from evadb.functions.abstract.abstract_function import AbstractFunction
+        from evadb.functions.chatgpt import ChatGPT
+
+        self.assertTrue(ChatGPT.deduplicated)
+        self.assertFalse(AbstractFunction.deduplicated)
+
+    def test_stats_delta_should_include_semantic_cache_stats(self):
+        function_instance = MagicMock(return_value=pd.DataFrame({"out": [1]}))
+        function_instance.semantic_cache_stats = SemanticCacheStats()
+        function_instance.semantic_cache_stats.hits = 3
+        expression = FunctionExpression(
+            lambda: function_instance, name="test", alias=Alias("func_expr")
+        )
+        expression.evaluate(Batch(pd.DataFrame({"a": [1]})))
+
+        delta = expression.stats_delta()
+        self.assertEqual(delta["num_calls"], 1)
+        self.assertEqual(delta["semantic_cache_hits"], 3)
+
+        # only the increments since the previous call are reported
+        function_instance.semantic_cache_stats.hits = 5
+        delta = expression.stats_delta()
+        self.assertEqual(delta["num_calls"], 0)
+        self.assertEqual(delta["semantic_cache_hits"], 2)
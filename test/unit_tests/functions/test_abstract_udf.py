@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import inspect
+import os
+import tempfile
 import unittest
 from enum import Enum
 from inspect import isabstract
@@ -25,6 +27,17 @@ from evadb.functions.yolo_object_detector import Yolo
 
 
 class AbstractFunctionTest(unittest.TestCase):
+    def setUp(self):
+        # the classes built from mock arguments, e.g., the caches, write to the
+        # working directory
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
     def test_function_abstract_functions(self):
         derived_function_classes = list(get_all_subclasses(AbstractFunction))
         # Go over each derived class of AbstractFunction
@@ -0,0 +1,97 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.markers import openai_skip_marker
+
+import pandas as pd
+
+from evadb.functions.chatgpt import ChatGPT
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers chat completions with the task of the last message and rate limits
+    the first request."""
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.num_requests += 1
+            rate_limited = self.server.num_requests == 1
+
+        if rate_limited:
+            body = {"error": {"message": "Rate limit reached", "type": "requests"}}
+            self._reply(429, body, {"retry-after": "0.05"})
+            return
+
+        task = request["messages"][-1]["content"]
+        body = {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": request["model"],
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": task},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        self._reply(200, body)
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@openai_skip_marker
+class ChatGPTTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MockOpenAIHandler)
+        self.server.lock = threading.Lock()
+        self.server.num_requests = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_should_request_completions_concurrently_in_order(self):
+        function = ChatGPT(
+            openai_api_key="sk-test",
+            openai_base_url=f"http://127.0.0.1:{self.server.server_port}/v1",
+            max_concurrency=4,
+        )
+        queries = [f"task {i}" for i in range(20)]
+        text_df = pd.DataFrame({"query": queries, "content": ["context"] * 20})
+
+        output = function.forward(text_df)
+
+        expected = [f"Complete the following task: {query}" for query in queries]
+        self.assertEqual(list(output["response"]), expected)
+        # one extra request for the rate limited call
+        self.assertEqual(self.server.num_requests, 21)
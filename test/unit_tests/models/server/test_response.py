@@ -15,8 +15,12 @@
 import unittest
 from test.util import create_dataframe
 
+import numpy as np
+import pandas as pd
+
 from evadb.models.server.response import Response, ResponseStatus
 from evadb.models.storage.batch import Batch
+from evadb.utils.generic_utils import PickleSerializer
 
 
 class ResponseTest(unittest.TestCase):
@@ -25,3 +29,38 @@ class ResponseTest(unittest.TestCase):
         response = Response(status=ResponseStatus.SUCCESS, batch=batch)
         response2 = Response.deserialize(response.serialize())
         self.assertEqual(response, response2)
+
+    def test_serialize_to_buffers_should_keep_frames_out_of_band(self):
+        frames = pd.DataFrame(
+            {"id": range(3), "data": [np.full((32, 32, 3), i) for i in range(3)]}
+        )
+        response = Response(status=ResponseStatus.SUCCESS, batch=Batch(frames))
+        buffers = response.serialize_to_buffers()
+
+        # the frame buffers are not copied into the serialized message
+        data = response.batch.frames["data"]
+        self.assertTrue(
+            any(
+                np.shares_memory(np.frombuffer(buffer, dtype=np.uint8), data[1])
+                for buffer in buffers
+            )
+        )
+
+        message = bytearray(b"".join(buffers))
+        response2 = Response.deserialize(message)
+        self.assertEqual(response, response2)
+        # the arrays share the received message and stay writable
+        cell = response2.batch.frames["data"][2]
+        self.assertTrue(np.shares_memory(cell, np.frombuffer(message, np.uint8)))
+        cell[0, 0, 0] = 7
+
+        # read-only messages are copied once
+        response3 = Response.deserialize(bytes(message))
+        self.assertTrue(response3.batch.frames["data"][0].flags.writeable)
+
+    def test_deserialize_should_read_pickled_responses(self):
+        response = Response(
+            status=ResponseStatus.SUCCESS, batch=Batch(create_dataframe())
+        )
+        response2 = Response.deserialize(PickleSerializer.serialize(response))
+        self.assertEqual(response, response2)
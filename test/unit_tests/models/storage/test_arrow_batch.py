@@ -0,0 +1,126 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.markers import arrow_skip_marker
+
+import numpy as np
+import pandas as pd
+
+from evadb.models.storage.batch import Batch
+from evadb.parser.alias import Alias
+
+
+def create_frames(num_rows=3):
+    return pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "label": [f"label_{i}" for i in range(num_rows)],
+            "data": [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(num_rows)],
+        }
+    )
+
+
+@arrow_skip_marker
+class ArrowBatchTest(unittest.TestCase):
+    def setUp(self):
+        from evadb.models.storage.arrow_batch import ArrowBatch
+
+        self.frames = create_frames()
+        self.batch = ArrowBatch.from_batch(Batch(self.frames))
+
+    def test_from_batch_should_convert_supported_frames(self):
+        self.assertTrue(self.batch.is_arrow())
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch.columns, ["id", "label", "data"])
+        self.assertEqual(self.batch, Batch(self.frames))
+
+        # tensor columns are stored as a single contiguous tensor
+        data = self.batch.column_as_numpy_array("data")
+        self.assertEqual(data.shape, (3, 2, 2, 3))
+        self.assertTrue(data.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.shares_memory(self.batch.column_as_tensor("data"), data))
+        self.assertIsNone(self.batch.column_as_tensor("label"))
+
+    def test_from_batch_should_fall_back_to_pandas(self):
+        from evadb.models.storage.arrow_batch import ArrowBatch
+
+        ragged = Batch(pd.DataFrame({"data": [np.zeros((1, 2)), np.zeros((3, 2))]}))
+        self.assertIs(ArrowBatch.from_batch(ragged), ragged)
+
+        custom_index = Batch(pd.DataFrame({"id": [1, 2]}, index=[3, 4]))
+        self.assertIs(ArrowBatch.from_batch(custom_index), custom_index)
+
+        # Arrow would turn the object column into a float column with NaN
+        nullable = Batch(pd.DataFrame({"id": [1, None]}, dtype=object))
+        self.assertIs(ArrowBatch.from_batch(nullable), nullable)
+
+    def test_should_not_equal_other_values(self):
+        self.assertNotEqual(self.batch, None)
+        self.assertNotEqual(self.batch, self.frames)
+        self.assertFalse(self.batch.__eq__(None))
+
+    def test_frames_should_keep_object_columns(self):
+        from evadb.models.storage.arrow_batch import frames_to_table, table_to_frames
+
+        frames = pd.DataFrame(
+            {"label": ["a", None], "blob": [b"a", None], "empty": [None, None]}
+        )
+        round_trip = table_to_frames(frames_to_table(frames))
+        self.assertEqual(list(round_trip.dtypes), [object] * 3)
+        pd.testing.assert_frame_equal(round_trip, frames)
+
+    def test_project_filter_and_slice_should_stay_arrow(self):
+        projected = self.batch.project(["id", "data"])
+        self.assertTrue(projected.is_arrow())
+        self.assertEqual(projected, Batch(self.frames[["id", "data"]]))
+
+        outcomes = Batch(pd.DataFrame({"outcome": [True, False, True]}))
+        projected.drop_zero(outcomes)
+        projected.reset_index()
+        self.assertTrue(projected.is_arrow())
+        expected = self.frames[["id", "data"]].iloc[[0, 2]].reset_index(drop=True)
+        self.assertEqual(projected, Batch(expected))
+
+        sliced = self.batch[1:]
+        self.assertTrue(sliced.is_arrow())
+        self.assertEqual(sliced, Batch(self.frames.iloc[1:].reset_index(drop=True)))
+
+    def test_merge_and_concat_should_stay_arrow(self):
+        from evadb.models.storage.arrow_batch import ArrowBatch
+
+        other = ArrowBatch.from_batch(Batch(pd.DataFrame({"score": [0.1, 0.2, 0.3]})))
+        merged = Batch.merge_column_wise([self.batch.project(["id"]), other])
+        self.assertTrue(merged.is_arrow())
+        self.assertEqual(merged.columns, ["id", "score"])
+
+        concatenated = Batch.concat([self.batch, self.batch])
+        self.assertTrue(concatenated.is_arrow())
+        self.assertEqual(
+            concatenated,
+            Batch(pd.concat([self.frames, self.frames], ignore_index=True)),
+        )
+
+    def test_alias_should_rename_table_columns(self):
+        self.batch.modify_column_alias(Alias("t"))
+        self.assertTrue(self.batch.is_arrow())
+        self.assertEqual(self.batch.columns, ["t.id", "t.label", "t.data"])
+        self.batch.drop_column_alias()
+        self.assertEqual(self.batch.columns, ["id", "label", "data"])
+
+    def test_frames_should_switch_to_pandas(self):
+        frames = self.batch.frames
+        frames["id"] = frames["id"] + 1
+        self.assertFalse(self.batch.is_arrow())
+        self.assertEqual(list(self.batch.frames["id"]), [1, 2, 3])
@@ -174,3 +174,129 @@ class BatchTest(unittest.TestCase):
 
         with self.assertRaises(AssertionError):
             batch.sort_orderby(by=["foo"])
+
+    def test_make_tensor_columns_contiguous_should_share_one_buffer(self):
+        frames = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(5)]
+        batch = Batch(pd.DataFrame({"id": range(5), "data": frames}))
+        batch.make_tensor_columns_contiguous()
+
+        tensor = batch.column_as_tensor("data")
+        self.assertEqual(tensor.shape, (5, 4, 4, 3))
+        self.assertTrue(tensor.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.array_equal(tensor, np.stack(frames)))
+        # the cells are views on the returned buffer
+        for idx, cell in enumerate(batch.frames["data"]):
+            self.assertTrue(np.shares_memory(cell, tensor[idx]))
+        self.assertTrue(np.shares_memory(batch.column_as_tensor("data"), tensor))
+
+        # slicing keeps the cells consecutive in the buffer
+        sliced = batch[1:3]
+        self.assertTrue(np.shares_memory(sliced.column_as_tensor("data"), tensor))
+        self.assertIsNone(batch.column_as_tensor("id"))
+
+    def test_make_tensor_columns_contiguous_should_skip_ragged_columns(self):
+        frames = [np.zeros((4, 4, 3)), np.zeros((2, 4, 3))]
+        batch = Batch(pd.DataFrame({"data": frames}))
+        batch.make_tensor_columns_contiguous()
+
+        self.assertIs(batch.frames["data"][0], frames[0])
+        self.assertIsNone(batch.column_as_tensor("data"))
+
+    def test_reassign_indices_to_hash_should_match_equal_keys(self):
+        left = Batch(
+            pd.DataFrame({"id": [1, 2, 3, None], "name": ["a", "b", "c", "d"]})
+        )
+        right = Batch(
+            pd.DataFrame(
+                {"key": [3.0, 1.0, 2.5, np.nan], "label": ["c", "a", "b", "d"]}
+            )
+        )
+        left.reassign_indices_to_hash(["id", "name"])
+        right.reassign_indices_to_hash(["key", "label"])
+
+        # INTEGER and FLOAT keys hash equally, NULL keys never match
+        joined = Batch.join(left, right)
+        self.assertEqual(sorted(joined.frames["name"].tolist()), ["a", "c"])
+
+    def test_nbytes_should_count_referenced_arrays_and_strings(self):
+        frames = pd.DataFrame(
+            {
+                "id": np.arange(4, dtype=np.int64),
+                "data": [np.zeros((8, 8, 3), dtype=np.uint8) for _ in range(4)],
+                "name": ["a" * 100] * 4,
+            }
+        )
+        nbytes = Batch(frames).nbytes
+
+        # id, data and name buffers plus the cells of the object columns
+        self.assertGreaterEqual(nbytes, 4 * 8 + 4 * 192 + 4 * 100)
+        self.assertLess(nbytes, 4 * 8 + 4 * 192 + 4 * 200 + 1024)
+
+    def test_project_and_alias_should_not_copy_the_columns(self):
+        frames = pd.DataFrame(
+            {
+                "id": np.arange(4, dtype=np.int64),
+                "score": np.arange(4, dtype=np.float64),
+                "data": [np.zeros((8, 8, 3), dtype=np.uint8) for _ in range(4)],
+            }
+        )
+        batch = Batch(frames)
+
+        projected = batch.project(["data", "id"])
+        projected.modify_column_alias("t1")
+        self.assertEqual(projected.columns, ["t1.data", "t1.id"])
+        self.assertEqual(batch.columns, ["id", "score", "data"])
+        self.assertTrue(
+            np.shares_memory(projected.frames["t1.id"].to_numpy(), frames["id"])
+        )
+        self.assertIs(projected.frames["t1.data"][0], frames["data"][0])
+
+        projected.drop_column_alias()
+        self.assertEqual(projected.columns, ["data", "id"])
+
+        # writing into a projection leaves the projected batch untouched
+        outcomes = batch.project(["id"])
+        outcomes.update_indices([0], Batch(pd.DataFrame({"id": [7]})))
+        self.assertEqual(outcomes.frames["id"][0], 7)
+        self.assertEqual(frames["id"][0], 0)
+
+    def test_iter_unnest_should_match_unnest_in_bounded_batches(self):
+        frames = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "label": [["a", "b", "c"], [], ["d"], "e"],
+                "score": [[1, 2, 3], [], [4], 5],
+            }
+        )
+        expected = Batch(frames.copy())
+        expected.unnest(["label", "score"])
+        expected.reset_index()
+
+        batches = list(Batch(frames).iter_unnest(["label", "score"], max_rows=2))
+        # the first input row alone exceeds max_rows
+        self.assertEqual([len(batch) for batch in batches], [3, 2])
+        self.assertEqual(Batch.concat(batches), expected)
+
+        with self.assertRaises(ValueError):
+            frames = pd.DataFrame({"label": [["a", "b"]], "score": [[1]]})
+            list(Batch(frames).iter_unnest(["label", "score"]))
+
+    def test_dictionary_encode_should_round_trip_repeated_strings(self):
+        frames = pd.DataFrame(
+            {
+                "label": ["car", "dog", "car", "car"],
+                "name": ["a", "b", "c", "d"],
+                "note": ["x", None, "x", "x"],
+            }
+        )
+        batch = Batch(frames.copy())
+        batch.dictionary_encode()
+
+        # unique and NULL values are left as is
+        self.assertIsInstance(batch.frames["label"].dtype, pd.CategoricalDtype)
+        self.assertEqual(batch.frames["name"].dtype, object)
+        self.assertEqual(batch.frames["note"].dtype, object)
+        self.assertEqual(list(batch.frames["label"].cat.categories), ["car", "dog"])
+
+        batch.dictionary_decode()
+        self.assertEqual(batch, Batch(frames))
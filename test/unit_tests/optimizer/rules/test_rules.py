@@ -18,12 +18,20 @@ from test.util import create_sample_video, get_evadb_for_testing
 import pytest
 from mock import MagicMock, patch
 
-from evadb.catalog.catalog_type import TableType
+from evadb.catalog.catalog_type import ColumnType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.logical_expression import LogicalExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
 from evadb.optimizer.operators import (
     LogicalFilter,
     LogicalGet,
     LogicalJoin,
+    LogicalProject,
     LogicalSample,
 )
 from evadb.optimizer.rules.rules import (
@@ -32,6 +40,7 @@ from evadb.optimizer.rules.rules import (
     CacheFunctionExpressionInProject,
     CombineSimilarityOrderByAndLimitToVectorIndexScan,
     EmbedFilterIntoGet,
+    EmbedProjectIntoGet,
     EmbedSampleIntoGet,
     LogicalApplyAndMergeToPhysical,
     LogicalApplyAndMergeToRayPhysical,
@@ -67,6 +76,7 @@ from evadb.optimizer.rules.rules import (
     Promise,
     PushDownFilterThroughApplyAndMerge,
     PushDownFilterThroughJoin,
+    PushDownProjectThroughApplyAndMerge,
     ReorderPredicates,
     Rule,
     RuleType,
@@ -74,6 +84,7 @@ from evadb.optimizer.rules.rules import (
     XformLateralJoinToLinearFlow,
 )
 from evadb.optimizer.rules.rules_manager import RulesManager, disable_rules
+from evadb.parser.alias import Alias
 from evadb.parser.types import JoinType
 from evadb.server.command_handler import execute_query_fetch_all
 from evadb.utils.generic_utils import is_ray_enabled_and_installed
@@ -100,9 +111,11 @@ class RulesTest(unittest.TestCase):
             Promise.LOGICAL_INNER_JOIN_COMMUTATIVITY,
             Promise.EMBED_FILTER_INTO_GET,
             Promise.EMBED_SAMPLE_INTO_GET,
+            Promise.EMBED_PROJECT_INTO_GET,
             Promise.XFORM_LATERAL_JOIN_TO_LINEAR_FLOW,
             Promise.PUSHDOWN_FILTER_THROUGH_JOIN,
             Promise.PUSHDOWN_FILTER_THROUGH_APPLY_AND_MERGE,
+            Promise.PUSHDOWN_PROJECT_THROUGH_APPLY_AND_MERGE,
             Promise.COMBINE_SIMILARITY_ORDERBY_AND_LIMIT_TO_VECTOR_INDEX_SCAN,
             Promise.REORDER_PREDICATES,
             Promise.XFORM_EXTRACT_OBJECT_TO_LINEAR_FLOW,
@@ -160,9 +173,11 @@ class RulesTest(unittest.TestCase):
             EmbedFilterIntoGet(),
             #    EmbedFilterIntoDerivedGet(),
             EmbedSampleIntoGet(),
+            EmbedProjectIntoGet(),
             XformLateralJoinToLinearFlow(),
             PushDownFilterThroughApplyAndMerge(),
             PushDownFilterThroughJoin(),
+            PushDownProjectThroughApplyAndMerge(),
             CombineSimilarityOrderByAndLimitToVectorIndexScan(),
             ReorderPredicates(),
             XformExtractObjectToLinearFlow(),
@@ -276,6 +291,62 @@ class RulesTest(unittest.TestCase):
 
         self.assertFalse(rule.check(logi_sample, MagicMock()))
 
+    def test_embed_filter_into_get_with_structured_data(self):
+        rule = EmbedFilterIntoGet()
+
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.STRUCTURED_DATA, file_url="foo"
+        )
+        id_col = TupleValueExpression(
+            "id", "foo", ColumnCatalogEntry("id", ColumnType.INTEGER), "foo.id"
+        )
+        data_col = TupleValueExpression(
+            "data", "foo", ColumnCatalogEntry("data", ColumnType.NDARRAY), "foo.data"
+        )
+        id_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER, id_col, ConstantValueExpression(3)
+        )
+        # the ndarray columns are serialized in storage
+        data_pred = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL, data_col, ConstantValueExpression(3)
+        )
+        predicate = LogicalExpression(ExpressionType.LOGICAL_AND, id_pred, data_pred)
+
+        logi_get = LogicalGet(MagicMock(), table_obj, Alias("foo"))
+        logi_filter = LogicalFilter(predicate, [logi_get])
+
+        self.assertTrue(rule.check(logi_filter, MagicMock()))
+        rewrite_opr = next(rule.apply(logi_filter, MagicMock()))
+        self.assertEqual(rewrite_opr.predicate, data_pred)
+        self.assertEqual(rewrite_opr.children[0].predicate, id_pred)
+
+    def test_embed_project_into_get(self):
+        rule = EmbedProjectIntoGet()
+
+        table_obj = TableCatalogEntry(
+            name="foo", table_type=TableType.STRUCTURED_DATA, file_url="foo"
+        )
+        target_list = [
+            TupleValueExpression("id", "foo", col_alias="foo.id"),
+            TupleValueExpression("label", "foo", col_alias="foo.label"),
+        ]
+        logi_get = LogicalGet(MagicMock(), table_obj, Alias("foo"))
+        logi_project = LogicalProject(target_list, [logi_get])
+
+        self.assertTrue(rule.check(logi_project, MagicMock()))
+        rewrite_opr = next(rule.apply(logi_project, MagicMock()))
+        self.assertEqual(
+            rewrite_opr.children[0].columns, [IDENTIFIER_COLUMN, "id", "label"]
+        )
+        # the rule is not applied again once the columns are pushed down
+        self.assertEqual(list(rule.apply(rewrite_opr, MagicMock())), [])
+
+        # the referenced columns of SELECT * are unknown
+        logi_project = LogicalProject(
+            [TupleValueExpression("*", "foo", col_alias="foo.*")], [logi_get]
+        )
+        self.assertEqual(list(rule.apply(logi_project, MagicMock())), [])
+
     def test_disable_rules(self):
         rules_manager = RulesManager()
         with disable_rules(rules_manager, [PushDownFilterThroughApplyAndMerge()]):
@@ -33,6 +33,7 @@ from evadb.parser.create_statement import (
 )
 from evadb.parser.delete_statement import DeleteTableStatement
 from evadb.parser.drop_object_statement import DropObjectStatement
+from evadb.parser.export_statement import ExportFunctionCacheStatement
 from evadb.parser.insert_statement import InsertTableStatement
 from evadb.parser.load_statement import LoadDataStatement
 from evadb.parser.parser import Parser
@@ -911,6 +912,18 @@ class ParserTests(unittest.TestCase):
 
         self.assertEqual(show_config_stmt, expected_stmt)
 
+    def test_show_function_stats_statement(self):
+        parser = Parser()
+        evadb_statement_list = parser.parse("SHOW FUNCTION STATS;")
+
+        self.assertIsInstance(evadb_statement_list, list)
+        self.assertEqual(len(evadb_statement_list), 1)
+        self.assertEqual(evadb_statement_list[0].stmt_type, StatementType.SHOW)
+
+        expected_stmt = ShowStatement(show_type=ShowType.FUNCTION_STATS)
+        self.assertEqual(evadb_statement_list[0], expected_stmt)
+        self.assertEqual(str(evadb_statement_list[0]), "SHOW FUNCTION STATS")
+
     def test_create_predict_function_statement(self):
         parser = Parser()
         create_func_query = """
@@ -999,6 +1012,35 @@ class ParserTests(unittest.TestCase):
 
         self.assertEqual(create_func_stmt, expected_stmt)
 
+    def test_create_function_cache_from_statement(self):
+        parser = Parser()
+        create_func_query = """CREATE FUNCTION ChatGPT IMPL 'chatgpt.py'
+                  model 'gpt-3.5-turbo'
+                  CACHE FROM 'snapshots/chatgpt.evc';
+        """
+        evadb_statement_list = parser.parse(create_func_query)
+        self.assertEqual(len(evadb_statement_list), 1)
+        self.assertEqual(
+            evadb_statement_list[0].metadata,
+            [("model", "gpt-3.5-turbo"), ("cache_from", "snapshots/chatgpt.evc")],
+        )
+
+    def test_export_function_cache_statement(self):
+        parser = Parser()
+        evadb_statement_list = parser.parse(
+            "EXPORT FUNCTION CACHE ChatGPT TO 'snapshots/chatgpt.evc';"
+        )
+        self.assertEqual(len(evadb_statement_list), 1)
+        self.assertEqual(
+            evadb_statement_list[0].stmt_type, StatementType.EXPORT_FUNCTION_CACHE
+        )
+        expected_stmt = ExportFunctionCacheStatement("ChatGPT", "snapshots/chatgpt.evc")
+        self.assertEqual(evadb_statement_list[0], expected_stmt)
+        self.assertEqual(
+            str(evadb_statement_list[0]),
+            "EXPORT FUNCTION CACHE ChatGPT TO 'snapshots/chatgpt.evc'",
+        )
+
     def test_load_video_data_statement(self):
         parser = Parser()
         load_data_query = """LOAD VIDEO 'data/video.mp4'
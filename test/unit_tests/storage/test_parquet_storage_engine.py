@@ -0,0 +1,174 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+import unittest
+from test.markers import arrow_skip_marker
+from test.util import get_evadb_for_testing, suffix_pytest_xdist_worker_id_to_dir
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
+from evadb.catalog.models.column_catalog import ColumnCatalogEntry
+from evadb.catalog.models.table_catalog import TableCatalogEntry
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+
+
+@arrow_skip_marker
+@pytest.mark.notparallel
+class ParquetStorageEngineTest(unittest.TestCase):
+    def setUp(self):
+        from evadb.storage.parquet_storage_engine import ParquetStorageEngine
+
+        self.evadb = get_evadb_for_testing()
+        self.engine = ParquetStorageEngine(self.evadb)
+        self.table = TableCatalogEntry(
+            "dataset",
+            str(suffix_pytest_xdist_worker_id_to_dir("dataset.parquet")),
+            table_type=TableType.STRUCTURED_DATA,
+        )
+        self.table.columns = [
+            ColumnCatalogEntry(IDENTIFIER_COLUMN, ColumnType.INTEGER),
+            ColumnCatalogEntry("id", ColumnType.INTEGER),
+            ColumnCatalogEntry("label", ColumnType.TEXT),
+            ColumnCatalogEntry(
+                "emb", ColumnType.NDARRAY, False, NdArrayType.FLOAT32, [4]
+            ),
+        ]
+        self.engine.create(self.table)
+
+    def tearDown(self):
+        shutil.rmtree(self.table.file_url, ignore_errors=True)
+
+    def _write(self, ids):
+        self.engine.write(
+            self.table,
+            Batch(
+                pd.DataFrame(
+                    {
+                        "id": ids,
+                        "label": ["car" if i % 2 else "dog" for i in ids],
+                        "emb": [np.full(4, i, dtype=np.float32) for i in ids],
+                    }
+                )
+            ),
+        )
+
+    def _read(self, **kwargs):
+        batches = list(self.engine.read(self.table, **kwargs))
+        return Batch.concat(batches, copy=False) if batches else Batch()
+
+    def test_should_read_written_rows(self):
+        self._write(range(0, 5))
+        self._write(range(5, 8))
+        batch = self._read()
+
+        self.assertEqual(
+            batch.columns, [IDENTIFIER_COLUMN, "id", "label", "emb", ROW_NUM_COLUMN]
+        )
+        self.assertEqual(list(batch.frames[IDENTIFIER_COLUMN]), list(range(1, 9)))
+        self.assertEqual(list(batch.frames["id"]), list(range(8)))
+        self.assertEqual(list(batch.frames["label"])[:2], ["dog", "car"])
+        emb = batch.frames["emb"]
+        self.assertEqual(emb[7].dtype, np.float32)
+        np.testing.assert_array_equal(emb[7], np.full(4, 7, dtype=np.float32))
+
+    def test_should_read_projected_columns_in_bounded_batches(self):
+        self._write(range(100))
+        batches = list(self.engine.read(self.table, batch_mem_size=100, columns=["id"]))
+
+        self.assertGreater(len(batches), 1)
+        self.assertEqual(batches[0].columns, [IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN])
+        self.assertEqual(sum(len(batch) for batch in batches), 100)
+
+    def test_should_skip_row_groups_with_the_statistics(self):
+        self._write(range(0, 10))
+        self._write(range(10, 20))
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(name="id"),
+            ConstantValueExpression(12),
+        )
+        batch = self._read(predicate=predicate)
+        self.assertEqual(list(batch.frames["id"]), list(range(10, 20)))
+
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_LEQ,
+            ConstantValueExpression(100),
+            TupleValueExpression(name="id"),
+        )
+        self.assertTrue(self._read(predicate=predicate).empty())
+
+    def test_should_delete_rows(self):
+        self._write(range(0, 5))
+        self._write(range(5, 8))
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_LESSER,
+            TupleValueExpression(name="id", col_alias="id"),
+            ConstantValueExpression(6),
+        )
+        self.engine.delete(self.table, predicate)
+        self.assertEqual(list(self._read().frames["id"]), [6, 7])
+
+        # the row ids are not reused
+        self._write([8])
+        self.assertEqual(list(self._read().frames[IDENTIFIER_COLUMN]), [7, 8, 9])
+
+    def test_should_not_reuse_the_row_ids_of_the_last_file(self):
+        self._write(range(0, 5))
+        self._write(range(5, 8))
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(name="id", col_alias="id"),
+            ConstantValueExpression(2),
+        )
+        # deletes the whole last file and the largest ids of the first one
+        self.engine.delete(self.table, predicate)
+        self.assertEqual(list(self._read().frames["id"]), [0, 1, 2])
+
+        self._write([8])
+        self.assertEqual(list(self._read().frames[IDENTIFIER_COLUMN]), [1, 2, 3, 9])
+
+    def test_should_serialize_cells_of_different_shapes(self):
+        self.engine.write(
+            self.table,
+            Batch(pd.DataFrame({"id": [1, 2], "emb": [np.zeros(2), np.ones((2, 3))]})),
+        )
+        batch = self._read()
+        self.assertEqual(batch.frames["emb"][1].shape, (2, 3))
+        self.assertIsNone(batch.frames["label"][0])
+
+    def test_should_read_arrow_batches(self):
+        from evadb.models.storage.arrow_batch import ArrowBatch
+
+        self._write(range(3))
+        catalog = self.evadb.catalog()
+        catalog.upsert_configuration_catalog_entry("batch_backend", "arrow")
+        try:
+            batches = list(self.engine.read(self.table))
+        finally:
+            catalog.upsert_configuration_catalog_entry("batch_backend", "pandas")
+        self.assertIsInstance(batches[0], ArrowBatch)
+        self.assertEqual(list(batches[0].frames["id"]), [0, 1, 2])
+
+    def test_rename(self):
+        with pytest.raises(Exception):
+            self.engine.rename(self.table, None)
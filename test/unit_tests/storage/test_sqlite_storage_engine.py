@@ -15,18 +15,26 @@
 import shutil
 import unittest
 from test.util import (
+    NUM_FRAMES,
     create_dummy_batches,
     get_evadb_for_testing,
     suffix_pytest_xdist_worker_id_to_dir,
 )
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from evadb.catalog.catalog_type import ColumnType, NdArrayType, TableType
 from evadb.catalog.models.column_catalog import ColumnCatalogEntry
 from evadb.catalog.models.table_catalog import TableCatalogEntry
-from evadb.catalog.sql_config import IDENTIFIER_COLUMN
-from evadb.storage.sqlite_storage_engine import SQLStorageEngine
+from evadb.catalog.sql_config import IDENTIFIER_COLUMN, ROW_NUM_COLUMN
+from evadb.expression.abstract_expression import ExpressionType
+from evadb.expression.comparison_expression import ComparisonExpression
+from evadb.expression.constant_value_expression import ConstantValueExpression
+from evadb.expression.tuple_value_expression import TupleValueExpression
+from evadb.models.storage.batch import Batch
+from evadb.storage.sqlite_storage_engine import SQL_FETCH_SIZE, SQLStorageEngine
 
 
 @pytest.mark.notparallel
@@ -88,6 +96,89 @@ class SQLStorageEngineTest(unittest.TestCase):
         # clean up
         sqlengine.drop(self.table)
 
+    def test_should_read_columns_and_rows_satisfying_predicate(self):
+        dummy_batches = list(create_dummy_batches())
+        dummy_batches = [batch.project(batch.columns[1:]) for batch in dummy_batches]
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        sqlengine.create(self.table)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            sqlengine.write(self.table, batch)
+
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GEQ,
+            TupleValueExpression("id"),
+            ConstantValueExpression(5),
+        )
+        read_batch = Batch.concat(
+            sqlengine.read(
+                self.table, batch_mem_size=3000, columns=["id"], predicate=predicate
+            )
+        )
+        self.assertEqual(read_batch.columns, [IDENTIFIER_COLUMN, "id", ROW_NUM_COLUMN])
+        self.assertEqual(
+            list(read_batch.column_as_numpy_array("id")), list(range(5, NUM_FRAMES))
+        )
+        # clean up
+        sqlengine.drop(self.table)
+
+    def create_structured_table(self, name):
+        table_info = TableCatalogEntry(name, name, table_type=TableType.STRUCTURED_DATA)
+        table_info.columns = [
+            ColumnCatalogEntry(
+                IDENTIFIER_COLUMN, ColumnType.INTEGER, is_nullable=False
+            ),
+            ColumnCatalogEntry("id", ColumnType.INTEGER),
+        ]
+        return table_info
+
+    def test_should_read_while_the_session_commits_writes(self):
+        # CREATE TABLE AS SELECT writes and commits every batch it reads
+        num_rows = 3 * SQL_FETCH_SIZE + 7
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        source = self.create_structured_table("source_table")
+        target = self.create_structured_table("target_table")
+        sqlengine.create(source)
+        sqlengine.create(target)
+        sqlengine.write(source, Batch(pd.DataFrame({"id": np.arange(num_rows)})))
+
+        num_batches = 0
+        for batch in sqlengine.read(source, batch_mem_size=1000):
+            sqlengine.write(target, batch.project(["id"]))
+            num_batches += 1
+        self.assertGreater(num_batches, 1)
+
+        read_batch = Batch.concat(sqlengine.read(target))
+        self.assertEqual(
+            list(read_batch.column_as_numpy_array("id")), list(range(num_rows))
+        )
+        # clean up
+        sqlengine.drop(source)
+        sqlengine.drop(target)
+
+    def test_should_stop_reading_on_limit(self):
+        num_rows = 2 * SQL_FETCH_SIZE + 7
+        evadb = get_evadb_for_testing()
+        sqlengine = SQLStorageEngine(evadb)
+        table = self.create_structured_table("limit_table")
+        sqlengine.create(table)
+        sqlengine.write(table, Batch(pd.DataFrame({"id": np.arange(num_rows)})))
+
+        # LIMIT consumes the first batch and closes the scan
+        reader = sqlengine.read(table, batch_mem_size=1000)
+        batch = next(reader)
+        reader.close()
+        self.assertLess(len(batch), num_rows)
+
+        # the closed scan does not hold on to the table
+        sqlengine.write(table, Batch(pd.DataFrame({"id": [num_rows]})))
+        read_batch = Batch.concat(sqlengine.read(table, columns=["id"]))
+        self.assertEqual(len(read_batch), num_rows + 1)
+        # clean up
+        sqlengine.drop(table)
+
     def test_rename(self):
         table_info = TableCatalogEntry(
             "new_name", "new_name", table_type=TableType.VIDEO_DATA
@@ -0,0 +1,126 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gzip
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from mock import MagicMock
+
+from evadb.catalog.catalog_type import ColumnType
+from evadb.catalog.models.utils import (
+    ColumnCatalogEntry,
+    FunctionCacheCatalogEntry,
+    FunctionCatalogEntry,
+)
+from evadb.utils.errors import CatalogError
+from evadb.utils.function_cache_snapshot import (
+    _decode,
+    _encode,
+    export_function_cache,
+    import_function_cache,
+)
+from evadb.utils.kv_cache import DiskKVCache
+
+
+class FunctionCacheSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+        self.snapshot = str(self.path / "snapshot.evc")
+
+        function_obj = FunctionCatalogEntry("Upper", "upper.py", "t", "", row_id=3)
+        cache_entry = FunctionCacheCatalogEntry(
+            "Upper[3](t.txt[2])", 3, str(self.path / "exported"), ("t.txt[2]",)
+        )
+        DiskKVCache(cache_entry.cache_path).set_many([b"a", b"b"], ["A", "B"])
+        catalog = MagicMock()
+        catalog.get_function_cache_catalog_entries_by_function.return_value = [
+            cache_entry
+        ]
+        counts = export_function_cache(catalog, function_obj, self.snapshot)
+        self.assertEqual(counts["function_cache_entries"], 2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_should_remap_row_ids_on_import(self):
+        function_obj = FunctionCatalogEntry("Upper", "upper.py", "t", "", row_id=7)
+        cache_entry = FunctionCacheCatalogEntry(
+            "Upper[7](t.txt[5])", 7, str(self.path / "imported"), ("t.txt[5]",)
+        )
+        catalog = MagicMock()
+        catalog.check_table_exists.return_value = True
+        catalog.get_column_catalog_entry.return_value = ColumnCatalogEntry(
+            "txt", ColumnType.TEXT, table_name="t", row_id=5
+        )
+        catalog.get_function_cache_catalog_entry_by_name.return_value = None
+        catalog.insert_function_cache_catalog_entry_with_name.return_value = cache_entry
+
+        counts = import_function_cache(catalog, function_obj, self.snapshot)
+
+        self.assertEqual(counts["function_cache_entries"], 2)
+        catalog.insert_function_cache_catalog_entry_with_name.assert_called_once_with(
+            "Upper[7](t.txt[5])", function_obj, ("t.txt[5]",), [7], [5]
+        )
+        cache = DiskKVCache(cache_entry.cache_path)
+        self.assertEqual(cache.get_many([b"a", b"b"]), ["A", "B"])
+
+    def test_should_skip_caches_of_missing_tables(self):
+        function_obj = FunctionCatalogEntry("Upper", "upper.py", "t", "", row_id=7)
+        catalog = MagicMock()
+        catalog.check_table_exists.return_value = False
+        catalog.get_function_catalog_entry_by_name.return_value = None
+
+        counts = import_function_cache(catalog, function_obj, self.snapshot)
+
+        self.assertEqual(counts["function_cache_entries"], 0)
+        catalog.insert_function_cache_catalog_entry_with_name.assert_not_called()
+
+    def test_should_round_trip_function_outputs(self):
+        value = {
+            "frames": np.arange(6, dtype="uint8").reshape(2, 3),
+            "labels": np.array(["car", "bus"]),
+            "boxes": np.array([np.zeros((1, 4)), np.ones((2, 4))], dtype=object),
+            "scores": (np.float32(0.5), [1, None, "a"]),
+            b"key": b"\x00\xff",
+        }
+        decoded = _decode(_encode(value))
+        np.testing.assert_array_equal(decoded["frames"], value["frames"])
+        np.testing.assert_array_equal(decoded["labels"], value["labels"])
+        self.assertEqual(decoded["boxes"].dtype, object)
+        np.testing.assert_array_equal(decoded["boxes"][1], value["boxes"][1])
+        self.assertEqual(decoded["scores"], value["scores"])
+        self.assertEqual(decoded[b"key"], b"\x00\xff")
+
+    def test_should_not_unpickle_snapshots(self):
+        class Payload:
+            def __reduce__(self):
+                return (Path(self.marker).touch, ())
+
+        Payload.marker = str(self.path / "unpickled")
+        with gzip.open(self.snapshot, "wb") as f:
+            pickle.dump({"version": 1}, f)
+            pickle.dump(Payload(), f)
+        function_obj = FunctionCatalogEntry("Upper", "upper.py", "t", "", row_id=7)
+        with self.assertRaises(CatalogError):
+            import_function_cache(MagicMock(), function_obj, self.snapshot)
+
+        # pickled arrays smuggled into a json snapshot are not loaded either
+        with self.assertRaises(CatalogError):
+            _decode({"ndarray": "gASVAAAAAAAAAAA="})
+        self.assertFalse(Path(Payload.marker).exists())
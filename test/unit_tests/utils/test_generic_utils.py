@@ -14,7 +14,14 @@
 # limitations under the License.
 import unittest
 
-from evadb.utils.generic_utils import string_comparison_case_insensitive
+import numpy as np
+
+from evadb.utils.generic_utils import (
+    NdArraySerializer,
+    PickleSerializer,
+    get_ndarray_serializer,
+    string_comparison_case_insensitive,
+)
 
 
 class GenericUtilsTests(unittest.TestCase):
@@ -44,3 +51,41 @@ class GenericUtilsTests(unittest.TestCase):
         self.assertFalse(test_string_no_match)
         self.assertFalse(test_one_string_null)
         self.assertFalse(test_both_strings_null)
+
+    def test_ndarray_serializer_round_trip(self):
+        serializer = NdArraySerializer()
+        embedding = np.random.rand(2, 512).astype(np.float32)
+        data = serializer.serialize(embedding)
+        self.assertTrue(data.startswith(NdArraySerializer.MAGIC))
+        self.assertLess(len(data), len(PickleSerializer.serialize(embedding)))
+
+        value = NdArraySerializer.deserialize(data)
+        self.assertEqual(value.dtype, np.float32)
+        np.testing.assert_array_equal(value, embedding)
+        # writable, as the unpickled arrays
+        value[0, 0] = 1
+
+        # a row of arrays of different shapes and dtypes
+        row = np.empty(2, dtype=object)
+        row[0] = embedding
+        row[1] = np.array(["car", "bus"])
+        value = NdArraySerializer.deserialize(serializer.serialize(row))
+        self.assertEqual(value.dtype, object)
+        np.testing.assert_array_equal(value[0], embedding)
+        np.testing.assert_array_equal(value[1], row[1])
+
+        # the other values are pickled
+        data = serializer.serialize(["car", 1])
+        self.assertFalse(data.startswith(NdArraySerializer.MAGIC))
+        self.assertEqual(NdArraySerializer.deserialize(data), ["car", 1])
+
+    def test_ndarray_serializer_reads_pickled_values(self):
+        embedding = np.arange(12, dtype=np.float32).reshape(3, 4)
+        value = NdArraySerializer.deserialize(PickleSerializer.serialize(embedding))
+        np.testing.assert_array_equal(value, embedding)
+
+    def test_get_ndarray_serializer(self):
+        self.assertIs(get_ndarray_serializer("pickle"), PickleSerializer)
+        self.assertIsInstance(get_ndarray_serializer("raw"), NdArraySerializer)
+        with self.assertRaises(ValueError):
+            get_ndarray_serializer("gzip")
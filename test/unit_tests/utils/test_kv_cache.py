@@ -0,0 +1,221 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+import pandas as pd
+from diskcache import Cache, Timeout
+from mock import patch
+
+from evadb.utils.kv_cache import (
+    DiskKVCache,
+    LRUMemoryCache,
+    build_cache_keys,
+    drop_memory_tier,
+)
+
+
+class DiskKVCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskKVCache(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_many_and_set_many(self):
+        keys = [f"key_{i}".encode() for i in range(10)]
+        values = [np.array([i, str(i)], dtype=object) for i in range(10)]
+        self.cache.set_many(keys[:5], values[:5])
+
+        cached = self.cache.get_many(keys)
+        for i in range(5):
+            np.testing.assert_array_equal(cached[i], values[i])
+        self.assertEqual(cached[5:], [None] * 5)
+
+        # bulk and single key APIs should route to the same shards
+        self.assertIsNone(self.cache.get(keys[7]))
+        self.cache.set(keys[7], values[7])
+        np.testing.assert_array_equal(self.cache.get_many([keys[7]])[0], values[7])
+        np.testing.assert_array_equal(self.cache.get(keys[3]), values[3])
+
+    def test_should_store_arrays_with_typed_serializer(self):
+        embedding = np.random.rand(128).astype(np.float32)
+        row = np.empty(1, dtype=object)
+        row[0] = embedding
+        self.cache.set(b"key", row)
+        value = self.cache.get(b"key")
+        self.assertEqual(value.dtype, object)
+        np.testing.assert_array_equal(value[0], embedding)
+
+    def test_items(self):
+        keys = [f"key_{i}".encode() for i in range(10)]
+        self.cache.set_many(keys, list(range(10)))
+        self.assertEqual(dict(self.cache.items()), dict(zip(keys, range(10))))
+
+    def test_should_report_busy_shards_as_misses(self):
+        self.cache.set_many([b"a", b"b"], ["value_a", "value_b"])
+        with patch.object(Cache, "get", side_effect=Timeout):
+            self.assertIsNone(self.cache.get(b"a"))
+            self.assertEqual(self.cache.get_many([b"a", b"b"]), [None, None])
+        self.assertEqual(self.cache.get(b"a"), "value_a")
+
+    def test_should_evict_beyond_max_cache_size(self):
+        cache = DiskKVCache(
+            self.tmp_dir.name + "/bounded", max_cache_size=2**20, shards=1
+        )
+        keys = [f"key_{i}".encode() for i in range(20)]
+        cache.set_many(keys, [b"x" * 100000] * 20)
+
+        cached = cache.get_many(keys)
+        self.assertGreater(cache.disk_stats.evictions, 0)
+        self.assertEqual(cached.count(None), cache.disk_stats.evictions)
+        self.assertLess(cached.count(None), len(keys))
+
+    @patch("evadb.utils.kv_cache.CULL_INTERVAL", 0)
+    @patch("evadb.utils.kv_cache.time.time")
+    def test_should_expire_after_ttl(self, time_mock):
+        time_mock.return_value = 1000.0
+        cache = DiskKVCache(
+            self.tmp_dir.name + "/ttl", ttl=60, memory_cache_size=2**20
+        )
+        cache.set_many([b"a", b"b"], ["value_a", "value_b"])
+        self.assertEqual(cache.get(b"a"), "value_a")
+
+        time_mock.return_value = 1061.0
+        self.assertEqual(cache.get_many([b"a", b"b"]), [None, None])
+        self.assertEqual(cache.memory_stats.expirations, 2)
+        cache.set(b"c", "value_c")
+        self.assertEqual(cache.disk_stats.expirations, 2)
+        drop_memory_tier(self.tmp_dir.name + "/ttl")
+
+    def test_should_cull_at_most_once_per_interval(self):
+        with patch.object(self.cache._cache, "cull", return_value=0) as cull:
+            self.cache.set(b"a", "value_a")
+            self.cache.set_many([b"b", b"c"], ["value_b", "value_c"])
+            self.assertEqual(cull.call_count, 1)
+
+            with patch("evadb.utils.kv_cache.CULL_INTERVAL", 0):
+                self.cache._next_cull = 0.0
+                self.cache.set(b"d", "value_d")
+                self.cache.set(b"e", "value_e")
+            self.assertEqual(cull.call_count, 3)
+
+    def test_build_cache_keys(self):
+        frames = pd.DataFrame(
+            {
+                "id": [1, 2, 1, 1],
+                "name": ["a", "a", "a", "b"],
+                "data": [np.zeros((2, 2)), np.zeros((2, 2)), np.zeros((2, 2)), None],
+            }
+        )
+        keys = build_cache_keys(frames)
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(keys[0], keys[2])
+        self.assertEqual(len(set(keys)), 3)
+
+        # same values with a different shape should not collide
+        reshaped = frames.copy()
+        reshaped.at[0, "data"] = np.zeros((4, 1))
+        self.assertNotEqual(build_cache_keys(reshaped)[0], keys[0])
+
+    def test_build_cache_keys_of_fixed_width_columns(self):
+        frames = pd.DataFrame(
+            {
+                "id": np.arange(1000) % 500,
+                "other_id": np.arange(1000) % 500,
+                "flag": np.zeros(1000, dtype=bool),
+            }
+        )
+        keys = build_cache_keys(frames)
+        self.assertEqual(len(set(keys)), 500)
+        self.assertEqual(keys[:500], keys[500:])
+        self.assertTrue(all(len(key) == 16 for key in keys))
+
+        # the values are hashed with their position in the row
+        swapped = pd.DataFrame({"id": [1, 2], "other_id": [2, 1], "flag": False})
+        self.assertNotEqual(*build_cache_keys(swapped))
+        self.assertEqual(build_cache_keys(frames.iloc[:0]), [])
+
+    def test_memory_tier_is_shared_across_instances(self):
+        cache = DiskKVCache(self.tmp_dir.name, memory_cache_size=2**20)
+        cache.set_many([b"a", b"b"], ["value_a", "value_b"])
+        self.assertEqual(
+            cache.get_many([b"a", b"b", b"c"]), ["value_a", "value_b", None]
+        )
+        self.assertEqual(cache.memory_stats.hits, 2)
+
+        # a new cache object on the same path reuses the warm memory tier
+        other = DiskKVCache(self.tmp_dir.name, memory_cache_size=2**20)
+        self.assertEqual(other.get(b"a"), "value_a")
+        self.assertEqual(other.memory_stats.hits, 3)
+
+        # entries written without the memory tier are promoted on first access
+        self.cache.set(b"d", "value_d")
+        self.assertEqual(other.get_many([b"d"]), ["value_d"])
+        self.assertEqual(other.get(b"d"), "value_d")
+        self.assertEqual(other.memory_stats.hits, 4)
+        drop_memory_tier(self.tmp_dir.name)
+
+    def test_should_not_promote_keys_of_busy_shards(self):
+        cache = DiskKVCache(self.tmp_dir.name + "/busy", memory_cache_size=2**20)
+        with patch.object(Cache, "set", side_effect=Timeout):
+            cache.set_many([b"a", b"b"], ["value_a", "value_b"])
+        self.assertEqual(len(cache._memory), 0)
+        self.assertEqual(cache.get_many([b"a", b"b"]), [None, None])
+        drop_memory_tier(self.tmp_dir.name + "/busy")
+
+
+class LRUMemoryCacheTests(unittest.TestCase):
+    def test_should_evict_least_recently_used_by_size(self):
+        value = np.zeros(1000, dtype=np.uint8)
+        cache = LRUMemoryCache(max_size=2500)
+        cache.set("a", value)
+        cache.set("b", value.copy())
+        self.assertIsNotNone(cache.get("a"))
+
+        cache.set("c", value.copy())
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertGreaterEqual(cache.stats.evicted_bytes, value.nbytes)
+        self.assertLessEqual(cache.size, 2500)
+
+        # values larger than the cache are not admitted
+        cache.set("d", np.zeros(4000, dtype=np.uint8))
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(len(cache), 2)
+
+    def test_should_account_size_under_concurrent_access(self):
+        value = np.zeros(100, dtype=np.uint8)
+        cache = LRUMemoryCache(max_size=5000)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.set((offset, i % 80), value)
+                cache.get((offset, (i + 1) % 80))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(cache.size, 5000)
+        self.assertEqual(
+            cache.size, sum(nbytes for _, nbytes, _ in cache._entries.values())
+        )
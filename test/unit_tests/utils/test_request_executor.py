@@ -0,0 +1,97 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+
+from mock import MagicMock
+
+from evadb.utils.request_executor import ConcurrentRequestExecutor, TokenBucket
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after):
+        self.response = MagicMock(headers={"retry-after": str(retry_after)})
+
+
+class AuthenticationError(Exception):
+    status_code = 401
+
+
+class ConcurrentRequestExecutorTests(unittest.TestCase):
+    def test_should_preserve_order_and_bound_concurrency(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def request(item):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            # later items finish first
+            time.sleep(0.01 * (10 - item))
+            with lock:
+                in_flight[0] -= 1
+            return item * 2
+
+        executor = ConcurrentRequestExecutor(max_concurrency=4)
+        self.assertEqual(executor.map(request, range(10)), [i * 2 for i in range(10)])
+        self.assertEqual(in_flight[1], 4)
+
+    def test_should_back_off_on_rate_limit_errors(self):
+        calls = []
+
+        def request(item):
+            calls.append(item)
+            if len(calls) == 1:
+                raise RateLimitError(retry_after=0.05)
+            return item
+
+        executor = ConcurrentRequestExecutor(
+            max_concurrency=1, requests_per_minute=6000, initial_backoff=0.01
+        )
+        start = time.perf_counter()
+        self.assertEqual(executor.map(request, [1, 2]), [1, 2])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        self.assertEqual(calls, [1, 1, 2])
+
+    def test_should_raise_after_max_retries(self):
+        request = MagicMock(side_effect=ValueError("failed"))
+        executor = ConcurrentRequestExecutor(max_retries=2, initial_backoff=0.001)
+        with self.assertRaises(ValueError):
+            executor.map(request, [1])
+        self.assertEqual(request.call_count, 3)
+
+    def test_should_not_retry_client_errors(self):
+        request = MagicMock(side_effect=AuthenticationError("invalid api key"))
+        executor = ConcurrentRequestExecutor(max_retries=2, initial_backoff=0.001)
+        with self.assertRaises(AuthenticationError):
+            executor.map(request, [1])
+        self.assertEqual(request.call_count, 1)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_should_limit_rate_and_adapt(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        start = time.perf_counter()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 50)
+        bucket.speed_up()
+        self.assertEqual(bucket.rate, 51)
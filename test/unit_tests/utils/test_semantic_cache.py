@@ -0,0 +1,164 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+from mock import MagicMock, patch
+
+from evadb.catalog.models.utils import (
+    FunctionCatalogEntry,
+    FunctionMetadataCatalogEntry,
+)
+from evadb.utils.semantic_cache import SemanticCache, get_semantic_cache_path
+
+
+def bag_of_words(texts):
+    vocabulary = ["who", "is", "what", "sachin", "tendulkar", "weather", "today"]
+    return np.array(
+        [
+            [text.lower().split().count(word) for word in vocabulary] + [0.01]
+            for text in texts
+        ]
+    )
+
+
+class SemanticCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_should_return_similar_prompt_responses(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        self.assertIsNone(cache.lookup("who is sachin tendulkar"))
+
+        cache.update("who is sachin tendulkar", "A cricketer", namespace="gpt")
+        self.assertEqual(
+            cache.lookup("who is sachin tendulkar", namespace="gpt"), "A cricketer"
+        )
+        self.assertEqual(
+            cache.lookup("Who is Sachin Tendulkar", namespace="gpt"), "A cricketer"
+        )
+        # other models and dissimilar prompts do not hit
+        self.assertIsNone(cache.lookup("who is sachin tendulkar", namespace="gpt4"))
+        self.assertIsNone(cache.lookup("what is the weather today", namespace="gpt"))
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_should_record_stats(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        cache.update("who is sachin tendulkar", "A cricketer", tokens=10)
+
+        cache.lookup("who is sachin tendulkar", expected="A cricketer")
+        cache.lookup("Who is Sachin Tendulkar", expected="A batsman")
+        cache.lookup("what is the weather today")
+
+        stats = cache.stats
+        self.assertEqual((stats.hits, stats.misses, stats.semantic_hits), (2, 1, 1))
+        self.assertEqual(stats.tokens_saved, 20)
+        self.assertEqual(stats.labeled_hits, 2)
+        self.assertEqual(stats.false_positive_rate, 0.5)
+        self.assertGreater(stats.embedding_timer.total_elapsed_time, 0)
+        self.assertGreater(stats.lookup_timer.total_elapsed_time, 0)
+
+    def test_should_embed_a_batch_once_and_reuse_embeddings_on_insert(self):
+        embed = MagicMock(side_effect=bag_of_words)
+        cache = SemanticCache(self.tmp_dir.name, embed=embed)
+        cache.update("who is sachin tendulkar", "A cricketer")
+        embed.reset_mock()
+
+        prompts = ["Who is Sachin Tendulkar", "what is the weather today", "today"]
+        responses = cache.lookup_many(prompts)
+        self.assertEqual(responses, ["A cricketer", None, None])
+        embed.assert_called_once_with(prompts)
+
+        cache.update_many(prompts[1:], ["Sunny", "Monday"])
+        embed.assert_called_once()
+        self.assertEqual(cache.lookup_many(prompts[1:]), ["Sunny", "Monday"])
+
+    def test_should_survive_restarts(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        cache.update("who is sachin tendulkar", "A cricketer")
+        cache.persist()
+
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        self.assertEqual(cache.lookup("Who is Sachin Tendulkar"), "A cricketer")
+
+    def test_should_import_exported_entries_without_embedding(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        cache.update("who is sachin tendulkar", "A cricketer", tokens=10)
+        cache.update("what is the weather today", "Sunny", namespace="gpt")
+        cache.persist()
+        entries, embeddings = cache.export_entries()
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(embeddings.shape, (2, 8))
+
+        with tempfile.TemporaryDirectory() as other_dir:
+            embed = MagicMock(side_effect=bag_of_words)
+            other = SemanticCache(other_dir, embed=embed)
+            other.import_entries(entries, embeddings)
+            embed.assert_not_called()
+            self.assertEqual(
+                other.lookup_many(
+                    ["Who is Sachin Tendulkar", "what is the weather today"]
+                ),
+                ["A cricketer", None],
+            )
+            self.assertEqual(
+                other.lookup("what is the weather today", namespace="gpt"), "Sunny"
+            )
+            self.assertEqual(other.stats.tokens_saved, 10)
+
+    def test_should_not_export_entries_missing_from_the_index(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        cache.update("who is sachin tendulkar", "A cricketer")
+        cache.persist()
+        cache.update("what is the weather today", "Sunny")
+
+        # the second entry is stored but the index was not persisted after it
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words)
+        entries, embeddings = cache.export_entries()
+        self.assertEqual([entry[2] for _, entry in entries], ["A cricketer"])
+        self.assertEqual(embeddings.shape, (1, 8))
+
+    @patch("evadb.utils.kv_cache.CULL_INTERVAL", 0)
+    def test_should_drop_expired_responses_from_the_index(self):
+        cache = SemanticCache(self.tmp_dir.name, embed=bag_of_words, ttl=0.05)
+        cache.update_many(
+            ["who is sachin tendulkar", "what is the weather today"], ["A", "B"]
+        )
+        time.sleep(0.1)
+        # the write expires the two responses, the index is then rebuilt
+        cache.update("today", "Monday")
+        self.assertEqual(cache._index.size, 1)
+        self.assertIsNone(cache.lookup("Who is Sachin Tendulkar"))
+        self.assertEqual(cache.lookup("today"), "Monday")
+
+    def test_should_resolve_the_semantic_cache_path_of_functions(self):
+        function_obj = FunctionCatalogEntry(
+            "ChatGPT",
+            "evadb/functions/chatgpt_with_cache.py",
+            "chat-completion",
+            "",
+            metadata=[FunctionMetadataCatalogEntry("semantic_cache_path", "/tmp/a")],
+        )
+        self.assertEqual(get_semantic_cache_path(function_obj), Path("/tmp/a"))
+
+        # the implementation is not loaded to find the semantic cache
+        function_obj.metadata = []
+        self.assertIsNone(get_semantic_cache_path(function_obj))
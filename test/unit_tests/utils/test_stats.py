@@ -0,0 +1,55 @@
+# coding=utf-8
+# Copyright 2018-2023 EvaDB
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from evadb.utils.generic_utils import rebatch
+from evadb.utils.stats import AdaptiveBatchSizer, batch_size_limit
+
+
+class AdaptiveBatchSizerTests(unittest.TestCase):
+    def test_should_grow_while_the_throughput_improves(self):
+        sizer = AdaptiveBatchSizer(initial=4, minimum=1, maximum=32)
+        self.assertEqual(sizer.observe(4, 1.0), 8)
+        self.assertEqual(sizer.observe(8, 1.0), 16)
+        self.assertEqual(sizer.observe(16, 1.0), 32)
+        # capped by the maximum
+        self.assertEqual(sizer.observe(32, 1.0), 32)
+        self.assertEqual(sizer.throughput, 32)
+
+    def test_should_back_off_when_the_throughput_drops(self):
+        sizer = AdaptiveBatchSizer(initial=4, minimum=1, maximum=32)
+        sizer.observe(4, 1.0)
+        # 8 rows take 4 seconds, the throughput halves
+        self.assertEqual(sizer.observe(8, 4.0), 4)
+        self.assertEqual(sizer.observe(4, 2.0), 2)
+        self.assertEqual(sizer.observe(2, 1.0), 1)
+        self.assertEqual(sizer.observe(1, 0.5), 1)
+
+        # empty batches are ignored
+        self.assertEqual(sizer.observe(0, 1.0), 1)
+
+    def test_rebatch_should_follow_the_adaptive_size(self):
+        sizer = AdaptiveBatchSizer(initial=1, minimum=1, maximum=1 << 20)
+        self.assertEqual(batch_size_limit(sizer), 1)
+        self.assertEqual(batch_size_limit(100), 100)
+
+        row_sizes = []
+        for rows in rebatch(iter(range(100)), sizer):
+            row_sizes.append(len(rows))
+            sizer.observe(len(rows), 1.0)
+        self.assertEqual(sum(row_sizes), 100)
+        # the batches grow as the throughput keeps improving
+        self.assertEqual(row_sizes[0], 1)
+        self.assertGreater(row_sizes[-2], row_sizes[1])
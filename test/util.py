@@ -216,6 +216,22 @@ def get_mock_object(class_type, number_of_args):
             MagicMock(),
             MagicMock(),
         )
+    elif number_of_args == 14:
+        return class_type(
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        )
     else:
         raise Exception("Too many args")
 